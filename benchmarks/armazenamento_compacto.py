@@ -0,0 +1,57 @@
+# Benchmark - objetos com __dict__ vs colunas compactas
+# Execute com `python -m benchmarks.armazenamento_compacto`
+
+import timeit
+import tracemalloc
+
+from solid.ocp import Produto, ProdutoStore
+from solid.srp import Usuario, UsuarioStore
+
+
+def medir_memoria(criar):
+    tracemalloc.start()
+    registros = criar()
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return registros, memoria
+
+
+def main(quantidade=100_000):
+    produtos, memoria_objetos = medir_memoria(
+        lambda: [Produto(f"Produto {i}", i * 1.5) for i in range(quantidade)]
+    )
+
+    def criar_catalogo():
+        catalogo = ProdutoStore()
+        for i in range(quantidade):
+            catalogo.adicionar(f"Produto {i}", i * 1.5)
+        return catalogo
+
+    catalogo, memoria_store = medir_memoria(criar_catalogo)
+    print(f"Produto: {memoria_objetos / quantidade:.0f} bytes por registro")
+    print(f"ProdutoStore: {memoria_store / quantidade:.0f} bytes por registro")
+
+    tempo_objetos = timeit.timeit(lambda: sum(produto.preco for produto in produtos), number=1)
+    tempo_views = timeit.timeit(lambda: sum(produto.preco for produto in catalogo), number=1)
+    tempo_coluna = timeit.timeit(lambda: sum(catalogo.precos), number=1)
+    print(f"Iterando Produto: {quantidade / tempo_objetos:,.0f} registros/s")
+    print(f"Iterando ProdutoView: {quantidade / tempo_views:,.0f} registros/s")
+    print(f"Somando a coluna de preços: {quantidade / tempo_coluna:,.0f} registros/s")
+
+    _, memoria_objetos = medir_memoria(
+        lambda: [Usuario(f"Usuário {i}", f"usuario{i}@exemplo.com") for i in range(quantidade)]
+    )
+
+    def criar_usuarios():
+        usuarios = UsuarioStore()
+        for i in range(quantidade):
+            usuarios.adicionar(f"Usuário {i}", f"usuario{i}@exemplo.com")
+        return usuarios
+
+    _, memoria_store = medir_memoria(criar_usuarios)
+    print(f"Usuario: {memoria_objetos / quantidade:.0f} bytes por registro")
+    print(f"UsuarioStore: {memoria_store / quantidade:.0f} bytes por registro")
+
+
+if __name__ == "__main__":
+    main()
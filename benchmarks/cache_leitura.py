@@ -0,0 +1,67 @@
+# Benchmark - leitura direta no SQLite vs RepositorioComCache
+# Execute com `python -m benchmarks.cache_leitura`
+
+import random
+import threading
+import time
+
+from solid.dip import RepositorioComCache, RepositorioUsuariosSQL, SQLiteDatabase
+from solid.srp import Usuario
+
+
+class RepositorioLento(RepositorioUsuariosSQL):
+    # Simula um banco remoto, com latência por consulta
+    def buscar(self, email):
+        time.sleep(0.05)
+        return super().buscar(email)
+
+
+def main(quantidade=10_000, leituras=200_000, capacidade=2_000):
+    database = SQLiteDatabase()
+    database.conectar()
+    database.executar_query("CREATE TABLE usuarios (nome TEXT, email TEXT)")
+    database.executar_query("CREATE INDEX usuarios_email ON usuarios (email)")
+    repositorio = RepositorioUsuariosSQL(database)
+    for i in range(quantidade):
+        repositorio.salvar(Usuario(f"Usuário {i}", f"usuario{i}@exemplo.com"))
+
+    # Acessos concentrados em poucos usuários, com 5% de emails inexistentes
+    gerador = random.Random(42)
+    emails = [
+        f"usuario{int(gerador.paretovariate(1.2)) % quantidade}@exemplo.com"
+        if gerador.random() < 0.95 else f"ninguem{gerador.randrange(100)}@exemplo.com"
+        for _ in range(leituras)
+    ]
+
+    inicio = time.perf_counter()
+    for email in emails:
+        repositorio.buscar(email)
+    duracao = time.perf_counter() - inicio
+    print(f"Sem cache: {leituras / duracao:,.0f} leituras/s")
+
+    com_cache = RepositorioComCache(repositorio, capacidade=capacidade)
+    inicio = time.perf_counter()
+    for email in emails:
+        com_cache.buscar(email)
+    duracao = time.perf_counter() - inicio
+    metricas = com_cache.metricas()
+    print(f"Com cache: {leituras / duracao:,.0f} leituras/s")
+    print(f"Taxa de acerto: {metricas['taxa_acerto']:.1%} "
+          f"({metricas['acertos_negativos']} acertos negativos)")
+    print(f"Consultas ao banco: {metricas['buscas_repositorio']} de {leituras}")
+
+    # Muitas threads pedindo o mesmo email frio ao mesmo tempo
+    com_cache = RepositorioComCache(RepositorioLento(database))
+    threads = [
+        threading.Thread(target=com_cache.buscar, args=("usuario1@exemplo.com",)) for _ in range(32)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"32 leituras simultâneas de um email frio: "
+          f"{com_cache.metricas()['buscas_repositorio']} consulta(s) ao banco")
+
+
+if __name__ == "__main__":
+    main()
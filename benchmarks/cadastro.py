@@ -0,0 +1,89 @@
+# Benchmark - cadastro um a um vs PipelineCadastro, lendo CSV e JSONL
+# Execute com `python -m benchmarks.cadastro`
+
+import csv
+import itertools
+import json
+import os
+import resource
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from solid.cadastro import PipelineCadastro, ler_usuarios
+from solid.srp import RepositorioUsuario, ServicoEmail, ValidadorEmail
+
+
+class ServicoEmailLento:
+    # Simula um provedor de email lento, para ver a leitura esperar pelas filas
+    @staticmethod
+    def enviar_boas_vindas(usuario):
+        time.sleep(0.001)
+
+
+def gerar_arquivos(diretorio, quantidade):
+    # Gravados linha a linha, sem montar a lista inteira em memória; 5% dos emails são inválidos
+    caminho_csv = os.path.join(diretorio, "usuarios.csv")
+    caminho_jsonl = os.path.join(diretorio, "usuarios.jsonl")
+    with open(caminho_csv, "w", newline="", encoding="utf-8") as arquivo_csv, \
+            open(caminho_jsonl, "w", encoding="utf-8") as arquivo_jsonl:
+        escritor = csv.writer(arquivo_csv)
+        escritor.writerow(["nome", "email"])
+        for i in range(quantidade):
+            nome = f"Usuário {i}"
+            email = f"usuario{i}@empresa{i % 100}.com.br" if i % 20 else f"usuario{i}-sem-arroba"
+            escritor.writerow([nome, email])
+            arquivo_jsonl.write(json.dumps({"nome": nome, "email": email}, ensure_ascii=False) + "\n")
+    return caminho_csv, caminho_jsonl
+
+
+def memoria_maxima_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(quantidade=1_000_000):
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_csv, caminho_jsonl = gerar_arquivos(diretorio, quantidade)
+        print(f"{quantidade:,} linhas geradas; memória máxima até aqui: {memoria_maxima_mb():.0f} MB")
+
+        # A saída dos prints de RepositorioUsuario e ServicoEmail é descartada
+        with open(os.devnull, "w") as nulo, redirect_stdout(nulo):
+            inicio = time.perf_counter()
+            # Mesma regra de validação do pipeline, aplicada a um email por vez
+            casar = ValidadorEmail.PADRAO_EMAIL.fullmatch
+            for usuario in ler_usuarios(caminho_csv):
+                if casar(usuario.email):
+                    RepositorioUsuario.salvar(usuario)
+                    ServicoEmail.enviar_boas_vindas(usuario)
+            sequencial = time.perf_counter() - inicio
+
+            pipeline = PipelineCadastro(tamanho_lote=5_000)
+            metricas_csv = pipeline.executar(caminho_csv)
+            metricas_jsonl = pipeline.executar(caminho_jsonl)
+
+        print(f"Um usuário por vez (CSV): {quantidade / sequencial:,.0f} usuários/s")
+        for formato, metricas in (("CSV", metricas_csv), ("JSONL", metricas_jsonl)):
+            print(f"PipelineCadastro ({formato}): {metricas['usuarios_por_segundo']:,.0f} usuários/s, "
+                  f"{metricas['validos']:,} válidos, {metricas['invalidos']:,} inválidos, "
+                  f"{metricas['emails']:,} emails")
+        print(f"Memória máxima do processo: {memoria_maxima_mb():.0f} MB")
+
+        # Com o email lento, o pipeline sobrepõe os envios e a leitura espera pelas filas
+        lentos = 5_000
+        inicio = time.perf_counter()
+        with open(os.devnull, "w") as nulo, redirect_stdout(nulo):
+            for usuario in itertools.islice(ler_usuarios(caminho_jsonl), lentos):
+                if casar(usuario.email):
+                    RepositorioUsuario.salvar(usuario)
+                    ServicoEmailLento.enviar_boas_vindas(usuario)
+            sequencial = time.perf_counter() - inicio
+            pipeline = PipelineCadastro(
+                servico_email=ServicoEmailLento, tamanho_lote=100, capacidade_fila=2, trabalhadores_email=4
+            )
+            metricas = pipeline.executar(itertools.islice(ler_usuarios(caminho_jsonl), lentos))
+        print(f"Email lento, um usuário por vez: {lentos / sequencial:,.0f} usuários/s")
+        print(f"Email lento, PipelineCadastro: {metricas['usuarios_por_segundo']:,.0f} usuários/s, "
+              f"leitura bloqueada {metricas['leitura_bloqueada']:.1f}s de {metricas['duracao']:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# Benchmark - query montada com f-string vs comando preparado no SQLite
+# Execute com `python -m benchmarks.comandos_preparados`
+
+import time
+
+from solid.dip import SQLiteDatabase
+from solid.srp import Usuario
+
+
+def main(quantidade=50_000):
+    usuarios = [Usuario(f"Usuário {i}", f"usuario{i}@exemplo.com") for i in range(quantidade)]
+
+    database = SQLiteDatabase()
+    database.conectar()
+    database.executar_query("CREATE TABLE usuarios (nome TEXT, email TEXT)")
+
+    # Caminho antigo: um SQL diferente por usuário, analisado do zero a cada vez
+    inicio = time.perf_counter()
+    for usuario in usuarios:
+        database.executar_query(f"INSERT INTO usuarios VALUES ('{usuario.nome}', '{usuario.email}')")
+    duracao = time.perf_counter() - inicio
+    print(f"f-string: {quantidade / duracao:,.0f} linhas/s")
+
+    # Mesmo SQL a cada vez: o sqlite3 compila uma vez e reaproveita o comando (cached_statements)
+    inicio = time.perf_counter()
+    for usuario in usuarios:
+        comando = database.preparar("INSERT INTO usuarios VALUES (?, ?)")
+        database.executar(comando, (usuario.nome, usuario.email))
+    duracao = time.perf_counter() - inicio
+    print(f"Comando preparado: {quantidade / duracao:,.0f} linhas/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Benchmark - um ContextoNotificacao por requisição vs um ContextoNotificacaoConcorrente compartilhado
+# Execute com `python -m benchmarks.contexto_concorrente`
+
+import sys
+import threading
+import time
+
+from solid.notificacoes import ContextoNotificacao, ContextoNotificacaoConcorrente, EstrategiaNotificacao
+
+
+class EstrategiaConferida(EstrategiaNotificacao):
+    # Não envia nada; só conta as mensagens que chegaram pelo canal errado
+    def __init__(self, canal, erradas):
+        self.canal = canal
+        self.erradas = erradas
+
+    def notificar(self, mensagem, destinatario):
+        if destinatario != self.canal:
+            self.erradas.append(destinatario)
+
+
+def rodar(threads, requisicoes, atender):
+    # Cada thread atende requisições alternando entre dois canais, todas começando juntas
+    largada = threading.Barrier(threads + 1)
+
+    def trabalhar(indice):
+        largada.wait()
+        for requisicao in range(requisicoes):
+            atender((indice + requisicao) % 2)
+
+    trabalhadores = [threading.Thread(target=trabalhar, args=(i,)) for i in range(threads)]
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+    largada.wait()
+    inicio = time.perf_counter()
+    for trabalhador in trabalhadores:
+        trabalhador.join()
+    return threads * requisicoes / (time.perf_counter() - inicio)
+
+
+def main(threads=8, requisicoes=50_000, mensagens_por_requisicao=3):
+    # Trocas de thread frequentes, para que as corridas apareçam em poucos segundos
+    sys.setswitchinterval(1e-5)
+    erradas = []
+    estrategias = [EstrategiaConferida(canal, erradas) for canal in ("email", "sms")]
+    canais = [estrategia.canal for estrategia in estrategias]
+
+    def por_requisicao(canal):
+        contexto = ContextoNotificacao(estrategias[canal])
+        for _ in range(mensagens_por_requisicao):
+            contexto.enviar_notificacao("Seu pedido foi confirmado!", canais[canal])
+
+    compartilhado = ContextoNotificacao()
+
+    def compartilhado_ingenuo(canal):
+        compartilhado.definir_estrategia(estrategias[canal])
+        for _ in range(mensagens_por_requisicao):
+            compartilhado.enviar_notificacao("Seu pedido foi confirmado!", canais[canal])
+
+    concorrente = ContextoNotificacaoConcorrente(estrategias[0])
+
+    def por_chamada(canal):
+        for _ in range(mensagens_por_requisicao):
+            concorrente.enviar_notificacao("Seu pedido foi confirmado!", canais[canal], estrategias[canal])
+
+    def por_contexto(canal):
+        with concorrente.usando(estrategias[canal]):
+            for _ in range(mensagens_por_requisicao):
+                concorrente.enviar_notificacao("Seu pedido foi confirmado!", canais[canal])
+
+    variantes = {
+        "Um ContextoNotificacao por requisição": por_requisicao,
+        "ContextoNotificacao compartilhado (definir_estrategia)": compartilhado_ingenuo,
+        "Concorrente, estratégia por chamada": por_chamada,
+        "Concorrente, estratégia por contexto (usando)": por_contexto,
+    }
+    for nome, atender in variantes.items():
+        erradas.clear()
+        taxa = rodar(threads, requisicoes, atender)
+        print(f"{nome}: {taxa:,.0f} requisições/s, {len(erradas):,} mensagens no canal errado")
+
+
+if __name__ == "__main__":
+    main()
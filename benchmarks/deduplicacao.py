@@ -0,0 +1,79 @@
+# Benchmark - memória por chave e custo de consulta do IndiceDeduplicacao com 10 milhões de chaves
+# Execute com `python -m benchmarks.deduplicacao`
+
+import gc
+import os
+import random
+import time
+import timeit
+
+from solid.deduplicacao import AgrupadorResumos, IndiceDeduplicacao, chave_conteudo
+
+
+def memoria_residente():
+    # Linux: segunda coluna de /proc/self/statm, em páginas
+    with open("/proc/self/statm") as arquivo:
+        return int(arquivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def chaves(semente, quantidade):
+    sortear = random.Random(semente).getrandbits
+    return (sortear(60) for _ in range(quantidade))
+
+
+def medir_indice(nome, quantidade, consultas, **opcoes):
+    gc.collect()
+    antes = memoria_residente()
+    indice = IndiceDeduplicacao(janela=10**9, capacidade=quantidade, **opcoes)
+    registrar = indice.registrar
+    inicio = time.perf_counter()
+    for chave in chaves(1, quantidade):
+        registrar(chave, 0.0)
+    insercao = time.perf_counter() - inicio
+    memoria = memoria_residente() - antes
+
+    # Consultas às chaves mais antigas (já em gerações fechadas) e a chaves nunca vistas
+    contem = indice.contem
+    presentes = list(chaves(1, consultas))
+    ausentes = list(chaves(2, consultas))
+    tempo_presentes = timeit.timeit(lambda: [contem(chave, 0.0) for chave in presentes], number=1)
+    encontrados_ausentes = sum(contem(chave, 0.0) for chave in ausentes)
+    tempo_ausentes = timeit.timeit(lambda: [contem(chave, 0.0) for chave in ausentes], number=1)
+    print(f"{nome}: {memoria / quantidade:.1f} B/chave, inserção {insercao / quantidade * 1e9:.0f} ns, "
+          f"consulta presente {tempo_presentes / consultas * 1e9:.0f} ns, "
+          f"ausente {tempo_ausentes / consultas * 1e9:.0f} ns, "
+          f"falsos positivos {encontrados_ausentes / consultas:.3%}")
+    del indice
+
+
+def main(quantidade=10_000_000, consultas=200_000):
+    # Referência: gerar as chaves aleatórias sem guardar nada
+    inicio = time.perf_counter()
+    for _ in chaves(1, quantidade):
+        pass
+    geracao = time.perf_counter() - inicio
+    print(f"Sorteio de {quantidade:,} chaves: {geracao / quantidade * 1e9:.0f} ns/chave (incluído na inserção)")
+
+    mensagens = [("email", f"cliente{i}@exemplo.com", "Seu pedido foi confirmado!") for i in range(consultas)]
+    tempo = timeit.timeit(lambda: [chave_conteudo(*mensagem) for mensagem in mensagens], number=1)
+    print(f"chave_conteudo (blake2b de 8 bytes): {tempo / consultas * 1e9:.0f} ns/mensagem")
+
+    medir_indice("Conjuntos exatos", quantidade, consultas)
+    medir_indice("Bloom nas gerações fechadas", quantidade, consultas, bloom=True)
+
+    # 10 mensagens para cada um de 1.000 destinatários viram 1.000 resumos
+    class Contador:
+        envios = 0
+
+        def enviar_notificacao(self, tipo, mensagem, destinatario):
+            self.envios += 1
+
+    gerenciador = Contador()
+    with AgrupadorResumos(gerenciador) as agrupador:
+        for i in range(10_000):
+            agrupador.adicionar("email", f"Atualização {i // 1_000}", f"cliente{i % 1_000}@exemplo.com")
+    print(f"Agrupamento: {agrupador.metricas()['recebidas']:,} mensagens em {gerenciador.envios:,} envios")
+
+
+if __name__ == "__main__":
+    main()
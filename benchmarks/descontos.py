@@ -0,0 +1,54 @@
+# Benchmark - cálculo de descontos por objeto, em colunas e pelo registro de tipos
+# Execute com `python -m benchmarks.descontos`
+
+import random
+import timeit
+from array import array
+
+from solid.ocp import (
+    CalculadoraDescontos,
+    ClienteFidelidade,
+    ClientePremium,
+    ClienteRegular,
+    ClienteVIP,
+    Produto,
+)
+
+
+def main(quantidade=200_000):
+    calculadora = CalculadoraDescontos()
+    codigos, taxas = CalculadoraDescontos.tabela_taxas()
+    tipos_cliente = [ClienteRegular, ClientePremium, ClienteVIP, ClienteFidelidade]
+    produtos = [Produto(f"Produto {i}", random.uniform(1, 5000)) for i in range(quantidade)]
+    clientes = [random.choice(tipos_cliente)() for _ in produtos]
+    precos = array("d", (produto.preco for produto in produtos))
+    codigos_clientes = array("B", (codigos[type(cliente).__name__] for cliente in clientes))
+
+    por_objeto = [calculadora.calcular_desconto(p, c) for p, c in zip(produtos, clientes)]
+    em_colunas = calculadora.calcular_descontos(precos, codigos_clientes, taxas)
+    assert list(em_colunas) == por_objeto
+
+    print("calcular_desconto por objeto vs calcular_descontos em colunas:")
+    tempo_objeto = timeit.timeit(
+        lambda: [calculadora.calcular_desconto(p, c) for p, c in zip(produtos, clientes)], number=1
+    )
+    tempo_colunas = timeit.timeit(
+        lambda: calculadora.calcular_descontos(precos, codigos_clientes, taxas), number=1
+    )
+    print(f"Por objeto: {len(produtos) / tempo_objeto:,.0f} pares/s")
+    print(f"Em colunas: {len(produtos) / tempo_colunas:,.0f} pares/s")
+
+    print("Cliente criado por requisição vs registro de tipos:")
+    tempo_objetos = timeit.timeit(
+        lambda: [calculadora.calcular_desconto(produto, ClientePremium()) for produto in produtos], number=1
+    )
+    tempo_registro = timeit.timeit(
+        lambda: [calculadora.calcular_desconto_por_tipo(produto.preco, "ClientePremium") for produto in produtos],
+        number=1,
+    )
+    print(f"Cliente por requisição: {len(produtos) / tempo_objetos:,.0f} cálculos/s")
+    print(f"Registro de tipos: {len(produtos) / tempo_registro:,.0f} cálculos/s")
+
+
+if __name__ == "__main__":
+    main()
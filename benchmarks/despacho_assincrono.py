@@ -0,0 +1,46 @@
+# Benchmark - envio sequencial vs despachante assíncrono
+# Execute com `python -m benchmarks.despacho_assincrono`
+
+import asyncio
+import time
+
+from solid.notificacoes import (
+    DespachanteNotificacoes,
+    GerenciadorNotificacoes,
+    Notificador,
+    NotificadorAssincrono,
+)
+
+
+class NotificadorLento(Notificador):
+    def enviar(self, mensagem, destinatario):
+        time.sleep(0.005)
+
+class NotificadorAssincronoLento(NotificadorAssincrono):
+    async def enviar(self, mensagem, destinatario):
+        await asyncio.sleep(0.005)
+
+
+def main(quantidade=100):
+    gerenciador = GerenciadorNotificacoes()
+    gerenciador.registrar_notificador("email", NotificadorLento())
+    gerenciador.registrar_notificador("sms", NotificadorLento())
+    gerenciador.registrar_notificador("push", NotificadorAssincronoLento())
+    jobs = [(tipo, "Promoção!", f"destinatario{i}") for i in range(quantidade) for tipo in ("email", "sms")]
+
+    inicio = time.perf_counter()
+    for tipo, mensagem, destinatario in jobs:
+        gerenciador.enviar_notificacao(tipo, mensagem, destinatario)
+    duracao = time.perf_counter() - inicio
+    print(f"Sequencial: {len(jobs) / duracao:,.0f} mensagens/s ({duracao * 1000 / len(jobs):.2f} ms por mensagem)")
+
+    jobs.extend(("push", "Promoção!", f"destinatario{i}") for i in range(quantidade))
+    despachante = DespachanteNotificacoes(gerenciador, limite_padrao=16)
+    inicio = time.perf_counter()
+    despachante.enviar_lote(jobs)
+    duracao = time.perf_counter() - inicio
+    print(f"Despachante: {len(jobs) / duracao:,.0f} mensagens/s ({duracao * 1000 / len(jobs):.2f} ms por mensagem)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Benchmark - busca de trabalhadores por isinstance vs RegistroTrabalhadores e o EscalonadorTarefas
+# Execute com `python -m benchmarks.escalonador`
+
+import time
+
+from solid.isp import Comedor, EscalonadorTarefas, Humano, RegistroTrabalhadores, Robo
+
+
+class HumanoSimulado(Humano):
+    # Cada tarefa espera 1 ms, como uma chamada de E/S
+    def trabalhar(self):
+        time.sleep(0.001)
+
+    def comer(self):
+        time.sleep(0.001)
+
+    def dormir(self):
+        time.sleep(0.001)
+
+class RoboSimulado(Robo):
+    def trabalhar(self):
+        time.sleep(0.001)
+
+
+def main(trabalhadores=100_000, consultas=100, tarefas=2_000):
+    forca = [HumanoSimulado() if i % 3 else RoboSimulado() for i in range(trabalhadores)]
+
+    inicio = time.perf_counter()
+    registro = RegistroTrabalhadores()
+    for trabalhador in forca:
+        registro.registrar(trabalhador)
+    print(f"Registro de {trabalhadores:,} trabalhadores: {time.perf_counter() - inicio:.2f}s")
+
+    inicio = time.perf_counter()
+    for _ in range(consultas):
+        comedores = [trabalhador for trabalhador in forca if isinstance(trabalhador, Comedor)]
+    varredura = (time.perf_counter() - inicio) / consultas
+    inicio = time.perf_counter()
+    for _ in range(consultas * 1000):
+        comedores = registro.capazes("comer")
+    indice = (time.perf_counter() - inicio) / (consultas * 1000)
+    print(f"Quem pode comer ({len(comedores):,}): isinstance {varredura * 1e3:.2f} ms, "
+          f"índice {indice * 1e9:.0f} ns")
+
+    lote = ["trabalhar", "trabalhar", "comer", "dormir"] * (tarefas // 4)
+    for threads in (1, 4, 16):
+        metricas = EscalonadorTarefas(registro, threads=threads).executar(lote)
+        print(f"{threads:>2} threads: {metricas['tarefas_por_segundo']:,.0f} tarefas/s, "
+              f"utilização {metricas['utilizacao_threads']:.0%}, "
+              f"{metricas['trabalhadores_usados']:,} trabalhadores usados, {metricas['erros']} erros")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# Benchmark - area() por objeto vs FormaBatch
+# Execute com `python -m benchmarks.formas`
+
+import random
+import timeit
+
+from solid.lsp import FormaBatch, Quadrado, Retangulo
+
+
+def main(quantidade=200_000, repeticoes=7):
+    formas = [
+        Retangulo(random.uniform(1, 100), random.uniform(1, 100)) if random.random() < 0.5
+        else Quadrado(random.uniform(1, 100))
+        for _ in range(quantidade)
+    ]
+    lote = FormaBatch(formas)
+    assert lote.areas() == [forma.area() for forma in formas]
+    lote.areas()
+
+    # Melhor de várias repetições, intercaladas para que sofram o mesmo ruído da máquina
+    rodadas = {
+        "area() por objeto": lambda: [forma.area() for forma in formas],
+        "FormaBatch.areas": lote.areas,
+        "FormaBatch.areas_por_tipo": lote.areas_por_tipo,
+        "FormaBatch.area_total": lote.area_total,
+    }
+    tempos = {nome: float("inf") for nome in rodadas}
+    for _ in range(repeticoes):
+        for nome, rodada in rodadas.items():
+            tempos[nome] = min(tempos[nome], timeit.timeit(rodada, number=1))
+    referencia = tempos["area() por objeto"]
+    for nome, tempo in tempos.items():
+        print(f"{nome}: {len(formas) / tempo:,.0f} formas/s ({referencia / tempo:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Benchmark - vazão do ServicoUsuario sobre 1 a N fragmentos SQLite em arquivo
+# Execute com `python -m benchmarks.fragmentacao`
+
+import os
+import tempfile
+import threading
+import time
+
+from solid.dip import RepositorioUsuariosSQL, ServicoUsuario, SQLiteDatabase
+from solid.fragmentacao import DatabaseFragmentada
+from solid.srp import Usuario
+
+
+def criar_fragmento(diretorio, nome):
+    database = SQLiteDatabase(os.path.join(diretorio, f"{nome}.db"))
+    database.conectar()
+    database.executar_query("CREATE TABLE usuarios (nome TEXT, email TEXT)")
+    database.executar_query("CREATE INDEX usuarios_email ON usuarios (email)")
+    return database
+
+
+def em_threads(threads, trabalho, itens):
+    fatias = [itens[i::threads] for i in range(threads)]
+    execucoes = [threading.Thread(target=trabalho, args=(fatia,)) for fatia in fatias]
+    inicio = time.perf_counter()
+    for execucao in execucoes:
+        execucao.start()
+    for execucao in execucoes:
+        execucao.join()
+    return time.perf_counter() - inicio
+
+
+def medir(fragmentos, usuarios, threads):
+    with tempfile.TemporaryDirectory() as diretorio:
+        with DatabaseFragmentada(
+            {f"fragmento{i}": criar_fragmento(diretorio, f"fragmento{i}") for i in range(fragmentos)}
+        ) as database:
+            servico = ServicoUsuario(database)
+            metade = len(usuarios) // 2
+
+            # Lotes de 500: cada lote é dividido entre os fragmentos, gravados em paralelo
+            # antes de salvar_lote retornar
+            quarto = metade // 2
+            lote = servico.salvar_lote(usuarios[:quarto], tamanho_lote=500)["linhas_por_segundo"]
+
+            # Escritor opcional: blocos de 5.000 linhas por fragmento, um commit por bloco
+            inicio = time.perf_counter()
+            with database.escritor("INSERT INTO usuarios VALUES (?, ?)") as escritor:
+                for i in range(quarto, metade, 500):
+                    escritor.adicionar([valor for usuario in usuarios[i:i + 500] for valor in (usuario.nome, usuario.email)])
+            escrita = (metade - quarto) / (time.perf_counter() - inicio)
+
+            # Uma linha por INSERT, de várias threads: fragmentos diferentes não disputam a mesma conexão
+            individual = (len(usuarios) - metade) / em_threads(threads, lambda fatia: [
+                servico.salvar_usuario(usuario) for usuario in fatia
+            ], usuarios[metade:])
+
+            repositorio = RepositorioUsuariosSQL(database)
+            emails = [usuario.email for usuario in usuarios[::10]]
+            leituras = len(emails) / em_threads(threads, lambda fatia: [
+                repositorio.buscar(email) for email in fatia
+            ], emails)
+
+            inicio = time.perf_counter()
+            total = sum(linha[0] for linha in database.executar_query("SELECT COUNT(*) FROM usuarios"))
+            espalhada = time.perf_counter() - inicio
+            assert total == len(usuarios)
+    return lote, escrita, individual, leituras, espalhada
+
+
+def medir_rebalanceamento(fragmentos, usuarios):
+    with tempfile.TemporaryDirectory() as diretorio:
+        with DatabaseFragmentada(
+            {f"fragmento{i}": criar_fragmento(diretorio, f"fragmento{i}") for i in range(fragmentos)}
+        ) as database:
+            ServicoUsuario(database).salvar_lote(usuarios)
+            database.adicionar_fragmento("novo", criar_fragmento(diretorio, "novo"))
+            inicio = time.perf_counter()
+            movidas = database.rebalancear("usuarios")
+            duracao = time.perf_counter() - inicio
+    print(f"Rebalanceamento de {fragmentos} para {fragmentos + 1} fragmentos: {movidas:,} de "
+          f"{len(usuarios):,} linhas movidas ({movidas / len(usuarios):.1%}, ideal {1 / (fragmentos + 1):.1%}) "
+          f"em {duracao:.2f} s")
+
+
+def main(quantidade=20_000, threads=8, fragmentos=(1, 2, 4, 8)):
+    usuarios = [Usuario(f"Usuário {i}", f"usuario{i}@exemplo.com") for i in range(quantidade)]
+    referencia = None
+    for quantidade_fragmentos in fragmentos:
+        lote, escrita, individual, leituras, espalhada = medir(quantidade_fragmentos, usuarios, threads)
+        referencia = referencia or (lote, escrita, individual, leituras)
+        print(f"{quantidade_fragmentos} fragmento(s): "
+              f"lotes {lote:,.0f} linhas/s ({lote / referencia[0]:.2f}x), "
+              f"escritor {escrita:,.0f} linhas/s ({escrita / referencia[1]:.2f}x), "
+              f"individuais {individual:,.0f} linhas/s ({individual / referencia[2]:.2f}x), "
+              f"leituras {leituras:,.0f}/s ({leituras / referencia[3]:.2f}x), "
+              f"COUNT espalhado {espalhada * 1000:.1f} ms")
+    medir_rebalanceamento(4, usuarios)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Benchmark - tempo de importação a frio de cada submódulo
+# Execute com `python -m benchmarks.importacao`; termina com erro se algum limite for ultrapassado
+
+import re
+import statistics
+import subprocess
+import sys
+
+# Limites em milissegundos para o tempo acumulado de importação (inclui a biblioteca padrão).
+# asyncio e multiprocessing são carregados só quando usados, então não entram na conta;
+# concurrent.futures (cerca de 15 ms) é importado no topo dos módulos de notificação e entra.
+LIMITES_MS = {
+    "solid": 10,
+    "solid.srp": 40,
+    "solid.ocp": 25,
+    "solid.lsp": 25,
+    "solid.isp": 15,
+    "solid.dip": 40,
+    "solid.fragmentacao": 60,
+    "solid.cadastro": 40,
+    "solid.notificacoes": 60,
+    "solid.outbox": 40,
+    "solid.processos": 60,
+    "solid.resiliencia": 60,
+    "solid.deduplicacao": 40,
+    "solid.modelos": 60,
+    "solid.relatorios": 40,
+    "solid.instrumentacao": 25,
+    "solid.ruins": 10,
+}
+
+
+def medir_importacao(modulo):
+    # Processo novo a cada medição, para que nada já esteja em sys.modules
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        capture_output=True, text=True, check=True,
+    )
+    if processo.stdout:
+        raise AssertionError(f"Importar {modulo} não deveria escrever nada: {processo.stdout!r}")
+    padrao = re.compile(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(modulo)}$", re.MULTILINE)
+    return int(padrao.search(processo.stderr).group(1)) / 1000
+
+
+def main(repeticoes=5):
+    regressoes = []
+    for modulo, limite in LIMITES_MS.items():
+        tempo = statistics.median(medir_importacao(modulo) for _ in range(repeticoes))
+        situacao = "ok" if tempo <= limite else "REGRESSÃO"
+        print(f"{modulo}: {tempo:.1f} ms (limite {limite} ms) {situacao}")
+        if tempo > limite:
+            regressoes.append(modulo)
+    if regressoes:
+        sys.exit(f"Importação mais lenta que o limite: {', '.join(regressoes)}")
+
+
+if __name__ == "__main__":
+    main()
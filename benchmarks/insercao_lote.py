@@ -0,0 +1,29 @@
+# Benchmark - salvar_usuario vs salvar_lote no SQLite
+# Execute com `python -m benchmarks.insercao_lote`
+
+import time
+
+from solid.dip import PoolConexoes, ServicoUsuario, SQLiteDatabase
+from solid.srp import Usuario
+
+
+def main(quantidade=20_000):
+    usuarios = [Usuario(f"Usuário {i}", f"usuario{i}@exemplo.com") for i in range(quantidade)]
+    caminho = "file:benchmark_usuarios?mode=memory&cache=shared"
+    pool = PoolConexoes(lambda: SQLiteDatabase(caminho), tamanho=4)
+    servico = ServicoUsuario(SQLiteDatabase(caminho), pool=pool)
+    servico.db.conectar()
+    servico.db.executar_query("CREATE TABLE usuarios (nome TEXT, email TEXT)")
+
+    inicio = time.perf_counter()
+    for usuario in usuarios:
+        servico.salvar_usuario(usuario)
+    duracao = time.perf_counter() - inicio
+    print(f"salvar_usuario: {len(usuarios) / duracao:,.0f} linhas/s")
+
+    metricas = servico.salvar_lote(usuarios, tamanho_lote=500)
+    print(f"salvar_lote: {metricas['linhas_por_segundo']:,.0f} linhas/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# Benchmark - custo da instrumentação desligada e ligada no cálculo de descontos
+# Execute com `python -m benchmarks.instrumentacao`
+
+import timeit
+
+from solid import instrumentacao
+from solid.ocp import CalculadoraDescontos, ClientePremium, Produto
+
+
+def medir(quantidade, repeticoes):
+    calculadora = CalculadoraDescontos()
+    produto = Produto("Notebook", 1000)
+    cliente = ClientePremium()
+    tempo = min(timeit.repeat(
+        lambda: calculadora.calcular_desconto(produto, cliente), number=quantidade, repeat=repeticoes
+    ))
+    return tempo / quantidade * 1e9
+
+
+def main(quantidade=200_000, repeticoes=7):
+    original = CalculadoraDescontos.__dict__["calcular_desconto"]
+    medir(quantidade, 1)  # aquecimento
+    antes = medir(quantidade, repeticoes)
+    print(f"Sem instrumentação: {antes:.0f} ns/chamada")
+
+    registro = instrumentacao.instrumentar()
+    ligada = medir(quantidade, repeticoes)
+    instrumentacao.desinstrumentar()
+    print(f"Instrumentação ligada: {ligada:.0f} ns/chamada")
+
+    depois = medir(quantidade, repeticoes)
+    print(f"Instrumentação desligada: {depois:.0f} ns/chamada ({(depois - antes) / antes:+.1%})")
+    # Desligada, a classe volta a ter exatamente a mesma função: a diferença acima é só ruído
+    print(f"Método original restaurado: {CalculadoraDescontos.__dict__['calcular_desconto'] is original}")
+
+    print()
+    print(registro.exportar_prometheus(), end="")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# Benchmark - taxa admitida vs taxa configurada
+# Execute com `python -m benchmarks.limite_taxa`
+
+import time
+
+from solid.notificacoes import AgendadorNotificacoes, EstrategiaNotificacao
+
+
+class NotificacaoSilenciosa(EstrategiaNotificacao):
+    def notificar(self, mensagem, destinatario):
+        pass
+
+
+def main(taxa_configurada=1000, quantidade=500):
+    agendador = AgendadorNotificacoes(limites={NotificacaoSilenciosa: taxa_configurada})
+    estrategia = NotificacaoSilenciosa()
+    # Esvazia o balde antes de medir para não contar a rajada inicial
+    for futuro in [agendador.agendar(estrategia, "aquecimento", "@bench") for _ in range(taxa_configurada)]:
+        futuro.result()
+    inicio = time.perf_counter()
+    futuros = [agendador.agendar(estrategia, "Promoção!", f"@usuario{i}") for i in range(quantidade)]
+    for futuro in futuros:
+        futuro.result()
+    duracao = time.perf_counter() - inicio
+    agendador.fechar()
+    print(f"Configurada: {taxa_configurada} mensagens/s, admitida: {len(futuros) / duracao:,.0f} mensagens/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Benchmark - f-string por destinatário vs modelo compilado renderizado em lote, com 1 milhão de destinatários
+# Execute com `python -m benchmarks.modelos`
+
+import gc
+import time
+import timeit
+import tracemalloc
+
+from solid.modelos import CatalogoModelos, ModeloCompilado, NotificadorModelos
+from solid.notificacoes import Notificador
+
+MODELO = "Olá {nome}, seu pedido {pedido} de R$ {valor:.2f} foi confirmado!"
+
+
+class NotificadorSilencioso(Notificador):
+    def enviar(self, mensagem, destinatario):
+        pass
+
+
+def por_destinatario(lote):
+    # Como os chamadores fazem hoje: o texto é montado em Python para cada destinatário
+    return [
+        f"Olá {variaveis['nome']}, seu pedido {variaveis['pedido']} de R$ {variaveis['valor']:.2f} foi confirmado!"
+        for variaveis in lote
+    ]
+
+
+def medir(rodadas, repeticoes):
+    # Variantes intercaladas a cada repetição, para que sofram o mesmo ruído da máquina
+    tempos = {nome: float("inf") for nome in rodadas}
+    gc.disable()
+    try:
+        for _ in range(repeticoes):
+            for nome, rodada in rodadas.items():
+                tempos[nome] = min(tempos[nome], timeit.timeit(rodada, number=1))
+    finally:
+        gc.enable()
+    return tempos
+
+
+def pico_memoria(executar):
+    tracemalloc.start()
+    executar()
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return pico
+
+
+def main(destinatarios=1_000_000, repeticoes=3):
+    # Compilado antes de criar os lotes, para não medir junto uma coleta do gc sobre eles
+    inicio = time.perf_counter()
+    modelo = ModeloCompilado(MODELO)
+    print(f"Compilação do modelo: {(time.perf_counter() - inicio) * 1e6:.0f} µs")
+
+    lote = [{"nome": f"Cliente {i}", "pedido": i, "valor": i * 1.5} for i in range(destinatarios)]
+    tuplas = [(variaveis["nome"], variaveis["pedido"], variaveis["valor"]) for variaveis in lote]
+    emails = [f"cliente{i}@exemplo.com" for i in range(destinatarios)]
+    assert modelo.renderizar_lote(lote[:100]) == por_destinatario(lote[:100])
+    # Chaves escapadas viram chaves literais, com ou sem campos no modelo
+    assert ModeloCompilado("Use {{codigo}} agora").renderizar({}) == "Use {codigo} agora"
+    assert ModeloCompilado("Use {{codigo}} {n}").renderizar({"n": 1}) == "Use {codigo} 1"
+
+    catalogo = CatalogoModelos()
+    catalogo.registrar("pedido", MODELO)
+    tempo = timeit.timeit(lambda: catalogo.obter("pedido"), number=100_000)
+    print(f"Consulta ao catálogo: {tempo / 100_000 * 1e9:.0f} ns")
+
+    tempos = medir({
+        "f-string por destinatário": lambda: por_destinatario(lote),
+        "str.format_map por destinatário": lambda: [MODELO.format_map(variaveis) for variaveis in lote],
+        "compilado em lote (dicionários)": lambda: modelo.renderizar_lote(lote),
+        "compilado em lote (tuplas)": lambda: modelo.renderizar_tuplas(tuplas),
+    }, repeticoes)
+    referencia = tempos["f-string por destinatário"]
+    for nome, tempo in tempos.items():
+        print(f"{nome}: {tempo / destinatarios * 1e9:.0f} ns/mensagem ({referencia / tempo:.2f}x)")
+
+    # Envio completo: tudo renderizado de uma vez vs em blocos pelo NotificadorModelos
+    silencioso = NotificadorSilencioso()
+    notificador = NotificadorModelos(silencioso, catalogo)
+
+    def tudo_de_uma_vez():
+        for mensagem, email in zip(por_destinatario(lote), emails):
+            silencioso.enviar(mensagem, email)
+
+    def em_blocos():
+        notificador.enviar_modelo_lote("pedido", lote, emails)
+
+    tempos = medir({"tudo de uma vez": tudo_de_uma_vez, "em blocos": em_blocos}, repeticoes)
+    for nome, executar in (("tudo de uma vez", tudo_de_uma_vez), ("em blocos", em_blocos)):
+        print(f"Envio {nome}: {tempos[nome] / destinatarios * 1e9:.0f} ns/mensagem, "
+              f"pico {pico_memoria(executar) / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
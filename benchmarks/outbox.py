@@ -0,0 +1,62 @@
+# Benchmark - latência de enfileiramento e vazão sustentada da outbox
+# Execute com `python -m benchmarks.outbox`
+
+import os
+import statistics
+import tempfile
+import time
+
+from solid.notificacoes import Notificador
+from solid.outbox import ConsumidorOutbox, Outbox
+
+
+class NotificadorVazio(Notificador):
+    def enviar(self, mensagem, destinatario):
+        pass
+
+
+def percentil(valores, p):
+    return statistics.quantiles(valores, n=100)[p - 1]
+
+
+def main(quantidade=50_000, trabalhadores=4):
+    with tempfile.TemporaryDirectory() as diretorio:
+        caixa = Outbox(diretorio)
+        latencias = []
+        for i in range(quantidade):
+            inicio = time.perf_counter()
+            caixa.enfileirar("Promoção!", f"cliente{i}@exemplo.com")
+            latencias.append((time.perf_counter() - inicio) * 1_000_000)
+        print(f"Enfileirar: p50 {percentil(latencias, 50):.1f} µs, p99 {percentil(latencias, 99):.1f} µs")
+
+        inicio = time.perf_counter()
+        consumidor = ConsumidorOutbox(caixa, NotificadorVazio(), trabalhadores=trabalhadores)
+        caixa.aguardar_entregas()
+        duracao = time.perf_counter() - inicio
+        consumidor.parar()
+        print(f"Entrega com {trabalhadores} consumidores: {quantidade / duracao:,.0f} mensagens/s")
+
+        inicio = time.perf_counter()
+        consumidor = ConsumidorOutbox(caixa, NotificadorVazio(), trabalhadores=trabalhadores)
+        for i in range(quantidade):
+            caixa.enfileirar("Promoção!", f"cliente{i}@exemplo.com")
+        caixa.aguardar_entregas()
+        duracao = time.perf_counter() - inicio
+        consumidor.parar()
+        caixa.fechar()
+        print(f"Vazão sustentada (enfileirar + entregar): {quantidade / duracao:,.0f} mensagens/s")
+
+    # Segmentos pequenos, entregues enquanto ainda são o ativo: todos menos o ativo precisam sumir do disco
+    with tempfile.TemporaryDirectory() as diretorio:
+        with Outbox(diretorio, tamanho_segmento=4096) as caixa:
+            for i in range(500):
+                chave = caixa.enfileirar("Promoção!", f"cliente{i}@exemplo.com")
+                caixa.retirar()
+                caixa.confirmar(chave)
+            segmentos = [nome for nome in os.listdir(diretorio) if nome.startswith("segmento-")]
+        print(f"Segmentos em disco após 500 mensagens confirmadas: {len(segmentos)}")
+        assert len(segmentos) == 1, "segmentos já entregues não foram compactados"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+# Benchmark - exemplos ruins vs bons de cada princípio, em várias escalas
+# Execute com `python -m benchmarks.pares`; use --gravar-base para atualizar a base de comparação
+#
+# Para cada par são medidos o tempo por operação, os blocos de memória e os bytes
+# que cada operação deixa alocados e o pico de memória da rodada. O resultado é
+# gravado em JSON e comparado com benchmarks/base/pares.json: o tempo é comparado
+# relativo ao exemplo ruim do mesmo caso (para não depender da máquina) e a
+# memória em valor absoluto. O custo relativo é a mediana das razões medidas em
+# cada repetição, com as variantes lado a lado, para que uma repetição ruidosa
+# não mude o resultado.
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from itertools import cycle, islice
+
+from solid import dip, isp, lsp, notificacoes, ocp, ruins, srp
+
+CAMINHO_BASE = os.path.join(os.path.dirname(__file__), "base", "pares.json")
+
+
+def emails(escala):
+    return [f"usuario{i}@exemplo.com" if i % 10 else f"usuario{i}-sem-arroba" for i in range(escala)]
+
+
+def srp_ruim(escala):
+    lista = emails(escala)
+    return lambda: [u for u in (ruins.Usuario("Ana", email) for email in lista) if u.validar_email()]
+
+
+def srp_bom(escala):
+    lista = emails(escala)
+    validar = srp.ValidadorEmail.validar
+    return lambda: [u for u in (srp.Usuario("Ana", email) for email in lista) if validar(u.email)]
+
+
+def ocp_ruim(escala):
+    calculadora = ruins.CalculadoraDescontos()
+    produto = ocp.Produto("Laptop", 1000)
+    tipos = list(islice(cycle(["regular", "premium", "vip"]), escala))
+    return lambda: [calculadora.calcular_desconto(produto, tipo) for tipo in tipos]
+
+
+def ocp_bom(escala):
+    calculadora = ocp.CalculadoraDescontos()
+    produto = ocp.Produto("Laptop", 1000)
+    clientes = list(islice(cycle([ocp.ClienteRegular(), ocp.ClientePremium(), ocp.ClienteVIP()]), escala))
+    return lambda: [calculadora.calcular_desconto(produto, cliente) for cliente in clientes]
+
+
+def lsp_ruim(escala):
+    def executar():
+        formas = [ruins.Retangulo(5, 4) if i % 2 else ruins.Quadrado(5) for i in range(escala)]
+        return formas, sum(forma.area() for forma in formas)
+    return executar
+
+
+def lsp_bom(escala):
+    def executar():
+        formas = [lsp.Retangulo(5, 4) if i % 2 else lsp.Quadrado(5) for i in range(escala)]
+        return formas, sum(forma.area() for forma in formas)
+    return executar
+
+
+def isp_ruim(escala):
+    def executar():
+        trabalhadores = [ruins.Humano() if i % 2 else ruins.Robo() for i in range(escala)]
+        for trabalhador in trabalhadores:
+            trabalhador.trabalhar()
+        return trabalhadores
+    return executar
+
+
+def isp_bom(escala):
+    def executar():
+        trabalhadores = [isp.Humano() if i % 2 else isp.Robo() for i in range(escala)]
+        for trabalhador in trabalhadores:
+            trabalhador.trabalhar()
+        return trabalhadores
+    return executar
+
+
+def dip_ruim(escala):
+    usuarios = [srp.Usuario(f"Usuário {i}", f"usuario{i}@exemplo.com") for i in range(escala)]
+    servico = ruins.ServicoUsuario()
+    return lambda: [servico.salvar_usuario(usuario) for usuario in usuarios]
+
+
+def dip_bom(escala):
+    usuarios = [srp.Usuario(f"Usuário {i}", f"usuario{i}@exemplo.com") for i in range(escala)]
+    servico = dip.ServicoUsuario(dip.MySQLDatabase())
+    return lambda: [servico.salvar_usuario(usuario) for usuario in usuarios]
+
+
+def despacho(gerenciador):
+    def preparar(escala):
+        tipos = list(islice(cycle(["email", "sms", "push"]), escala))
+        enviar = gerenciador().enviar_notificacao
+        return lambda: [enviar(tipo, "Seu pedido foi confirmado!", "cliente@exemplo.com") for tipo in tipos]
+    return preparar
+
+
+# Caso -> variante -> função que recebe a escala e devolve a rodada a medir
+CASOS = {
+    "srp_validacao": {"ruim": srp_ruim, "bom": srp_bom},
+    "ocp_desconto": {"ruim": ocp_ruim, "bom": ocp_bom},
+    "lsp_area": {"ruim": lsp_ruim, "bom": lsp_bom},
+    "isp_trabalhadores": {"ruim": isp_ruim, "bom": isp_bom},
+    "dip_salvar_usuario": {"ruim": dip_ruim, "bom": dip_bom},
+    "notificacoes_despacho": {
+        "ruim": despacho(ruins.GerenciadorNotificacoes),
+        "srp": despacho(ruins.GerenciadorNotificacoesSRP),
+        "bom": despacho(notificacoes.GerenciadorNotificacoes),
+        "roteador": despacho(notificacoes.RoteadorNotificacoes),
+    },
+}
+
+
+def cronometrar(rodadas, repeticoes):
+    # Variantes intercaladas e coletor de lixo desligado, como no timeit, para que
+    # todas sofram o mesmo ruído da máquina. Retorna os tempos de cada repetição.
+    tempos = {variante: [] for variante in rodadas}
+    gc.disable()
+    try:
+        for _ in range(repeticoes):
+            for variante, executar in rodadas.items():
+                inicio = time.perf_counter()
+                executar()
+                tempos[variante].append(time.perf_counter() - inicio)
+    finally:
+        gc.enable()
+    return tempos
+
+
+def medir_memoria(executar):
+    # Blocos ainda alocados enquanto o resultado da rodada está vivo
+    gc.collect()
+    blocos = sys.getallocatedblocks()
+    resultado = executar()
+    blocos = sys.getallocatedblocks() - blocos
+    del resultado
+
+    gc.collect()
+    tracemalloc.start()
+    resultado = executar()
+    retidos, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return blocos, retidos, pico
+
+
+def medir_caso(variantes, escala, repeticoes):
+    rodadas = {variante: preparar(escala) for variante, preparar in variantes.items()}
+    with open(os.devnull, "w") as nulo, redirect_stdout(nulo):
+        tempos = cronometrar(rodadas, repeticoes)
+        memoria = {variante: medir_memoria(executar) for variante, executar in rodadas.items()}
+    # A primeira variante de cada caso é a referência para o custo relativo
+    referencia = next(iter(tempos.values()))
+    medidas = {}
+    for variante, medidos in tempos.items():
+        blocos, retidos, pico = memoria[variante]
+        medidas[variante] = {
+            "ns_por_op": statistics.median(medidos) / escala * 1e9,
+            "custo_relativo": statistics.median(
+                tempo / tempo_referencia for tempo, tempo_referencia in zip(medidos, referencia)
+            ),
+            "blocos_por_op": blocos / escala,
+            "bytes_por_op": retidos / escala,
+            "pico_bytes": pico,
+        }
+    return medidas
+
+
+def executar_casos(escalas, repeticoes):
+    resultados = {}
+    for caso, variantes in CASOS.items():
+        for escala in escalas:
+            for variante, medida in medir_caso(variantes, escala, repeticoes).items():
+                resultados[f"{caso}/{variante}/{escala}"] = medida
+                print(f"{caso} {variante:>8} n={escala:<7} {medida['ns_por_op']:9.0f} ns/op "
+                      f"{medida['custo_relativo']:5.2f}x {medida['bytes_por_op']:7.1f} B/op "
+                      f"{medida['blocos_por_op']:5.2f} blocos/op pico {medida['pico_bytes']:,} B")
+    return resultados
+
+
+def comparar(resultados, base, tolerancia_tempo, tolerancia_memoria):
+    regressoes = []
+    for chave, medida in resultados.items():
+        anterior = base.get(chave)
+        if anterior is None:
+            continue
+        if medida["custo_relativo"] > anterior["custo_relativo"] * (1 + tolerancia_tempo):
+            regressoes.append(f"{chave}: custo relativo {anterior['custo_relativo']:.2f}x -> "
+                              f"{medida['custo_relativo']:.2f}x")
+        # Folga de alguns bytes para escalas pequenas, onde o ruído do alocador pesa mais
+        if medida["bytes_por_op"] > anterior["bytes_por_op"] * (1 + tolerancia_memoria) + 8:
+            regressoes.append(f"{chave}: memória {anterior['bytes_por_op']:.1f} -> "
+                              f"{medida['bytes_por_op']:.1f} B/op")
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exemplos ruins vs bons de cada princípio")
+    # Com 1.000 operações a rodada dura poucos microssegundos e o ruído domina a medida
+    parser.add_argument("--escalas", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeticoes", type=int, default=15)
+    parser.add_argument("--saida", help="arquivo JSON onde gravar os resultados")
+    parser.add_argument("--base", default=CAMINHO_BASE)
+    parser.add_argument("--gravar-base", action="store_true")
+    parser.add_argument("--tolerancia-tempo", type=float, default=0.25)
+    parser.add_argument("--tolerancia-memoria", type=float, default=0.10)
+    argumentos = parser.parse_args(argv)
+
+    resultados = executar_casos(argumentos.escalas, argumentos.repeticoes)
+    relatorio = {"python": sys.version.split()[0], "resultados": resultados}
+    if argumentos.saida:
+        with open(argumentos.saida, "w") as arquivo:
+            json.dump(relatorio, arquivo, indent=2)
+    if argumentos.gravar_base:
+        os.makedirs(os.path.dirname(argumentos.base), exist_ok=True)
+        with open(argumentos.base, "w") as arquivo:
+            json.dump(relatorio, arquivo, indent=2)
+        print(f"Base gravada em {argumentos.base}")
+        return
+    if not os.path.exists(argumentos.base):
+        print(f"Sem base em {argumentos.base}; rode com --gravar-base para criar uma")
+        return
+
+    with open(argumentos.base) as arquivo:
+        base = json.load(arquivo)["resultados"]
+    regressoes = comparar(resultados, base, argumentos.tolerancia_tempo, argumentos.tolerancia_memoria)
+    for regressao in regressoes:
+        print(f"REGRESSÃO {regressao}")
+    if regressoes:
+        sys.exit(1)
+    print("Nenhuma regressão em relação à base")
+
+
+if __name__ == "__main__":
+    main()
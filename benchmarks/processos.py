@@ -0,0 +1,51 @@
+# Benchmark - escala de 1 a N processos para notificações com trabalho de CPU
+# Execute com `python -m benchmarks.processos`
+
+import hashlib
+import json
+import multiprocessing
+import time
+
+from solid.notificacoes import GerenciadorNotificacoes, Notificador
+from solid.processos import PoolProcessosNotificacao
+
+
+class NotificadorComTemplate(Notificador):
+    # Simula montar o template e serializar o payload, sem I/O
+    def enviar(self, mensagem, destinatario):
+        corpo = f"Olá {destinatario}, {mensagem} " * 20
+        payload = json.dumps({"para": destinatario, "corpo": corpo})
+        for _ in range(20):
+            payload = hashlib.sha256(payload.encode()).hexdigest()
+        return len(payload)
+
+
+def criar_gerenciador():
+    gerenciador = GerenciadorNotificacoes()
+    gerenciador.registrar_notificador("email", NotificadorComTemplate())
+    return gerenciador
+
+
+def main(quantidade=40_000):
+    jobs = [("email", "temos uma promoção para você!", f"cliente{i}@exemplo.com") for i in range(quantidade)]
+
+    gerenciador = criar_gerenciador()
+    inicio = time.perf_counter()
+    for tipo, mensagem, destinatario in jobs:
+        gerenciador.enviar_notificacao(tipo, mensagem, destinatario)
+    base = quantidade / (time.perf_counter() - inicio)
+    print(f"Na thread atual: {base:,.0f} mensagens/s")
+
+    processos = 1
+    while processos <= multiprocessing.cpu_count():
+        with PoolProcessosNotificacao(criar_gerenciador, processos=processos) as pool:
+            inicio = time.perf_counter()
+            for _ in pool.enviar_lote(jobs):
+                pass
+            vazao = quantidade / (time.perf_counter() - inicio)
+        print(f"{processos} processo(s): {vazao:,.0f} mensagens/s ({vazao / base:.1f}x)")
+        processos *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Benchmark - exportação do relatório de usuários em blocos: memória, processos e reaproveitamento
+# Execute com `python -m benchmarks.relatorios`
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+from solid.relatorios import ExportadorHTML, MotorExportacao
+from solid.srp import Usuario
+
+
+def usuarios(quantidade, alterado=None):
+    # Gerador: os usuários nunca estão todos na memória ao mesmo tempo
+    for i in range(quantidade):
+        nome = "Usuário alterado" if i == alterado else f"Usuário {i}"
+        yield Usuario(nome, f"usuario{i}@exemplo.com")
+
+
+def main(quantidade=1_000_000, tamanho_bloco=10_000):
+    exportador = ExportadorHTML()
+    with tempfile.TemporaryDirectory() as diretorio:
+        print("Pico de memória no processo principal (processos=1):")
+        for escala in (quantidade // 100, quantidade // 10, quantidade):
+            destino = os.path.join(diretorio, f"memoria{escala}{exportador.extensao}")
+            tracemalloc.start()
+            MotorExportacao(exportador, tamanho_bloco, processos=1).exportar(usuarios(escala), destino)
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {escala:>9,} usuários: {pico / 2**20:.1f} MiB")
+
+        print(f"Tempo com {quantidade:,} usuários ({os.cpu_count()} CPUs na máquina):")
+        referencia = None
+        for processos in sorted({1, 2, 4, os.cpu_count() or 1}):
+            # Um destino novo a cada medição, para que nada seja reaproveitado
+            destino = os.path.join(diretorio, f"processos{processos}{exportador.extensao}")
+            inicio = time.perf_counter()
+            MotorExportacao(exportador, tamanho_bloco, processos).exportar(usuarios(quantidade), destino)
+            duracao = time.perf_counter() - inicio
+            referencia = referencia or duracao
+            print(f"  {processos} processo(s): {duracao:.2f} s ({referencia / duracao:.2f}x)")
+
+        print("Nova rodada sobre o mesmo destino (processos=1):")
+        motor = MotorExportacao(exportador, tamanho_bloco, processos=1)
+        destino = os.path.join(diretorio, f"incremental{exportador.extensao}")
+        for nome, alterado in (("primeira", None), ("sem mudanças", None), ("um usuário alterado", quantidade // 2)):
+            resultado = motor.exportar(usuarios(quantidade, alterado), destino)
+            print(f"  {nome}: {resultado['duracao']:.2f} s, {resultado['renderizadas']} seções renderizadas, "
+                  f"{resultado['reaproveitadas']} reaproveitadas")
+
+
+if __name__ == "__main__":
+    main()
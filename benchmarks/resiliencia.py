@@ -0,0 +1,75 @@
+# Benchmark - latência de cauda e falhas com provedores falsos, com e sem EstrategiaResiliente
+# Execute com `python -m benchmarks.resiliencia`
+
+import random
+import statistics
+import time
+
+from solid.notificacoes import EstrategiaNotificacao
+from solid.resiliencia import DisjuntorCircuito, EstrategiaResiliente
+
+
+class ProvedorFalso(EstrategiaNotificacao):
+    # Latência de 2 ms na maioria dos envios, com uma cauda lenta e falhas aleatórias
+    def __init__(self, semente, taxa_falha=0.05, taxa_lenta=0.03, lenta=0.1, fora_do_ar=False):
+        self.aleatorio = random.Random(semente)
+        self.taxa_falha = taxa_falha
+        self.taxa_lenta = taxa_lenta
+        self.lenta = lenta
+        self.fora_do_ar = fora_do_ar
+
+    def notificar(self, mensagem, destinatario):
+        if self.fora_do_ar:
+            # Um provedor fora do ar costuma falhar só depois de um timeout
+            time.sleep(0.02)
+            raise ConnectionError("Provedor fora do ar")
+        sorteio = self.aleatorio.random()
+        time.sleep(self.lenta if sorteio < self.taxa_lenta else 0.002)
+        if self.aleatorio.random() < self.taxa_falha:
+            raise ConnectionError("Falha no provedor")
+
+
+def medir(estrategia, envios):
+    latencias = []
+    falhas = 0
+    for i in range(envios):
+        inicio = time.perf_counter()
+        try:
+            estrategia.notificar("Seu pedido foi confirmado!", f"cliente{i}@exemplo.com")
+        except Exception:
+            falhas += 1
+        latencias.append(time.perf_counter() - inicio)
+    quantis = statistics.quantiles(latencias, n=100)
+    return quantis[49] * 1e3, quantis[98] * 1e3, falhas
+
+
+def main(envios=1_000):
+    random.seed(7)
+    cenarios = {
+        "Sem proteção": ProvedorFalso(1),
+        "Retentativas": EstrategiaResiliente(ProvedorFalso(1)),
+        "Retentativas + hedge no p95": EstrategiaResiliente(ProvedorFalso(1), alternativa=ProvedorFalso(2)),
+    }
+    for nome, estrategia in cenarios.items():
+        p50, p99, falhas = medir(estrategia, envios)
+        print(f"{nome}: p50 {p50:.1f} ms, p99 {p99:.1f} ms, {falhas} falhas em {envios}")
+        if isinstance(estrategia, EstrategiaResiliente):
+            print(f"  {estrategia.metricas()}")
+
+    # Provedor fora do ar: sem disjuntor todo envio paga o timeout e as retentativas
+    fora = {
+        "Fora do ar, retentativas sem disjuntor": EstrategiaResiliente(
+            ProvedorFalso(3, fora_do_ar=True), disjuntor=DisjuntorCircuito(limite_falhas=10**9)
+        ),
+        "Fora do ar, com disjuntor": EstrategiaResiliente(ProvedorFalso(3, fora_do_ar=True)),
+        "Fora do ar, com disjuntor e alternativa": EstrategiaResiliente(
+            ProvedorFalso(3, fora_do_ar=True), alternativa=ProvedorFalso(4, taxa_falha=0, taxa_lenta=0)
+        ),
+    }
+    for nome, estrategia in fora.items():
+        p50, p99, falhas = medir(estrategia, envios // 5)
+        print(f"{nome}: p50 {p50:.1f} ms, p99 {p99:.1f} ms, {falhas} falhas em {envios // 5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Benchmark - custo de despacho dos gerenciadores de notificação
+# Execute com `python -m benchmarks.roteamento`
+
+import os
+import threading
+import timeit
+from contextlib import redirect_stdout
+from itertools import cycle, islice
+
+from solid import ruins
+from solid.notificacoes import GerenciadorNotificacoes, Notificador, RoteadorNotificacoes
+
+
+class NotificadorSilencioso(Notificador):
+    def enviar(self, mensagem, destinatario):
+        pass
+
+
+def silencioso(classe):
+    gerenciador = classe()
+    for tipo in ("email", "sms", "push"):
+        gerenciador.registrar_notificador(tipo, NotificadorSilencioso())
+    return gerenciador
+
+
+def medir(gerenciadores, tipos, repeticoes):
+    # Gerenciadores intercalados a cada repetição, para que sofram o mesmo ruído da máquina
+    rodadas = {}
+    for nome, gerenciador in gerenciadores.items():
+        enviar = gerenciador.enviar_notificacao
+        rodadas[nome] = lambda enviar=enviar: [
+            enviar(tipo, "Seu pedido foi confirmado!", "cliente@exemplo.com") for tipo in tipos
+        ]
+    tempos = {nome: float("inf") for nome in rodadas}
+    for _ in range(repeticoes):
+        for nome, rodada in rodadas.items():
+            tempos[nome] = min(tempos[nome], timeit.timeit(rodada, number=1))
+    return {nome: tempo / len(tipos) * 1e9 for nome, tempo in tempos.items()}
+
+
+def main(quantidade=200_000, repeticoes=9):
+    tipos = list(islice(cycle(["email", "sms", "push"]), quantidade))
+
+    # Os estágios 1 e 2 imprimem dentro do próprio gerenciador, então todos imprimem aqui
+    print("Com os notificadores da apresentação (saída descartada):")
+    with open(os.devnull, "w") as nulo, redirect_stdout(nulo):
+        tempos = medir({
+            "Estágio 1 (if/elif)": ruins.GerenciadorNotificacoes(),
+            "Estágio 2 (if/elif + instância por envio)": ruins.GerenciadorNotificacoesSRP(),
+            "Estágio 3 (registro em dict)": GerenciadorNotificacoes(),
+            "RoteadorNotificacoes": RoteadorNotificacoes(),
+        }, tipos, repeticoes)
+    for nome, tempo in tempos.items():
+        print(f"  {nome}: {tempo:.0f} ns/envio")
+
+    print("Só o despacho, com notificadores que não fazem nada:")
+    tempos = medir({
+        "Estágio 3 (registro em dict)": silencioso(GerenciadorNotificacoes),
+        "RoteadorNotificacoes": silencioso(RoteadorNotificacoes),
+    }, tipos, repeticoes)
+    estagio3, roteador = tempos.values()
+    print(f"  Estágio 3 (registro em dict): {estagio3:.0f} ns/envio")
+    print(f"  RoteadorNotificacoes: {roteador:.0f} ns/envio ({(roteador - estagio3) / estagio3:+.1%})")
+
+    # Leitores despachando enquanto outra thread registra canais sem parar
+    roteador = silencioso(RoteadorNotificacoes)
+    erros = []
+    ativo = True
+
+    def ler():
+        while ativo:
+            try:
+                roteador.enviar_notificacao("email", "Oi", "cliente@exemplo.com")
+            except Exception as erro:
+                erros.append(erro)
+
+    leitores = [threading.Thread(target=ler) for _ in range(4)]
+    for leitor in leitores:
+        leitor.start()
+    for i in range(2_000):
+        roteador.registrar_notificador(f"canal{i % 50}", NotificadorSilencioso())
+    ativo = False
+    for leitor in leitores:
+        leitor.join()
+    print(f"2.000 registros com 4 leitores concorrentes: {len(erros)} erro(s), "
+          f"{len(roteador.tabela)} canais na tabela")
+
+
+if __name__ == "__main__":
+    main()
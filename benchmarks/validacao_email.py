@@ -0,0 +1,46 @@
+# Benchmark - validar em laço vs validar_lote
+# Execute com `python -m benchmarks.validacao_email`
+#
+# validar só procura "@" e "."; validar_lote confere a gramática completa. A
+# comparação com validar mostra quanto custa a validação estrita, e a com a
+# gramática chamada email a email, o ganho do cache de domínios.
+#
+# O requisito de desempenho do validar_lote (bem mais rápido que validar em laço)
+# está em aberto; a última linha mostra a distância que ainda falta.
+
+import timeit
+
+from solid.srp import ValidadorEmail
+
+
+def validar_estrito(email):
+    return ValidadorEmail.PADRAO_EMAIL.fullmatch(email) is not None
+
+
+def medir(executar, repeticoes):
+    return min(timeit.repeat(executar, number=1, repeat=repeticoes))
+
+
+def main(quantidade=100_000, repeticoes=5):
+    emails = [
+        f"usuario{i}@dominio{i % 100}.com.br" if i % 10 else f"usuario{i}-sem-arroba"
+        for i in range(quantidade)
+    ]
+    validar = ValidadorEmail.validar
+    assert ValidadorEmail.validar_lote(emails) == bytearray(validar_estrito(email) for email in emails)
+
+    tempos = {
+        "Laço com validar": medir(lambda: [validar(email) for email in emails], repeticoes),
+        "Laço com a gramática estrita": medir(lambda: [validar_estrito(email) for email in emails], repeticoes),
+        "validar_lote": medir(lambda: ValidadorEmail.validar_lote(emails), repeticoes),
+    }
+    referencia = tempos["Laço com validar"]
+    for nome, tempo in tempos.items():
+        print(f"{nome}: {len(emails) / tempo:,.0f} emails/s ({referencia / tempo:.2f}x)")
+    if tempos["validar_lote"] >= referencia:
+        print(f"Requisito em aberto: validar_lote ainda é {tempos['validar_lote'] / referencia:.1f}x "
+              f"mais lento que validar em laço")
+
+
+if __name__ == "__main__":
+    main()
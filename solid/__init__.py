@@ -0,0 +1,29 @@
+# SOLID: Princípios de Design Orientado a Objetos
+# ------------------------------------------------
+# Cada princípio vive em seu próprio submódulo, carregado só quando usado:
+#
+#     from solid import ocp
+#     ocp.CalculadoraDescontos()
+#
+# Importar o pacote não executa nenhuma demonstração; para isso use `python -m solid`.
+
+import importlib
+
+SUBMODULOS = (
+    "srp", "ocp", "lsp", "isp", "dip", "fragmentacao", "cadastro", "notificacoes", "outbox", "processos",
+    "resiliencia", "deduplicacao", "modelos", "relatorios", "instrumentacao", "ruins", "demos",
+)
+
+__all__ = list(SUBMODULOS)
+
+
+def __getattr__(nome):
+    if nome in SUBMODULOS:
+        modulo = importlib.import_module(f".{nome}", __name__)
+        globals()[nome] = modulo
+        return modulo
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULOS))
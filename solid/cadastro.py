@@ -0,0 +1,148 @@
+# Cadastro de usuários em fluxo contínuo
+# --------------------------------------
+# O exemplo de SRP valida, salva e envia o email de um usuário por vez. Aqui os
+# três passos viram estágios ligados por filas limitadas: a leitura valida em
+# lotes, uma thread salva em blocos e outras enviam os emails de boas-vindas. Se
+# o email atrasa, as filas enchem e a leitura espera, em vez de carregar o
+# arquivo inteiro na memória.
+
+import csv
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+
+from .srp import RepositorioUsuario, ServicoEmail, Usuario, ValidadorEmail
+
+# Marca o fim do fluxo em cada fila
+FIM = None
+
+
+def ler_usuarios(origem):
+    # Aceita um iterável de Usuario ou de (nome, email), ou o caminho de um .csv ou .jsonl
+    if not isinstance(origem, (str, os.PathLike)):
+        for item in origem:
+            yield item if isinstance(item, Usuario) else Usuario(*item)
+        return
+    caminho = os.fspath(origem)
+    if caminho.endswith(".csv"):
+        with open(caminho, newline="", encoding="utf-8") as arquivo:
+            # O arquivo precisa de um cabeçalho com as colunas nome e email
+            for linha in csv.DictReader(arquivo):
+                yield Usuario(linha["nome"], linha["email"])
+    elif caminho.endswith(".jsonl"):
+        with open(caminho, encoding="utf-8") as arquivo:
+            for linha in arquivo:
+                if linha.strip():
+                    registro = json.loads(linha)
+                    yield Usuario(registro["nome"], registro["email"])
+    else:
+        raise ValueError("Formato de arquivo não suportado")
+
+class PipelineCadastro:
+    def __init__(self, repositorio=RepositorioUsuario, servico_email=ServicoEmail,
+                 tamanho_lote=1000, capacidade_fila=4, trabalhadores_email=2):
+        # O repositório pode ter salvar_lote; se não tiver, os usuários são salvos um a um
+        self.repositorio = repositorio
+        self.servico_email = servico_email
+        self.tamanho_lote = tamanho_lote
+        # Cada fila guarda no máximo capacidade_fila lotes entre dois estágios
+        self.capacidade_fila = capacidade_fila
+        self.trabalhadores_email = trabalhadores_email
+
+    def executar(self, origem):
+        fila_persistencia = queue.Queue(self.capacidade_fila)
+        fila_email = queue.Queue(self.capacidade_fila)
+        contagens = {"salvos": 0, "emails": 0, "falhas_email": 0}
+        erros = []
+        trava = threading.Lock()
+        threads = [threading.Thread(target=self._persistir, args=(fila_persistencia, fila_email, contagens, erros))]
+        threads += [
+            threading.Thread(target=self._enviar_emails, args=(fila_email, contagens, trava))
+            for _ in range(self.trabalhadores_email)
+        ]
+        for thread in threads:
+            thread.start()
+
+        inicio = time.perf_counter()
+        lidos = validos = 0
+        bloqueado = 0.0
+        cache_dominios = {}
+        usuarios = ler_usuarios(origem)
+        try:
+            while not erros:
+                lote = list(itertools.islice(usuarios, self.tamanho_lote))
+                if not lote:
+                    break
+                mascara = ValidadorEmail.validar_lote([usuario.email for usuario in lote], cache_dominios)
+                aprovados = list(itertools.compress(lote, mascara))
+                lidos += len(lote)
+                validos += len(aprovados)
+                if aprovados:
+                    # Bloqueia quando os estágios seguintes estão atrasados
+                    espera = time.perf_counter()
+                    fila_persistencia.put(aprovados)
+                    bloqueado += time.perf_counter() - espera
+        finally:
+            fila_persistencia.put(FIM)
+            for thread in threads:
+                thread.join()
+        if erros:
+            raise erros[0]
+
+        duracao = time.perf_counter() - inicio
+        return {
+            "lidos": lidos,
+            "validos": validos,
+            "invalidos": lidos - validos,
+            **contagens,
+            "duracao": duracao,
+            "usuarios_por_segundo": lidos / duracao if duracao else 0.0,
+            "leitura_bloqueada": bloqueado,
+        }
+
+    def _persistir(self, entrada, saida, contagens, erros):
+        salvar_lote = getattr(self.repositorio, "salvar_lote", None)
+        try:
+            while True:
+                lote = entrada.get()
+                if lote is FIM:
+                    return
+                if erros:
+                    # Depois de uma falha só esvazia a fila, para a leitura não travar no put
+                    continue
+                try:
+                    if salvar_lote is not None:
+                        salvar_lote(lote)
+                    else:
+                        for usuario in lote:
+                            self.repositorio.salvar(usuario)
+                except Exception as erro:
+                    erros.append(erro)
+                    continue
+                contagens["salvos"] += len(lote)
+                saida.put(lote)
+        finally:
+            for _ in range(self.trabalhadores_email):
+                saida.put(FIM)
+
+    def _enviar_emails(self, entrada, contagens, trava):
+        enviar = self.servico_email.enviar_boas_vindas
+        enviados = falhas = 0
+        while True:
+            lote = entrada.get()
+            if lote is FIM:
+                break
+            for usuario in lote:
+                # Um email que falha não desfaz o cadastro; a falha só é contada
+                try:
+                    enviar(usuario)
+                except Exception:
+                    falhas += 1
+                else:
+                    enviados += 1
+        with trava:
+            contagens["emails"] += enviados
+            contagens["falhas_email"] += falhas
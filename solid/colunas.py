@@ -0,0 +1,28 @@
+# Colunas compactas
+# -----------------
+# Estruturas compartilhadas pelos stores em colunas de SRP e OCP
+
+from array import array
+
+
+class ColunaTexto:
+    # Textos concatenados em UTF-8, com o deslocamento final de cada um
+    def __init__(self, textos=()):
+        self.dados = bytearray()
+        self.fins = array("Q")
+        for texto in textos:
+            self.append(texto)
+
+    def append(self, texto):
+        self.dados += texto.encode()
+        self.fins.append(len(self.dados))
+
+    def __len__(self):
+        return len(self.fins)
+
+    def __getitem__(self, indice):
+        inicio = self.fins[indice - 1] if indice else 0
+        return self.dados[inicio:self.fins[indice]].decode()
+
+    def tamanho_em_bytes(self):
+        return len(self.dados) + self.fins.itemsize * len(self.fins)
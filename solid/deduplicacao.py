@@ -0,0 +1,288 @@
+# Deduplicação e agrupamento de notificações
+# ------------------------------------------
+# IndiceDeduplicacao guarda o hash do conteúdo (canal, destinatário, mensagem) dos
+# envios recentes e aponta repetições dentro da janela. As chaves ficam em
+# gerações por tempo: a mais antiga sai inteira quando passa da janela ou quando o
+# índice passa da capacidade, e uma chave vista de novo volta para a geração
+# atual, como num LRU. Com bloom=True, cada geração fechada guarda só um filtro
+# de Bloom, que ocupa uma fração da memória ao custo de raros falsos positivos.
+
+import hashlib
+import math
+import threading
+import time
+from collections import deque
+
+# 60 bits cabem num int pequeno do CPython e ainda tornam colisões raras
+MASCARA_CHAVE = (1 << 60) - 1
+
+
+def chave_conteudo(tipo, destinatario, mensagem):
+    resumo = hashlib.blake2b(f"{tipo}\x1f{destinatario}\x1f{mensagem}".encode(), digest_size=8).digest()
+    return int.from_bytes(resumo, "little") & MASCARA_CHAVE
+
+class FiltroBloom:
+    def __init__(self, capacidade, taxa_falso_positivo=0.001):
+        self.tamanho = max(8, int(-capacidade * math.log(taxa_falso_positivo) / math.log(2) ** 2))
+        self.funcoes = max(1, round(self.tamanho / capacidade * math.log(2)))
+        self.bits = bytearray((self.tamanho + 7) // 8)
+
+    def posicoes(self, chave):
+        # Hash duplo: as k posições saem das duas metades da chave
+        h1 = chave & 0x3FFFFFFF
+        h2 = (chave >> 30) | 1
+        tamanho = self.tamanho
+        return [(h1 + i * h2) % tamanho for i in range(self.funcoes)]
+
+    def adicionar(self, chave):
+        bits = self.bits
+        for posicao in self.posicoes(chave):
+            bits[posicao >> 3] |= 1 << (posicao & 7)
+
+    def __contains__(self, chave):
+        return self.contem_posicoes(self.posicoes(chave))
+
+    def contem_posicoes(self, posicoes):
+        # Filtros do mesmo tamanho compartilham as posições, calculadas uma só vez por chave
+        bits = self.bits
+        for posicao in posicoes:
+            if not bits[posicao >> 3] & (1 << (posicao & 7)):
+                return False
+        return True
+
+class Geracao:
+    __slots__ = ("inicio", "chaves", "filtro", "tamanho")
+
+    def __init__(self, inicio, filtro):
+        self.inicio = inicio
+        # Depois de fechada, numa geração com filtro, as chaves exatas são descartadas
+        self.chaves = set()
+        self.filtro = filtro
+        self.tamanho = 0
+
+class IndiceDeduplicacao:
+    def __init__(self, janela=300.0, capacidade=1_000_000, geracoes=8, bloom=False, taxa_falso_positivo=0.01):
+        self.janela = janela
+        self.capacidade = capacidade
+        self.duracao_geracao = janela / geracoes
+        self.capacidade_geracao = max(1, capacidade // geracoes)
+        self.bloom = bloom
+        self.taxa_falso_positivo = taxa_falso_positivo
+        self.geracoes = deque()
+        self.total = 0
+        self.consultas = 0
+        self.duplicatas = 0
+        # Chaves de envios em andamento, ainda sem confirmação
+        self.reservadas = set()
+        self.trava = threading.Lock()
+        self._nova_geracao(time.monotonic())
+
+    def registrar(self, chave, agora=None):
+        # Retorna True se a chave já foi vista dentro da janela; em qualquer caso ela
+        # passa a contar como vista agora
+        agora = time.monotonic() if agora is None else agora
+        with self.trava:
+            self._expirar(agora)
+            self.consultas += 1
+            duplicata = self._contem(chave)
+            if duplicata:
+                self.duplicatas += 1
+            atual = self.geracoes[-1]
+            if chave not in atual.chaves:
+                self._guardar(atual, chave, agora)
+            return duplicata
+
+    def reservar(self, chave, agora=None):
+        # Como registrar, mas uma chave nova só passa a contar como vista em
+        # confirmar(); até lá fica reservada, e outro envio igual é tratado como
+        # duplicata. Retorna True se a chave já foi vista ou está reservada.
+        agora = time.monotonic() if agora is None else agora
+        with self.trava:
+            self._expirar(agora)
+            self.consultas += 1
+            if chave in self.reservadas:
+                self.duplicatas += 1
+                return True
+            if self._contem(chave):
+                self.duplicatas += 1
+                atual = self.geracoes[-1]
+                if chave not in atual.chaves:
+                    self._guardar(atual, chave, agora)
+                return True
+            self.reservadas.add(chave)
+            return False
+
+    def confirmar(self, chave, agora=None):
+        agora = time.monotonic() if agora is None else agora
+        with self.trava:
+            self.reservadas.discard(chave)
+            self._expirar(agora)
+            atual = self.geracoes[-1]
+            if chave not in atual.chaves:
+                self._guardar(atual, chave, agora)
+
+    def liberar(self, chave):
+        with self.trava:
+            self.reservadas.discard(chave)
+
+    def contem(self, chave, agora=None):
+        agora = time.monotonic() if agora is None else agora
+        with self.trava:
+            self._expirar(agora)
+            return self._contem(chave)
+
+    def __len__(self):
+        return self.total
+
+    def metricas(self):
+        with self.trava:
+            return {
+                "chaves": self.total,
+                "geracoes": len(self.geracoes),
+                "consultas": self.consultas,
+                "duplicatas": self.duplicatas,
+                "taxa_duplicatas": self.duplicatas / self.consultas if self.consultas else 0.0,
+            }
+
+    def _contem(self, chave):
+        # Da geração mais nova para a mais antiga: chaves repetidas costumam ser recentes
+        posicoes = None
+        for geracao in reversed(self.geracoes):
+            chaves = geracao.chaves
+            if chaves is not None:
+                if chave in chaves:
+                    return True
+            else:
+                if posicoes is None:
+                    posicoes = geracao.filtro.posicoes(chave)
+                if geracao.filtro.contem_posicoes(posicoes):
+                    return True
+        return False
+
+    def _guardar(self, geracao, chave, agora):
+        geracao.chaves.add(chave)
+        if geracao.filtro is not None:
+            geracao.filtro.adicionar(chave)
+        geracao.tamanho += 1
+        self.total += 1
+        if geracao.tamanho >= self.capacidade_geracao:
+            self._nova_geracao(agora)
+
+    def _expirar(self, agora):
+        if agora - self.geracoes[-1].inicio >= self.duracao_geracao:
+            self._nova_geracao(agora)
+        # A geração mais antiga sai quando todas as suas chaves passaram da janela
+        # (a seguinte começou antes do limite) ou quando o índice está cheio
+        while len(self.geracoes) > 1 and (
+            self.geracoes[1].inicio <= agora - self.janela or self.total > self.capacidade
+        ):
+            self.total -= self.geracoes.popleft().tamanho
+
+    def _nova_geracao(self, agora):
+        if self.geracoes and self.bloom:
+            self.geracoes[-1].chaves = None
+        # A taxa pedida vale para o índice inteiro, que consulta todas as gerações
+        taxa = self.taxa_falso_positivo / (self.capacidade // self.capacidade_geracao + 1)
+        filtro = FiltroBloom(self.capacidade_geracao, taxa) if self.bloom else None
+        self.geracoes.append(Geracao(agora, filtro))
+
+class GerenciadorDeduplicado:
+    # Envolve um GerenciadorNotificacoes e pula envios repetidos dentro da janela
+    def __init__(self, gerenciador, indice=None):
+        self.gerenciador = gerenciador
+        self.indice = indice or IndiceDeduplicacao()
+
+    def enviar_notificacao(self, tipo, mensagem, destinatario):
+        # A chave é reservada antes do envio, para que dois envios iguais ao mesmo
+        # tempo não passem os dois, e só é confirmada depois de um envio
+        # bem-sucedido, para que uma retentativa após falha não seja tratada como
+        # duplicata.
+        chave = chave_conteudo(tipo, destinatario, mensagem)
+        if self.indice.reservar(chave):
+            return False
+        try:
+            self.gerenciador.enviar_notificacao(tipo, mensagem, destinatario)
+        except BaseException:
+            self.indice.liberar(chave)
+            raise
+        self.indice.confirmar(chave)
+        return True
+
+    def registrar_notificador(self, tipo, notificador):
+        self.gerenciador.registrar_notificador(tipo, notificador)
+
+class AgrupadorResumos:
+    # Junta as mensagens pendentes para um mesmo destinatário e canal num único resumo
+    def __init__(self, gerenciador, atraso=1.0):
+        self.gerenciador = gerenciador
+        self.atraso = atraso
+        self.pendentes = {}
+        self.trava = threading.Lock()
+        self.recebidas = 0
+        self.enviadas = 0
+
+    def adicionar(self, tipo, mensagem, destinatario, agora=None):
+        agora = time.monotonic() if agora is None else agora
+        with self.trava:
+            grupo = self.pendentes.get((tipo, destinatario))
+            if grupo is None:
+                grupo = self.pendentes[tipo, destinatario] = (agora, [])
+            grupo[1].append(mensagem)
+            self.recebidas += 1
+
+    def esvaziar(self, agora=None, tudo=False):
+        # Envia os grupos cuja primeira mensagem já esperou `atraso` (ou todos, com tudo=True)
+        # Cada grupo sai do buffer só quando vai ser enviado; se o envio falhar, ele
+        # volta para o buffer e os grupos seguintes continuam pendentes
+        agora = time.monotonic() if agora is None else agora
+        with self.trava:
+            prontos = [
+                chave for chave, (inicio, _) in self.pendentes.items()
+                if tudo or agora - inicio >= self.atraso
+            ]
+        enviados = 0
+        for chave in prontos:
+            with self.trava:
+                grupo = self.pendentes.pop(chave, None)
+            if grupo is None:
+                continue
+            inicio, mensagens = grupo
+            tipo, destinatario = chave
+            try:
+                self.gerenciador.enviar_notificacao(tipo, self.resumo(mensagens), destinatario)
+            except BaseException:
+                with self.trava:
+                    # Mensagens que chegaram durante o envio vão depois das antigas
+                    novo = self.pendentes.pop(chave, None)
+                    if novo is not None:
+                        mensagens.extend(novo[1])
+                    self.pendentes[chave] = (inicio, mensagens)
+                raise
+            enviados += 1
+            with self.trava:
+                self.enviadas += 1
+        return enviados
+
+    @staticmethod
+    def resumo(mensagens):
+        if len(mensagens) == 1:
+            return mensagens[0]
+        itens = "\n".join(f"- {mensagem}" for mensagem in mensagens)
+        return f"Você tem {len(mensagens)} notificações:\n{itens}"
+
+    def metricas(self):
+        with self.trava:
+            return {
+                "recebidas": self.recebidas,
+                "enviadas": self.enviadas,
+                "pendentes": len(self.pendentes),
+            }
+
+    def fechar(self):
+        self.esvaziar(tudo=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
@@ -0,0 +1,510 @@
+# Roteiro da apresentação
+# -----------------------
+# SOLID é um acrônimo que representa cinco princípios fundamentais da programação orientada a objetos:
+# - S: Single Responsibility Principle (Princípio da Responsabilidade Única)
+# - O: Open/Closed Principle (Princípio Aberto/Fechado)
+# - L: Liskov Substitution Principle (Princípio da Substituição de Liskov)
+# - I: Interface Segregation Principle (Princípio da Segregação de Interface)
+# - D: Dependency Inversion Principle (Princípio da Inversão de Dependência)
+#
+# Os exemplos ruins vêm de `solid.ruins` e os bons dos submódulos de cada
+# princípio. Execute com `python -m solid`.
+
+import io
+import tempfile
+from array import array
+from contextlib import redirect_stdout
+
+from . import (
+    cadastro, deduplicacao, dip, fragmentacao, instrumentacao, isp, lsp, modelos, notificacoes, ocp, outbox, processos,
+    relatorios, resiliencia, ruins, srp,
+)
+
+
+class RegistroCadastro:
+    # Repositório e serviço de email do demo do pipeline: guardam o que fariam
+    def __init__(self):
+        self.lotes = []
+        self.emails = []
+
+    def salvar_lote(self, usuarios):
+        self.lotes.append(len(usuarios))
+        return True
+
+    def enviar_boas_vindas(self, usuario):
+        self.emails.append(usuario.email)
+        return True
+
+
+def demonstrar_srp():
+    print("### Princípio da Responsabilidade Única (SRP) ###")
+    print("Uma classe deve ter apenas uma única responsabilidade.")
+
+    print("Exemplo Ruim - Violando SRP:")
+
+    usuario = ruins.Usuario("Ana Silva", "ana@exemplo.com")
+    if usuario.validar_email():
+        usuario.salvar_no_banco()
+        usuario.enviar_email_boas_vindas()
+
+    print("\nExemplo Bom - Aplicando SRP:")
+
+    usuario = srp.Usuario("Ana Silva", "ana@exemplo.com")
+    if srp.ValidadorEmail.validar(usuario.email):
+        srp.RepositorioUsuario.salvar(usuario)
+        srp.ServicoEmail.enviar_boas_vindas(usuario)
+
+    print("\nValidando emails em lote:")
+
+    emails = ["ana@exemplo.com", "sem-arroba.com", "joao@exemplo", "maria.souza@empresa.com.br"]
+    mascara = srp.ValidadorEmail.validar_lote(emails)
+    for email, valido in zip(emails, mascara):
+        print(f"{email}: {'válido' if valido else 'inválido'}")
+
+    print("\nGuardando muitos usuários em colunas compactas:")
+
+    usuarios = srp.UsuarioStore()
+    usuarios.adicionar("Ana Silva", "ana@exemplo.com")
+    usuarios.adicionar("Carlos Silva", "carlos@exemplo.com")
+    for usuario in usuarios:
+        if srp.ValidadorEmail.validar(usuario.email):
+            srp.RepositorioUsuario.salvar(usuario)
+    print(f"UsuarioStore ocupa {usuarios.tamanho_em_bytes()} bytes para {len(usuarios)} usuários")
+
+    print("\nCadastrando usuários em fluxo, com filas limitadas entre os estágios:")
+
+    # Os estágios rodam em threads: eles só anotam o que fizeram e a thread
+    # principal imprime depois, sempre na mesma ordem
+    registro = RegistroCadastro()
+    pipeline = cadastro.PipelineCadastro(registro, registro, tamanho_lote=2, trabalhadores_email=1)
+    metricas = pipeline.executar([
+        ("Ana Silva", "ana@exemplo.com"),
+        ("João", "joao@exemplo"),
+        ("Maria Souza", "maria.souza@empresa.com.br"),
+    ])
+    for tamanho in registro.lotes:
+        print(f"Salvando {tamanho} usuários no banco de dados em um único lote...")
+    for email in sorted(registro.emails):
+        print(f"Enviando email de boas-vindas para {email}...")
+    print(f"{metricas['validos']} cadastrados, {metricas['invalidos']} inválido(s), {metricas['emails']} emails")
+
+
+def demonstrar_ocp():
+    print("\n### Princípio Aberto/Fechado (OCP) ###")
+    print("Classes devem estar abertas para extensão, mas fechadas para modificação.")
+
+    print("\nExemplo Ruim - Violando OCP:")
+
+    # Se quisermos adicionar um novo tipo de cliente, precisamos modificar a classe existente
+    # o que viola o OCP
+
+    calculadora = ruins.CalculadoraDescontos()
+    produto = ocp.Produto("Laptop", 1000)
+    desconto_premium = calculadora.calcular_desconto(produto, "premium")
+    print(f"Desconto Premium para {produto.nome}: R${desconto_premium}")
+
+    print("\nExemplo Bom - Aplicando OCP:")
+
+    # Agora podemos adicionar novos tipos de clientes (como ClienteFidelidade)
+    # sem modificar a CalculadoraDescontos
+    calculadora = ocp.CalculadoraDescontos()
+    cliente_premium = ocp.ClientePremium()
+    desconto = calculadora.calcular_desconto(produto, cliente_premium)
+    print(f"Desconto Premium para {produto.nome}: R${desconto}")
+
+    cliente_fidelidade = ocp.ClienteFidelidade()
+    desconto = calculadora.calcular_desconto(produto, cliente_fidelidade)
+    print(f"Desconto Fidelidade para {produto.nome}: R${desconto}")
+
+    print("\nCalculando descontos para um catálogo inteiro:")
+
+    codigos, taxas = ocp.CalculadoraDescontos.tabela_taxas()
+    precos = array("d", [1000, 250, 80])
+    codigos_clientes = array("B", [codigos["ClientePremium"], codigos["ClienteVIP"], codigos["ClienteFidelidade"]])
+    print(f"Descontos: {list(calculadora.calcular_descontos(precos, codigos_clientes, taxas))}")
+
+    print("\nGuardando um catálogo grande em colunas compactas:")
+
+    catalogo = ocp.ProdutoStore()
+    laptop = catalogo.adicionar("Laptop", 1000)
+    print(f"Desconto Premium para {laptop.nome}: R${calculadora.calcular_desconto(laptop, ocp.ClientePremium())}")
+    # A coluna de preços alimenta direto o cálculo colunar de descontos
+    print(f"Descontos do catálogo: {list(calculadora.calcular_descontos(catalogo.precos, [codigos['ClienteVIP']]))}")
+
+    print("\nRegistro de tipos de cliente com instâncias compartilhadas:")
+
+    print(f"Tipos registrados: {list(ocp.Cliente.tipos)}")
+    print(f"Desconto VIP para Laptop: R${calculadora.calcular_desconto_por_tipo(1000, 'ClienteVIP')}")
+
+    class ClienteBlackFriday(ocp.Cliente):
+        def obter_taxa_desconto(self):
+            return 0.30
+
+    print(f"Taxa Black Friday: {ocp.Cliente.taxas['ClienteBlackFriday']}")
+
+    # Redefinir a classe recarrega apenas a taxa dela; as demais continuam em cache
+    class ClienteBlackFriday(ocp.Cliente):
+        def obter_taxa_desconto(self):
+            return 0.40
+
+    print(f"Taxa Black Friday recarregada: {ocp.Cliente.taxas['ClienteBlackFriday']}")
+    print(f"Taxas em cache: {dict(ocp.Cliente.taxas)}")
+
+    print("\nExportando o relatório de usuários com a ExportadorFactory:")
+
+    exportador = relatorios.ExportadorFactory.criar_exportador("HTML")
+    relatorio = relatorios.RelatorioUsuarios(exportador)
+    relatorio.gerar()
+    usuarios = [srp.Usuario(f"Usuário {i}", f"usuario{i}@exemplo.com") for i in range(250)]
+    with tempfile.TemporaryDirectory() as diretorio:
+        destino = f"{diretorio}/usuarios{exportador.extensao}"
+        relatorio.gerar_arquivo(usuarios, destino, tamanho_bloco=100, processos=1)
+        # Só o bloco com o usuário alterado é renderizado de novo
+        usuarios[150] = srp.Usuario("Usuária Renomeada", "usuario150@exemplo.com")
+        resultado = relatorio.gerar_arquivo(usuarios, destino, tamanho_bloco=100, processos=1)
+    print(f"Seções renderizadas: {resultado['renderizadas']}, reaproveitadas: {resultado['reaproveitadas']}")
+
+
+def demonstrar_lsp():
+    print("\n### Princípio da Substituição de Liskov (LSP) ###")
+    print("Subclasses devem ser substituíveis por suas classes base sem alterar o comportamento do programa.")
+
+    print("\nExemplo Ruim - Violando LSP:")
+
+    print("Usando Retângulo:")
+    ruins.imprimir_area(ruins.Retangulo(0, 0))
+
+    print("Usando Quadrado:")
+    ruins.imprimir_area(ruins.Quadrado(0))  # Viola LSP, pois o comportamento é diferente
+
+    print("\nExemplo Bom - Aplicando LSP:")
+
+    retangulo = lsp.Retangulo(5, 4)
+    quadrado = lsp.Quadrado(5)
+
+    print("Usando Retângulo:")
+    lsp.imprimir_area(retangulo)
+
+    print("Usando Quadrado:")
+    lsp.imprimir_area(quadrado)
+
+    print("\nCalculando áreas de muitas formas em colunas:")
+
+    lote = lsp.FormaBatch([lsp.Retangulo(5, 4), lsp.Quadrado(5), lsp.Retangulo(2, 3)])
+    print(f"Áreas: {list(lote.areas())}")
+    print(f"Área total: {lote.area_total()}")
+    print(f"Agregados: {lote.agregados()}")
+
+    class QuadradoEmCache(lsp.AreaEmCache, lsp.Quadrado):
+        pass
+
+    quadrado = QuadradoEmCache(5)
+    print(f"Área em cache: {quadrado.area_em_cache}")
+    quadrado.lado = 6
+    print(f"Área em cache após mudar o lado: {quadrado.area_em_cache}")
+
+
+def demonstrar_isp():
+    print("\n### Princípio da Segregação de Interface (ISP) ###")
+    print("É melhor ter muitas interfaces específicas do que uma interface geral.")
+
+    print("\nExemplo Ruim - Violando ISP:")
+
+    humano = ruins.Humano()
+    humano.trabalhar()
+    humano.comer()
+    humano.dormir()
+
+    robo = ruins.Robo()
+    robo.trabalhar()
+    # robo.comer()  # Isso causaria um erro
+
+    print("\nExemplo Bom - Aplicando ISP:")
+
+    humano = isp.Humano()
+    humano.trabalhar()
+    humano.comer()
+    humano.dormir()
+
+    robo = isp.Robo()
+    robo.trabalhar()
+    # Agora não temos métodos desnecessários na classe Robo
+
+    print("\nIndexando trabalhadores por capacidade e distribuindo tarefas:")
+
+    registro = isp.RegistroTrabalhadores()
+    for trabalhador in [isp.Humano(), isp.Robo(), isp.Robo()]:
+        registro.registrar(trabalhador)
+    print(f"Podem trabalhar: {len(registro.capazes('trabalhar'))}, podem comer: {len(registro.capazes('comer'))}")
+    tarefas = ["trabalhar", "trabalhar", "trabalhar", "comer"]
+    # As tarefas rodam em threads e imprimiriam intercaladas: a saída delas é descartada
+    # e a thread principal relata quem fez cada tarefa, na ordem das tarefas
+    with redirect_stdout(io.StringIO()):
+        metricas = isp.EscalonadorTarefas(registro, threads=2).executar(tarefas)
+    for capacidade, trabalhador in zip(tarefas, metricas["atribuicoes"]):
+        print(f"{capacidade}: {type(trabalhador).__name__}")
+    print(f"Tarefas por capacidade: {metricas['por_capacidade']}")
+
+
+def demonstrar_dip():
+    print("\n### Princípio da Inversão de Dependência (DIP) ###")
+    print("Módulos de alto nível não devem depender de módulos de baixo nível. Ambos devem depender de abstrações.")
+
+    print("\nExemplo Ruim - Violando DIP:")
+
+    # Se quisermos mudar para outro banco de dados, precisamos modificar ServicoUsuario
+    usuario = srp.Usuario("Carlos Silva", "carlos@exemplo.com")
+    servico = ruins.ServicoUsuario()
+    servico.salvar_usuario(usuario)
+
+    print("\nExemplo Bom - Aplicando DIP:")
+
+    # Usando MySQL
+    servico_mysql = dip.ServicoUsuario(dip.MySQLDatabase())
+    servico_mysql.salvar_usuario(usuario)
+
+    # Usando PostgreSQL
+    servico_postgres = dip.ServicoUsuario(dip.PostgreSQLDatabase())
+    servico_postgres.salvar_usuario(usuario)
+
+    # O segundo usuário reaproveita o comando preparado que está no cache do banco
+    servico_postgres.salvar_usuario(srp.Usuario("Ana Silva", "ana@exemplo.com"))
+    comandos = servico_postgres.db.comandos
+    print(f"Cache de comandos: {comandos.acertos} acerto(s), {comandos.faltas} falta(s)")
+
+    print("\nSalvando usuários em lote:")
+
+    # Um INSERT com várias linhas por lote, usando o marcador de cada banco
+    metricas = servico_mysql.salvar_lote([usuario, srp.Usuario("Ana Silva", "ana@exemplo.com")])
+    print(f"{metricas['usuarios']} usuários salvos ({metricas['linhas_por_segundo']:,.0f} linhas/s)")
+
+    print("\nLendo usuários com cache na frente do repositório:")
+
+    database = dip.SQLiteDatabase()
+    database.conectar()
+    database.executar_query("CREATE TABLE usuarios (nome TEXT, email TEXT)")
+    repositorio = dip.RepositorioComCache(dip.RepositorioUsuariosSQL(database), ttl=60, ttl_negativo=5)
+    repositorio.salvar(usuario)
+    for email in ["carlos@exemplo.com", "carlos@exemplo.com", "ninguem@exemplo.com", "ninguem@exemplo.com"]:
+        encontrado = repositorio.buscar(email)
+        print(f"{email}: {encontrado.nome if encontrado else 'não encontrado'}")
+    print(f"Métricas do cache: {repositorio.metricas()}")
+
+    print("\nDistribuindo usuários entre vários bancos pelo email:")
+
+    fragmentos = {"sqlite1": dip.SQLiteDatabase(), "sqlite2": dip.SQLiteDatabase(), "sqlite3": dip.SQLiteDatabase()}
+    with fragmentacao.DatabaseFragmentada(fragmentos) as database:
+        # O ServicoUsuario não sabe que há mais de um banco
+        database.conectar()
+        database.executar_query("CREATE TABLE usuarios (nome TEXT, email TEXT)")
+        servico = dip.ServicoUsuario(database)
+        metricas = servico.salvar_lote([srp.Usuario(f"Usuário {i}", f"usuario{i}@exemplo.com") for i in range(9)])
+        print(f"{metricas['usuarios']} usuários salvos")
+        contagens = [linha[0] for linha in database.executar_query("SELECT COUNT(*) FROM usuarios")]
+        print(f"Usuários por fragmento: {contagens}")
+        print(f"usuario4@exemplo.com está em {database.fragmento('usuario4@exemplo.com')}")
+
+
+def demonstrar_notificacoes():
+    print("\n## SOLID como fundação para Design Patterns ##")
+    print("Vamos ver como a aplicação repetida dos princípios SOLID naturalmente nos leva a um design pattern.")
+
+    print("\n# Exemplo: Sistema de Notificações")
+    print("Começamos com uma classe que viola vários princípios SOLID e evoluímos para uma solução que implementa o padrão Strategy sem pensar nele explicitamente.")
+
+    print("\nEstágio 1: Código Inicial (Ruim)")
+
+    notificador = ruins.GerenciadorNotificacoes()
+    notificador.enviar_notificacao("email", "Olá, seu pedido foi confirmado!", "cliente@exemplo.com")
+    notificador.enviar_notificacao("sms", "Seu código de verificação: 1234", "+5511999999999")
+
+    print("\nEstágio 2: Aplicando SRP")
+    print("Separamos cada tipo de notificação em sua própria classe")
+
+    # Cada canal ganhou sua classe (ruins.NotificadorEmail e as demais), mas o
+    # gerenciador ainda escolhe o canal num if/elif: veja ruins.GerenciadorNotificacoesSRP
+
+    print("\nEstágio 3: Aplicando OCP")
+    print("Tornamos o sistema aberto para extensão")
+
+    notificador = notificacoes.GerenciadorNotificacoes()
+    notificador.enviar_notificacao("email", "Olá, seu pedido foi confirmado!", "cliente@exemplo.com")
+
+    # Agora podemos adicionar novos tipos de notificação (como NotificadorWhatsApp)
+    # sem modificar o gerenciador
+    notificador.registrar_notificador("whatsapp", notificacoes.NotificadorWhatsApp())
+    notificador.enviar_notificacao("whatsapp", "Olá! Temos uma promoção para você!", "+5511999999999")
+
+    # O roteador compila os notificadores numa tabela de despacho congelada
+    roteador = notificacoes.RoteadorNotificacoes()
+    roteador.registrar_notificador("whatsapp", notificacoes.NotificadorWhatsApp())
+    roteador.enviar_notificacao("whatsapp", "Sua entrega chega hoje!", "+5511999999999")
+
+    print("\nDespachando notificações em paralelo com asyncio")
+
+    despachante = notificacoes.DespachanteNotificacoes(notificador, limites={"sms": 2})
+    resultados = despachante.enviar_lote([
+        ("email", "Olá, seu pedido foi confirmado!", "cliente@exemplo.com"),
+        ("sms", "Seu código de verificação: 1234", "+5511999999999"),
+        ("fax", "Este canal não existe", "+551133334444"),
+    ])
+    print(f"Resultados: {resultados}")
+
+    print("\nDistribuindo notificações entre processos pelo destinatário")
+
+    with processos.PoolProcessosNotificacao(processos=2) as pool:
+        resultados = dict(pool.enviar_lote([
+            ("email", "Olá, seu pedido foi confirmado!", "cliente@exemplo.com"),
+            ("push", "Seu pedido saiu para entrega", "cliente@exemplo.com"),
+            ("fax", "Este canal não existe", "+551133334444"),
+        ]))
+    print(f"Resultados: {[resultados[indice] for indice in sorted(resultados)]}")
+
+    print("\nAgrupando notificações em lotes por canal")
+
+    with notificacoes.BufferNotificacoes(notificador, tamanho_maximo=3, janela=0.05) as buffer:
+        for i in range(7):
+            buffer.enviar("email", "Promoção de fim de ano!", f"cliente{i}@exemplo.com")
+        buffer.enviar("sms", "Seu código de verificação: 1234", "+5511999999999")
+    print(f"Métricas: {buffer.metricas()}")
+
+    print("\nRenderizando um modelo compilado para vários destinatários")
+
+    catalogo = modelos.CatalogoModelos()
+    catalogo.registrar("pedido", "Olá {nome}, seu pedido {pedido} foi confirmado!")
+    notificador_modelos = modelos.NotificadorModelos(notificacoes.NotificadorEmail(), catalogo)
+    notificador_modelos.enviar_modelo_lote(
+        "pedido",
+        [{"nome": "Ana", "pedido": 41}, {"nome": "Bruno", "pedido": 42}],
+        ["ana@exemplo.com", "bruno@exemplo.com"],
+    )
+
+    print("\nDescartando notificações repetidas e agrupando as restantes em resumos")
+
+    deduplicado = deduplicacao.GerenciadorDeduplicado(notificador, deduplicacao.IndiceDeduplicacao(janela=60.0))
+    for _ in range(3):
+        deduplicado.enviar_notificacao("sms", "Seu código de verificação: 1234", "+5511999999999")
+    print(f"Métricas: {deduplicado.indice.metricas()}")
+
+    with deduplicacao.AgrupadorResumos(notificador) as agrupador:
+        agrupador.adicionar("email", "Seu pedido foi confirmado!", "cliente@exemplo.com")
+        agrupador.adicionar("email", "Seu pedido saiu para entrega", "cliente@exemplo.com")
+
+    print("\nEstágio 4: Aplicando DIP")
+    print("Invertemos a dependência fazendo com que o cliente injete o notificador")
+
+    servico_email = notificacoes.ServicoNotificacao(notificacoes.NotificadorEmail())
+    servico_email.notificar("Olá, seu pedido foi confirmado!", "cliente@exemplo.com")
+
+    servico_sms = notificacoes.ServicoNotificacao(notificacoes.NotificadorSMS())
+    servico_sms.notificar("Seu código de verificação: 1234", "+5511999999999")
+
+    print("\nGravando notificações numa outbox durável antes de enviar")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caixa = outbox.Outbox(diretorio)
+        servico_email = notificacoes.ServicoNotificacao(notificacoes.NotificadorEmail(), caixa)
+        servico_email.notificar("Olá, seu pedido foi confirmado!", "cliente@exemplo.com", chave="pedido-42")
+        # A mesma chave de idempotência não gera uma segunda entrega
+        servico_email.notificar("Olá, seu pedido foi confirmado!", "cliente@exemplo.com", chave="pedido-42")
+        caixa.fechar()
+
+        # Simulando um reinício: as mensagens não entregues são recuperadas do disco
+        caixa = outbox.Outbox(diretorio)
+        print(f"Mensagens recuperadas: {len(caixa)}")
+        consumidor = outbox.ConsumidorOutbox(caixa, notificacoes.NotificadorEmail())
+        caixa.aguardar_entregas()
+        consumidor.parar()
+        caixa.fechar()
+
+    print("\nEstágio 5: Versão Final")
+    print("Chegamos naturalmente ao padrão Strategy sem planejá-lo!")
+
+    contexto = notificacoes.ContextoNotificacao()
+
+    # Notificação por email
+    contexto.definir_estrategia(notificacoes.NotificacaoEmail())
+    contexto.enviar_notificacao("Seu pedido foi confirmado!", "cliente@exemplo.com")
+
+    # Notificação por SMS
+    contexto.definir_estrategia(notificacoes.NotificacaoSMS())
+    contexto.enviar_notificacao("Seu código de verificação: 1234", "+5511999999999")
+
+    # Fácil adicionar novas estratégias, como NotificacaoSlack
+    contexto.definir_estrategia(notificacoes.NotificacaoSlack())
+    contexto.enviar_notificacao("Nova tarefa atribuída a você!", "@usuario")
+
+    # Um contexto compartilhado entre threads: cada requisição escolhe a estratégia
+    # na chamada ou no seu contexto de execução, sem trocar a padrão das outras
+    compartilhado = notificacoes.ContextoNotificacaoConcorrente(notificacoes.NotificacaoEmail())
+    compartilhado.enviar_notificacao("Seu código de verificação: 1234", "+5511999999999", notificacoes.NotificacaoSMS())
+    with compartilhado.usando(notificacoes.NotificacaoPush()):
+        compartilhado.enviar_notificacao("Seu pedido chegou!", "dispositivo123")
+    compartilhado.enviar_notificacao("Seu pedido foi confirmado!", "cliente@exemplo.com")
+
+    # Retentativas, disjuntor e hedge envolvem qualquer estratégia sem alterá-la
+    resiliente = resiliencia.EstrategiaResiliente(
+        notificacoes.NotificacaoSMS(), alternativa=notificacoes.NotificacaoPush()
+    )
+    contexto.definir_estrategia(resiliente)
+    contexto.enviar_notificacao("Seu código de verificação: 5678", "+5511999999999")
+    print(f"Métricas de resiliência: {resiliente.metricas()}")
+
+    print("\nLimitando a taxa de envio de cada estratégia")
+
+    agendador = notificacoes.AgendadorNotificacoes(limites={notificacoes.NotificacaoSMS: 2}, limite_destinatario=5)
+    futuros = [
+        agendador.agendar(
+            notificacoes.NotificacaoSMS(), "Aproveite nossa promoção!", "+5511888888888",
+            notificacoes.AgendadorNotificacoes.MARKETING,
+        ),
+        agendador.agendar(notificacoes.NotificacaoSMS(), "Seu código de verificação: 1234", "+5511999999999"),
+    ]
+    # O primeiro result() espera a admissão; o segundo, o envio
+    for admissao in futuros:
+        admissao.result().result()
+    agendador.fechar()
+
+    print("\nMedindo chamadas e latência por estratégia")
+
+    registro = instrumentacao.instrumentar()
+    try:
+        contexto.definir_estrategia(notificacoes.NotificacaoEmail())
+        contexto.enviar_notificacao("Seu pedido foi enviado!", "cliente@exemplo.com")
+        contexto.definir_estrategia(notificacoes.NotificacaoPush())
+        contexto.enviar_notificacao("Seu pedido chegou!", "dispositivo123")
+    finally:
+        instrumentacao.desinstrumentar()
+    for serie, valores in registro.instantaneo().items():
+        print(f"{serie}: {valores['chamadas']} chamada(s), {valores['erros']} erro(s)")
+
+
+def concluir():
+    print("\n## Conclusão: SOLID e Design Patterns ##")
+    print("""
+Observamos como a aplicação iterativa dos princípios SOLID nos levou naturalmente ao Design Pattern Strategy:
+
+1. Começamos com uma classe que violava SRP (muitas responsabilidades)
+2. Aplicamos SRP separando as responsabilidades em classes diferentes
+3. Aplicamos OCP tornando o sistema extensível para novos tipos de notificação
+4. Aplicamos DIP invertendo as dependências
+5. O resultado final é exatamente o padrão Strategy, que emergiu naturalmente da aplicação dos princípios SOLID
+
+Os princípios SOLID são fundamentais porque:
+- Fornecem diretrizes claras para resolver problemas comuns de design
+- Ajudam a identificar quando um padrão de design é necessário
+- Muitas vezes resultam em estruturas que são equivalentes a padrões de design conhecidos
+- Permitem chegar às soluções corretas sem precisar memorizar catálogos de padrões
+
+Em vez de pensar "Preciso usar o padrão Strategy aqui", é melhor pensar "Como posso melhorar este código com SOLID?" - os padrões emergem naturalmente.
+""")
+
+
+def main():
+    demonstrar_srp()
+    demonstrar_ocp()
+    demonstrar_lsp()
+    demonstrar_isp()
+    demonstrar_dip()
+    demonstrar_notificacoes()
+    concluir()
@@ -0,0 +1,342 @@
+# D: Princípio da Inversão de Dependência (DIP)
+# ------------------------------------------
+# "Módulos de alto nível não devem depender de módulos de baixo nível. Ambos devem depender de abstrações."
+
+import queue
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+
+from .srp import Usuario
+
+
+def formatar_parametros(parametros):
+    # Parâmetros de texto, o caso comum, vão direto para o join; os outros passam por format
+    try:
+        return ", ".join(parametros)
+    except TypeError:
+        return ", ".join([f"{valor}" for valor in parametros])
+
+class ComandoPreparado:
+    def __init__(self, sql):
+        self.sql = sql
+
+class CacheComandos:
+    # LRU de comandos preparados, com contadores de acertos e faltas. A busca, a
+    # promoção e o despejo ficam no functools.lru_cache, em C e atômicos entre threads;
+    # numa falta simultânea o mesmo SQL pode ser compilado duas vezes, o que é inofensivo
+    def __init__(self, capacidade, compilar):
+        self.capacidade = capacidade
+        self.obter = lru_cache(maxsize=capacidade)(compilar)
+
+    @property
+    def acertos(self):
+        return self.obter.cache_info().hits
+
+    @property
+    def faltas(self):
+        return self.obter.cache_info().misses
+
+    def __len__(self):
+        return self.obter.cache_info().currsize
+
+class Database(ABC):
+    # Marcador de parâmetro usado nas queries parametrizadas
+    marcador = "?"
+    tamanho_cache_comandos = 128
+
+    @cached_property
+    def comandos(self):
+        # Cada instância representa uma conexão, então o cache é por conexão. É criado
+        # na primeira consulta, para que subclasses não precisem chamar super().__init__()
+        return CacheComandos(self.tamanho_cache_comandos, self.compilar)
+
+    @abstractmethod
+    def conectar(self):
+        pass
+    
+    @abstractmethod
+    def executar_query(self, query, parametros=()):
+        pass
+
+    @cached_property
+    def preparar(self):
+        # preparar(sql) é o próprio lru_cache do banco: depois do primeiro acesso a chamada
+        # vai direto para o C, sem um método Python no meio
+        return self.comandos.obter
+
+    def compilar(self, sql):
+        # Bancos que preparam comandos no servidor sobrescrevem este método
+        return ComandoPreparado(sql)
+
+    def executar(self, comando, parametros=()):
+        return self.executar_query(comando.sql, parametros)
+
+    def executar_lote(self, comando, linhas):
+        # O mesmo comando com vários conjuntos de parâmetros. Bancos com envio em
+        # lote (executemany) sobrescrevem este método.
+        for parametros in linhas:
+            self.executar(comando, parametros)
+
+class MySQLDatabase(Database):
+    marcador = "%s"
+
+    def conectar(self):
+        print("Conectando ao MySQL...")
+
+    def compilar(self, sql):
+        print(f"Preparando comando no MySQL: {sql}")
+        return ComandoPreparado(sql)
+
+    def executar_query(self, query, parametros=()):
+        # Query e parâmetros numa única escrita: o print domina o custo deste banco simulado
+        if parametros:
+            query = f"{query}\nParâmetros: {formatar_parametros(parametros)}"
+        print(f"Executando query no MySQL: {query}")
+
+class PostgreSQLDatabase(Database):
+    marcador = "%s"
+
+    def conectar(self):
+        print("Conectando ao PostgreSQL...")
+
+    def compilar(self, sql):
+        print(f"Preparando comando no PostgreSQL: {sql}")
+        return ComandoPreparado(sql)
+
+    def executar_query(self, query, parametros=()):
+        # Query e parâmetros numa única escrita: o print domina o custo deste banco simulado
+        if parametros:
+            query = f"{query}\nParâmetros: {formatar_parametros(parametros)}"
+        print(f"Executando query no PostgreSQL: {query}")
+
+class SQLiteDatabase(Database):
+    # Implementação real, útil para testar e medir localmente
+    def __init__(self, caminho=":memory:"):
+        super().__init__()
+        self.caminho = caminho
+        self.conexao = None
+
+    def conectar(self):
+        if self.conexao is None:
+            # O sqlite3 reaproveita o comando compilado quando o mesmo SQL é executado de novo
+            self.conexao = sqlite3.connect(
+                self.caminho, uri=self.caminho.startswith("file:"), check_same_thread=False,
+                cached_statements=self.tamanho_cache_comandos,
+            )
+        return self.conexao
+
+    def preparar(self, sql):
+        # O sqlite3 já guarda os comandos compilados de cada conexão (cached_statements);
+        # um LRU aqui só guardaria o texto do SQL, então o comando vai direto para ele
+        return ComandoPreparado(sql)
+
+    def executar_query(self, query, parametros=()):
+        with self.conexao:
+            return self.conexao.execute(query, parametros)
+
+    def executar_lote(self, comando, linhas):
+        # Todas as linhas numa única transação
+        with self.conexao:
+            return self.conexao.executemany(comando.sql, linhas)
+
+class PoolConexoes:
+    # Mantém no máximo `tamanho` conexões abertas e as reutiliza entre chamadas
+    def __init__(self, fabrica, tamanho=4):
+        self.fabrica = fabrica
+        self.livres = queue.LifoQueue()
+        self.vagas = threading.BoundedSemaphore(tamanho)
+
+    @contextmanager
+    def conexao(self):
+        with self.vagas:
+            try:
+                database = self.livres.get_nowait()
+            except queue.Empty:
+                database = self.fabrica()
+                database.conectar()
+            try:
+                yield database
+            finally:
+                self.livres.put(database)
+
+# Comandos usados a cada chamada, com {0} no lugar do marcador de parâmetro do banco
+SQL_INSERCAO = "INSERT INTO usuarios VALUES ({0}, {0})"
+SQL_BUSCA = "SELECT nome, email FROM usuarios WHERE email = {0}"
+
+class ServicoUsuario:
+    def __init__(self, database, pool=None):
+        # Dependência de abstração, não de implementação concreta
+        self.db = database
+        self.pool = pool
+        # O SQL é montado uma vez; o comando preparado vem sempre do cache do banco
+        self.sql_insercao = SQL_INSERCAO.format(database.marcador)
+    
+    def salvar_usuario(self, usuario):
+        db = self.db
+        db.conectar()
+        db.executar(db.preparar(self.sql_insercao), (usuario.nome, usuario.email))
+
+    def salvar_lote(self, usuarios, tamanho_lote=500):
+        inicio = time.perf_counter()
+        total = 0
+        if self.pool is not None:
+            with self.pool.conexao() as database:
+                total = self._inserir_em_lotes(database, usuarios, tamanho_lote)
+        else:
+            self.db.conectar()
+            total = self._inserir_em_lotes(self.db, usuarios, tamanho_lote)
+        duracao = time.perf_counter() - inicio
+        return {
+            "usuarios": total,
+            "duracao": duracao,
+            "linhas_por_segundo": total / duracao if duracao else 0.0,
+        }
+
+    def _inserir_em_lotes(self, database, usuarios, tamanho_lote):
+        total = 0
+        lote = []
+        for usuario in usuarios:
+            lote.append(usuario)
+            if len(lote) == tamanho_lote:
+                total += self._inserir(database, lote)
+                lote = []
+        if lote:
+            total += self._inserir(database, lote)
+        return total
+
+    def _inserir(self, database, lote):
+        # Um único INSERT com várias linhas e parâmetros, em vez de uma query por usuário
+        linha = f"({database.marcador}, {database.marcador})"
+        query = f"INSERT INTO usuarios VALUES {', '.join([linha] * len(lote))}"
+        parametros = [valor for usuario in lote for valor in (usuario.nome, usuario.email)]
+        database.executar(database.preparar(query), parametros)
+        return len(lote)
+
+class RepositorioUsuarios(ABC):
+    @abstractmethod
+    def salvar(self, usuario):
+        pass
+
+    @abstractmethod
+    def buscar(self, email):
+        # Retorna o usuário com esse email, ou None se não existir
+        pass
+
+class RepositorioUsuariosSQL(RepositorioUsuarios):
+    def __init__(self, database):
+        self.db = database
+        self.sql_insercao = SQL_INSERCAO.format(database.marcador)
+        self.sql_busca = SQL_BUSCA.format(database.marcador)
+
+    def salvar(self, usuario):
+        self.db.conectar()
+        self.db.executar(self.db.preparar(self.sql_insercao), (usuario.nome, usuario.email))
+
+    def buscar(self, email):
+        self.db.conectar()
+        cursor = self.db.executar(self.db.preparar(self.sql_busca), (email,))
+        linha = cursor.fetchone() if cursor is not None else None
+        return Usuario(*linha) if linha else None
+
+class LeituraEmAndamento:
+    # Uma consulta ao repositório que outras threads esperam em vez de repetir
+    def __init__(self):
+        self.pronta = threading.Event()
+        self.usuario = None
+        self.erro = None
+
+    def resultado(self):
+        self.pronta.wait()
+        if self.erro is not None:
+            raise self.erro
+        return self.usuario
+
+class RepositorioComCache(RepositorioUsuarios):
+    # Decorador de leitura com cache para qualquer RepositorioUsuarios
+    def __init__(self, repositorio, capacidade=10_000, ttl=60.0, ttl_negativo=5.0):
+        self.repositorio = repositorio
+        self.capacidade = capacidade
+        self.ttl = ttl
+        # Emails inexistentes também ficam em cache, por menos tempo
+        self.ttl_negativo = ttl_negativo
+        self.entradas = OrderedDict()
+        self.em_andamento = {}
+        self.trava = threading.Lock()
+        self.acertos = 0
+        self.acertos_negativos = 0
+        self.faltas = 0
+        self.buscas_repositorio = 0
+        self.tempo_total = 0.0
+
+    def buscar(self, email):
+        inicio = time.perf_counter()
+        with self.trava:
+            entrada = self.entradas.get(email)
+            if entrada is not None and entrada[0] > time.monotonic():
+                self.entradas.move_to_end(email)
+                self.acertos += 1
+                if entrada[1] is None:
+                    self.acertos_negativos += 1
+                self.tempo_total += time.perf_counter() - inicio
+                return entrada[1]
+            self.faltas += 1
+            # Várias faltas simultâneas para o mesmo email consultam o repositório uma única vez
+            leitura = self.em_andamento.get(email)
+            lider = leitura is None
+            if lider:
+                leitura = self.em_andamento[email] = LeituraEmAndamento()
+        if not lider:
+            usuario = leitura.resultado()
+        else:
+            usuario = self._carregar(email, leitura)
+        with self.trava:
+            self.tempo_total += time.perf_counter() - inicio
+        return usuario
+
+    def salvar(self, usuario):
+        self.repositorio.salvar(usuario)
+        with self.trava:
+            # Write-through: descarta a entrada e qualquer leitura em andamento, que pode estar velha
+            self.entradas.pop(usuario.email, None)
+            self.em_andamento.pop(usuario.email, None)
+
+    def metricas(self):
+        with self.trava:
+            consultas = self.acertos + self.faltas
+            return {
+                "acertos": self.acertos,
+                "acertos_negativos": self.acertos_negativos,
+                "faltas": self.faltas,
+                "buscas_repositorio": self.buscas_repositorio,
+                "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+                "latencia_media_ms": self.tempo_total * 1000 / consultas if consultas else 0.0,
+                "tamanho": len(self.entradas),
+            }
+
+    def _carregar(self, email, leitura):
+        try:
+            usuario = self.repositorio.buscar(email)
+        except Exception as erro:
+            with self.trava:
+                if self.em_andamento.get(email) is leitura:
+                    del self.em_andamento[email]
+            leitura.erro = erro
+            leitura.pronta.set()
+            raise
+        with self.trava:
+            self.buscas_repositorio += 1
+            if self.em_andamento.get(email) is leitura:
+                del self.em_andamento[email]
+                ttl = self.ttl if usuario is not None else self.ttl_negativo
+                self.entradas[email] = (time.monotonic() + ttl, usuario)
+                self.entradas.move_to_end(email)
+                while len(self.entradas) > self.capacidade:
+                    self.entradas.popitem(last=False)
+        leitura.usuario = usuario
+        leitura.pronta.set()
+        return usuario
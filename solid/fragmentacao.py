@@ -0,0 +1,329 @@
+# Usuários fragmentados entre vários bancos
+# -----------------------------------------
+# DatabaseFragmentada é um Database como os outros, então o ServicoUsuario e o
+# RepositorioUsuariosSQL a usam sem mudança. Por baixo, ela distribui os
+# usuários entre vários bancos (fragmentos) por hash consistente do email: cada
+# fragmento ocupa vários pontos de um anel, e adicionar ou remover um fragmento
+# só muda o dono das chaves vizinhas aos seus pontos. Inserções em lote são
+# divididas por fragmento e gravadas em paralelo na própria chamada, cada parte
+# com o INSERT de uma linha em executar_lote, para que o comando preparado de
+# cada fragmento seja sempre o mesmo. Quem grava muitos lotes seguidos pode
+# optar pelo EscritorFragmentado, que junta as linhas em blocos maiores por
+# fragmento. Consultas sem o email são espalhadas por todos os fragmentos e as
+# linhas, reunidas.
+
+import bisect
+import hashlib
+import re
+import threading
+
+from .dip import ComandoPreparado, Database
+
+PADRAO_INSERCAO = re.compile(
+    r"\s*INSERT\s+INTO\s+(?P<tabela>\S+)\s*(?:\((?P<colunas>[^)]*)\)\s*)?VALUES\s*(?P<linha>\([^)]*\))",
+    re.IGNORECASE,
+)
+
+
+def posicao_anel(chave):
+    # blake2b é estável entre processos, ao contrário de hash() para strings
+    return int.from_bytes(hashlib.blake2b(chave.encode(), digest_size=8).digest(), "big")
+
+
+class ComandoFragmentado(ComandoPreparado):
+    # SQL analisado uma única vez: para onde o comando vai e onde está a chave nos parâmetros
+    INSERCAO = "insercao"
+    CHAVE = "chave"
+    ESPALHAR = "espalhar"
+
+    def __init__(self, sql, tipo, indice_chave=None, sql_linha=None, colunas=None):
+        super().__init__(sql)
+        self.tipo = tipo
+        self.indice_chave = indice_chave
+        # Só para inserções: o INSERT de uma linha que os fragmentos recebem
+        self.sql_linha = sql_linha
+        self.colunas = colunas
+
+class ResultadoEspalhado:
+    # Linhas de todos os fragmentos, com a interface de cursor que os repositórios usam.
+    # Não há reagregação: um COUNT(*) devolve uma linha por fragmento.
+    def __init__(self, linhas):
+        self.linhas = linhas
+        self.posicao = 0
+
+    def fetchone(self):
+        if self.posicao >= len(self.linhas):
+            return None
+        self.posicao += 1
+        return self.linhas[self.posicao - 1]
+
+    def fetchall(self):
+        restantes = self.linhas[self.posicao:]
+        self.posicao = len(self.linhas)
+        return restantes
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+class DatabaseFragmentada(Database):
+    def __init__(self, fragmentos, coluna_chave="email", indice_chave=1, pontos_por_fragmento=64, threads=None):
+        # fragmentos: nome -> Database; os nomes definem os pontos no anel, então
+        # precisam ser estáveis entre execuções
+        super().__init__()
+        self.coluna_chave = coluna_chave
+        # Posição da chave numa linha de INSERT sem lista de colunas: usuarios (nome, email)
+        self.indice_chave = indice_chave
+        self.pontos_por_fragmento = pontos_por_fragmento
+        self.threads = threads
+        self.executor = None
+        self.trava = threading.Lock()
+        self.fragmentos = {}
+        self.travas = {}
+        self.anel = ((), ())
+        for nome, database in fragmentos.items():
+            self.adicionar_fragmento(nome, database)
+
+    def adicionar_fragmento(self, nome, database):
+        # Não move dados: chame rebalancear() depois para levar as chaves ao novo dono
+        marcadores = {fragmento.marcador for fragmento in self.fragmentos.values()} | {database.marcador}
+        if len(marcadores) > 1:
+            raise ValueError("Todos os fragmentos precisam usar o mesmo marcador de parâmetro")
+        with self.trava:
+            fragmentos = dict(self.fragmentos)
+            fragmentos[nome] = database
+            self.travas.setdefault(nome, threading.Lock())
+            self._publicar(fragmentos)
+
+    def remover_fragmento(self, nome, tabela=None):
+        # Com tabela, as linhas do fragmento removido vão para os novos donos; retorna quantas
+        with self.trava:
+            if nome not in self.fragmentos:
+                raise ValueError(f"Fragmento desconhecido: {nome}")
+            if len(self.fragmentos) == 1:
+                raise ValueError("Não é possível remover o último fragmento")
+            fragmentos = dict(self.fragmentos)
+            removido = fragmentos.pop(nome)
+            self._publicar(fragmentos)
+        if tabela is None:
+            return 0
+        return self._mover(removido, self.travas[nome], tabela, lambda dono: True)
+
+    def rebalancear(self, tabela):
+        # Percorre os fragmentos e move só as linhas cujo dono mudou; retorna quantas
+        movidas = 0
+        for nome, database in list(self.fragmentos.items()):
+            movidas += self._mover(database, self.travas[nome], tabela, lambda dono, nome=nome: dono != nome)
+        return movidas
+
+    def fragmento(self, chave):
+        pontos, nomes = self.anel
+        indice = bisect.bisect(pontos, posicao_anel(chave))
+        return nomes[indice % len(nomes)]
+
+    def conectar(self):
+        for database in self.fragmentos.values():
+            database.conectar()
+        return self
+
+    def executar_query(self, query, parametros=()):
+        return self.executar(self.preparar(query), parametros)
+
+    def compilar(self, sql):
+        insercao = PADRAO_INSERCAO.match(sql)
+        if insercao is not None:
+            colunas = insercao["linha"].count(self.marcador)
+            indice_chave = self.indice_chave
+            if insercao["colunas"]:
+                nomes = [coluna.strip() for coluna in insercao["colunas"].split(",")]
+                if self.coluna_chave not in nomes:
+                    return ComandoFragmentado(sql, ComandoFragmentado.ESPALHAR)
+                indice_chave = nomes.index(self.coluna_chave)
+            prefixo = sql[:insercao.start("linha")]
+            return ComandoFragmentado(
+                sql, ComandoFragmentado.INSERCAO, indice_chave,
+                sql_linha=prefixo + insercao["linha"], colunas=colunas,
+            )
+        # Só um filtro no WHERE roteia o comando: em UPDATE ... SET email = ?, o
+        # parâmetro é o valor novo, não o dono atual da linha
+        onde = re.search(r"\bWHERE\b", sql, re.IGNORECASE)
+        filtro = onde and re.compile(
+            rf"\b{re.escape(self.coluna_chave)}\s*=\s*{re.escape(self.marcador)}"
+        ).search(sql, onde.end())
+        if filtro and not re.search(r"\bOR\b", sql[onde.end():], re.IGNORECASE):
+            return ComandoFragmentado(sql, ComandoFragmentado.CHAVE, sql[:filtro.start()].count(self.marcador))
+        return ComandoFragmentado(sql, ComandoFragmentado.ESPALHAR)
+
+    def executar(self, comando, parametros=()):
+        if comando.tipo == ComandoFragmentado.INSERCAO:
+            return self._inserir(comando, parametros)
+        if comando.tipo == ComandoFragmentado.CHAVE:
+            return self._no_fragmento(self.fragmento(parametros[comando.indice_chave]), comando.sql, parametros)
+        # Sem a chave, o comando roda em todos os fragmentos ao mesmo tempo
+        resultados = self._em_paralelo([(nome, comando.sql, parametros) for nome in self.fragmentos])
+        linhas = []
+        for cursor in resultados:
+            if cursor is not None:
+                linhas += cursor.fetchall()
+        return ResultadoEspalhado(linhas)
+
+    def escritor(self, sql, tamanho_bloco=5_000):
+        # Opcional: acumula linhas de um INSERT e grava tamanho_bloco por vez em cada fragmento
+        comando = self.preparar(sql)
+        if comando.tipo != ComandoFragmentado.INSERCAO:
+            raise ValueError("O escritor só aceita comandos INSERT com a chave")
+        return EscritorFragmentado(self, comando, tamanho_bloco)
+
+    def fechar(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    @property
+    def marcador(self):
+        return next(iter(self.fragmentos.values())).marcador if self.fragmentos else Database.marcador
+
+    def _publicar(self, fragmentos):
+        # Copy-on-write: quem já leu o anel antigo termina a operação com ele
+        pontos = sorted(
+            (posicao_anel(f"{nome}#{ponto}"), nome)
+            for nome in fragmentos for ponto in range(self.pontos_por_fragmento)
+        )
+        self.fragmentos = fragmentos
+        self.anel = (tuple(posicao for posicao, _ in pontos), tuple(nome for _, nome in pontos))
+
+    def _inserir(self, comando, parametros):
+        # Gravado antes de retornar: com todas as linhas no mesmo fragmento, o INSERT
+        # original vai inteiro; senão cada fragmento recebe as suas numa transação
+        # própria, em paralelo. Se um fragmento falhar, os outros já gravaram.
+        por_fragmento = self.dividir(comando, parametros)
+        if len(por_fragmento) == 1:
+            return self._no_fragmento(next(iter(por_fragmento)), comando.sql, parametros)
+        self._em_paralelo(
+            [(nome, comando.sql_linha, linhas) for nome, linhas in por_fragmento.items()],
+            self._lote_no_fragmento,
+        )
+        return None
+
+    def dividir(self, comando, parametros):
+        # Parâmetros de um INSERT de várias linhas -> fragmento: linhas
+        colunas = comando.colunas
+        por_fragmento = {}
+        for inicio in range(0, len(parametros), colunas):
+            linha = tuple(parametros[inicio:inicio + colunas])
+            por_fragmento.setdefault(self.fragmento(linha[comando.indice_chave]), []).append(linha)
+        return por_fragmento
+
+    def _no_fragmento(self, nome, sql, parametros):
+        database = self.fragmentos[nome]
+        # Uma conexão por fragmento, usada por uma thread de cada vez
+        with self.travas[nome]:
+            return database.executar(database.preparar(sql), parametros)
+
+    def _lote_no_fragmento(self, nome, sql, linhas):
+        database = self.fragmentos[nome]
+        with self.travas[nome]:
+            return database.executar_lote(database.preparar(sql), linhas)
+
+    def _em_paralelo(self, tarefas, executar=None):
+        executar = executar or self._no_fragmento
+        if len(tarefas) == 1:
+            return [executar(*tarefas[0])]
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with self.trava:
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(self.threads)
+        futuros = [self.executor.submit(executar, *tarefa) for tarefa in tarefas]
+        return [futuro.result() for futuro in futuros]
+
+    def _mover(self, database, trava, tabela, deve_mover):
+        # Lê as linhas do fragmento e leva para o dono atual as que `deve_mover` aponta
+        # Escritas novas já vão para o dono atual, então só as linhas lidas aqui precisam mudar de lugar
+        with trava:
+            cursor = database.executar(database.preparar(f"SELECT * FROM {tabela}"))
+            if cursor is None:
+                return 0
+            linhas = cursor.fetchall()
+            indice = [descricao[0] for descricao in cursor.description].index(self.coluna_chave)
+        por_fragmento = {}
+        for linha in linhas:
+            dono = self.fragmento(linha[indice])
+            if deve_mover(dono):
+                por_fragmento.setdefault(dono, []).append(linha)
+        marcador = database.marcador
+        for dono, movidas in por_fragmento.items():
+            sql = f"INSERT INTO {tabela} VALUES ({', '.join([marcador] * len(movidas[0]))})"
+            self._lote_no_fragmento(dono, sql, movidas)
+            with trava:
+                apagar = database.preparar(f"DELETE FROM {tabela} WHERE {self.coluna_chave} = {marcador}")
+                database.executar_lote(apagar, [(movida[indice],) for movida in movidas])
+        return sum(len(movidas) for movidas in por_fragmento.values())
+
+class EscritorFragmentado:
+    # Para cargas grandes: as linhas ficam em memória por fragmento e cada
+    # fragmento grava tamanho_bloco linhas por transação. Nada é gravado antes de
+    # um bloco encher ou de descarregar(); use como gerenciador de contexto, que
+    # descarrega na saída sem erro. Linhas de um bloco que falhou continuam
+    # pendentes, e o erro sobe para quem chamou adicionar ou descarregar.
+    def __init__(self, database, comando, tamanho_bloco):
+        self.database = database
+        self.comando = comando
+        self.tamanho_bloco = tamanho_bloco
+        self.pendentes = {}
+        self.trava = threading.Lock()
+        self.gravadas = 0
+
+    def adicionar(self, parametros):
+        # parametros: os mesmos de um INSERT de uma ou mais linhas
+        cheios = []
+        with self.trava:
+            for nome, linhas in self.database.dividir(self.comando, parametros).items():
+                acumuladas = self.pendentes.setdefault(nome, [])
+                acumuladas += linhas
+                if len(acumuladas) >= self.tamanho_bloco:
+                    cheios.append((nome, self.pendentes.pop(nome)))
+        if cheios:
+            self._gravar(cheios)
+
+    def descarregar(self):
+        with self.trava:
+            pendentes, self.pendentes = list(self.pendentes.items()), {}
+        if pendentes:
+            self._gravar(pendentes)
+
+    def _gravar(self, blocos):
+        # Cada fragmento grava o seu bloco; os que falharem voltam para pendentes
+        erros = []
+
+        def gravar(nome, linhas):
+            try:
+                self.database._lote_no_fragmento(nome, self.comando.sql_linha, linhas)
+            except Exception as erro:
+                with self.trava:
+                    self.pendentes[nome] = linhas + self.pendentes.get(nome, [])
+                erros.append(erro)
+                return
+            with self.trava:
+                self.gravadas += len(linhas)
+
+        self.database._em_paralelo(blocos, gravar)
+        if erros:
+            raise erros[0]
+
+    def __len__(self):
+        with self.trava:
+            return sum(len(linhas) for linhas in self.pendentes.values())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, *excecao):
+        if tipo is None:
+            self.descarregar()
@@ -0,0 +1,204 @@
+# Instrumentação opcional dos pontos de entrada
+# --------------------------------------------
+# `instrumentar()` troca os métodos principais das estratégias e serviços por
+# versões que contam chamadas, erros e latência por componente (a estratégia,
+# o tipo de cliente ou o banco usado). `desinstrumentar()` devolve os métodos
+# originais, então com a instrumentação desligada o custo é zero.
+
+import bisect
+import functools
+import importlib
+import json
+import threading
+import time
+
+# Limites dos baldes do histograma de latência, em segundos
+BALDES_PADRAO = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+# (submódulo, classe, método, operação, parâmetros lidos, função que os recebe e devolve o componente)
+PONTOS = (
+    ("notificacoes", "ContextoNotificacao", "enviar_notificacao", "notificacao",
+     ("self",), lambda contexto: _tipo(contexto.estrategia)),
+    ("notificacoes", "ContextoNotificacaoConcorrente", "enviar_notificacao", "notificacao",
+     ("self", "estrategia"), lambda contexto, estrategia: _tipo(
+         estrategia or contexto.sobrescrita() or contexto.estrategia
+     )),
+    ("ocp", "CalculadoraDescontos", "calcular_desconto", "desconto",
+     ("cliente",), lambda cliente: _tipo(cliente)),
+    ("dip", "ServicoUsuario", "salvar_usuario", "salvar_usuario",
+     ("self",), lambda servico: _tipo(servico.db)),
+    ("srp", "RepositorioUsuario", "salvar", "repositorio_salvar",
+     (), lambda: "RepositorioUsuario"),
+)
+
+# Componente usado quando não dá para extraí-lo dos argumentos da chamada
+DESCONHECIDO = "desconhecido"
+
+
+def _tipo(objeto):
+    return DESCONHECIDO if objeto is None else type(objeto).__name__
+
+
+class Histograma:
+    def __init__(self, baldes=BALDES_PADRAO):
+        self.baldes = baldes
+        # Um contador por balde, mais o último para valores acima do maior limite
+        self.contagens = [0] * (len(baldes) + 1)
+        self.soma = 0.0
+
+    def registrar(self, valor):
+        self.contagens[bisect.bisect_left(self.baldes, valor)] += 1
+        self.soma += valor
+
+    def acumulado(self):
+        total = 0
+        for limite, contagem in zip(self.baldes + (float("inf"),), self.contagens):
+            total += contagem
+            yield limite, total
+
+class Serie:
+    def __init__(self, baldes):
+        self.chamadas = 0
+        self.erros = 0
+        self.latencia = Histograma(baldes)
+
+class RegistroMetricas:
+    def __init__(self, baldes=BALDES_PADRAO):
+        self.baldes = baldes
+        self.series = {}
+        self.trava = threading.Lock()
+
+    def registrar(self, operacao, componente, duracao, erro=False):
+        # Caminho quente: a série já existe quase sempre, então só o incremento fica sob a trava
+        serie = self.series.get((operacao, componente))
+        if serie is None:
+            with self.trava:
+                serie = self.series.setdefault((operacao, componente), Serie(self.baldes))
+        with self.trava:
+            serie.chamadas += 1
+            if erro:
+                serie.erros += 1
+            serie.latencia.registrar(duracao)
+
+    def instantaneo(self):
+        # Copia os números sob a trava e divide depois. Uma série recém-criada (ou
+        # de um registrar que ainda não incrementou) pode ter zero chamadas.
+        with self.trava:
+            series = [
+                (chave, serie.chamadas, serie.erros, serie.latencia.soma, list(serie.latencia.acumulado()))
+                for chave, serie in sorted(self.series.items())
+            ]
+        return {
+            f"{operacao}/{componente}": {
+                "chamadas": chamadas,
+                "erros": erros,
+                "taxa_erro": erros / chamadas if chamadas else 0.0,
+                "latencia_media_ms": soma * 1000 / chamadas if chamadas else 0.0,
+                "baldes": {
+                    ("+Inf" if limite == float("inf") else repr(limite)): total
+                    for limite, total in acumulado
+                },
+            }
+            for (operacao, componente), chamadas, erros, soma, acumulado in series
+        }
+
+    def exportar_json(self):
+        return json.dumps(self.instantaneo(), ensure_ascii=False, indent=2)
+
+    def exportar_prometheus(self):
+        # Cada família fica contígua, logo abaixo da sua linha # TYPE
+        with self.trava:
+            series = [
+                (f'operacao="{operacao}",componente="{componente}"', serie.chamadas, serie.erros,
+                 serie.latencia.soma, list(serie.latencia.acumulado()))
+                for (operacao, componente), serie in sorted(self.series.items())
+            ]
+        linhas = ["# TYPE solid_chamadas_total counter"]
+        linhas += [f"solid_chamadas_total{{{rotulos}}} {chamadas}" for rotulos, chamadas, *_ in series]
+        linhas.append("# TYPE solid_erros_total counter")
+        linhas += [f"solid_erros_total{{{rotulos}}} {erros}" for rotulos, _, erros, *_ in series]
+        linhas.append("# TYPE solid_latencia_segundos histogram")
+        for rotulos, chamadas, _, soma, acumulado in series:
+            for limite, total in acumulado:
+                le = "+Inf" if limite == float("inf") else repr(limite)
+                linhas.append(f'solid_latencia_segundos_bucket{{{rotulos},le="{le}"}} {total}')
+            linhas.append(f"solid_latencia_segundos_sum{{{rotulos}}} {soma}")
+            linhas.append(f"solid_latencia_segundos_count{{{rotulos}}} {chamadas}")
+        return "\n".join(linhas) + "\n"
+
+    def limpar(self):
+        with self.trava:
+            self.series.clear()
+
+# Métodos originais trocados por `instrumentar`, para poder desfazer a troca
+_originais = {}
+_trava = threading.Lock()
+
+
+def instrumentar(registro=None):
+    registro = registro or RegistroMetricas()
+    with _trava:
+        if _originais:
+            raise RuntimeError("Instrumentação já está ativa")
+        for submodulo, nome_classe, metodo, operacao, parametros, extrair in PONTOS:
+            classe = getattr(importlib.import_module(f".{submodulo}", __package__), nome_classe)
+            original = classe.__dict__[metodo]
+            _originais[classe, metodo] = original
+            medido = _medir(original, operacao, parametros, extrair, registro)
+            setattr(classe, metodo, staticmethod(medido) if isinstance(original, staticmethod) else medido)
+    return registro
+
+
+def desinstrumentar():
+    with _trava:
+        for (classe, metodo), original in _originais.items():
+            setattr(classe, metodo, original)
+        _originais.clear()
+
+
+def instrumentado():
+    return bool(_originais)
+
+
+def _medir(original, operacao, parametros, extrair, registro):
+    funcao = original.__func__ if isinstance(original, staticmethod) else original
+    componente = _componente(funcao, parametros, extrair)
+    relogio = time.perf_counter
+
+    @functools.wraps(funcao)
+    def medido(*args, **kwargs):
+        # O componente é resolvido antes da chamada, com a mesma estratégia que ela vai usar
+        rotulo = componente(args, kwargs)
+        inicio = relogio()
+        try:
+            resultado = funcao(*args, **kwargs)
+        except Exception:
+            registro.registrar(operacao, rotulo, relogio() - inicio, True)
+            raise
+        registro.registrar(operacao, rotulo, relogio() - inicio)
+        return resultado
+
+    return medido
+
+
+def _componente(funcao, parametros, extrair):
+    # A posição de cada parâmetro vem da assinatura (o code object, sem importar inspect),
+    # lida uma única vez; na chamada, o valor é pego da posição ou, se veio por nome, de kwargs
+    codigo = funcao.__code__
+    posicionais = codigo.co_varnames[:codigo.co_argcount]
+    padroes = funcao.__defaults__ or ()
+    padroes = {**dict(zip(posicionais[len(posicionais) - len(padroes):], padroes)), **(funcao.__kwdefaults__ or {})}
+    # Parâmetros só nomeados nunca vêm da posição
+    posicoes = [
+        (posicionais.index(nome) if nome in posicionais else float("inf"), nome, padroes.get(nome))
+        for nome in parametros
+    ]
+
+    def componente(args, kwargs):
+        # Argumentos inesperados viram "desconhecido": a instrumentação nunca troca o erro da chamada pelo seu
+        try:
+            return extrair(*[args[i] if i < len(args) else kwargs.get(nome, padrao) for i, nome, padrao in posicoes])
+        except Exception:
+            return DESCONHECIDO
+
+    return componente
@@ -0,0 +1,162 @@
+# I: Princípio da Segregação de Interface (ISP)
+# ------------------------------------------
+# "Muitas interfaces específicas são melhores do que uma interface geral"
+
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+
+
+class Trabalhador(ABC):
+    @abstractmethod
+    def trabalhar(self):
+        pass
+
+class Comedor(ABC):
+    @abstractmethod
+    def comer(self):
+        pass
+
+class Dorminhoco(ABC):
+    @abstractmethod
+    def dormir(self):
+        pass
+
+class Humano(Trabalhador, Comedor, Dorminhoco):
+    def trabalhar(self):
+        print("Humano trabalhando...")
+    
+    def comer(self):
+        print("Humano comendo...")
+    
+    def dormir(self):
+        print("Humano dormindo...")
+
+class Robo(Trabalhador):
+    def trabalhar(self):
+        print("Robô trabalhando...")
+
+class RegistroTrabalhadores:
+    # Capacidade -> interface que a fornece
+    CAPACIDADES = {"trabalhar": Trabalhador, "comer": Comedor, "dormir": Dorminhoco}
+
+    def __init__(self):
+        # Índice montado no registro: "quem sabe comer" é uma consulta, sem isinstance
+        self.indice = {capacidade: [] for capacidade in self.CAPACIDADES}
+        self.capacidades_por_classe = {}
+        self.total = 0
+
+    def registrar(self, trabalhador):
+        # As capacidades de cada classe são descobertas uma única vez
+        classe = type(trabalhador)
+        capacidades = self.capacidades_por_classe.get(classe)
+        if capacidades is None:
+            capacidades = self.capacidades_por_classe[classe] = tuple(
+                capacidade for capacidade, interface in self.CAPACIDADES.items()
+                if issubclass(classe, interface)
+            )
+        for capacidade in capacidades:
+            self.indice[capacidade].append(trabalhador)
+        self.total += 1
+        return capacidades
+
+    def capazes(self, capacidade):
+        try:
+            return self.indice[capacidade]
+        except KeyError:
+            raise ValueError("Capacidade desconhecida") from None
+
+    def __len__(self):
+        return self.total
+
+class EscalonadorTarefas:
+    # Distribui tarefas (nomes de capacidade) entre os trabalhadores capazes com um
+    # pool de threads; cada trabalhador executa uma tarefa por vez
+    def __init__(self, registro, threads=4):
+        self.registro = registro
+        self.threads = threads
+        self.condicao = threading.Condition()
+        self.ocupados = set()
+        self.proximo = {}
+
+    def executar(self, tarefas):
+        fila = queue.SimpleQueue()
+        quantidade = 0
+        for capacidade in tarefas:
+            if not self.registro.capazes(capacidade):
+                raise ValueError(f"Nenhum trabalhador registrado pode {capacidade}")
+            fila.put((quantidade, capacidade))
+            quantidade += 1
+
+        # Estatísticas por trabalhador: tarefas feitas e tempo ocupado
+        self.feitas = {}
+        self.tempo_ocupado = {}
+        self.por_capacidade = dict.fromkeys(self.registro.CAPACIDADES, 0)
+        self.erros = 0
+        # Quem executou cada tarefa, na ordem das tarefas, para relatar da thread principal
+        self.atribuicoes = [None] * quantidade
+        threads = [threading.Thread(target=self._trabalhar, args=(fila,)) for _ in range(self.threads)]
+        inicio = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duracao = time.perf_counter() - inicio
+
+        ocupado = sum(self.tempo_ocupado.values())
+        feitas = self.feitas.values()
+        return {
+            "tarefas": quantidade,
+            "erros": self.erros,
+            "duracao": duracao,
+            "tarefas_por_segundo": quantidade / duracao if duracao else 0.0,
+            # Fração do tempo das threads gasta executando tarefas (o resto é espera e escalonamento)
+            "utilizacao_threads": ocupado / (self.threads * duracao) if duracao else 0.0,
+            "trabalhadores_usados": len(self.feitas),
+            "tarefas_por_trabalhador": (min(feitas), max(feitas)) if feitas else (0, 0),
+            "por_capacidade": self.por_capacidade,
+            "atribuicoes": self.atribuicoes,
+        }
+
+    def _trabalhar(self, fila):
+        while True:
+            try:
+                indice, capacidade = fila.get_nowait()
+            except queue.Empty:
+                return
+            trabalhador = self._reservar(capacidade)
+            self.atribuicoes[indice] = trabalhador
+            inicio = time.perf_counter()
+            falhou = False
+            try:
+                getattr(trabalhador, capacidade)()
+            except Exception:
+                falhou = True
+            self._liberar(trabalhador, capacidade, time.perf_counter() - inicio, falhou)
+
+    def _reservar(self, capacidade):
+        # Round-robin entre os capazes, pulando quem já está ocupado com outra tarefa
+        capazes = self.registro.capazes(capacidade)
+        with self.condicao:
+            while True:
+                inicio = self.proximo.get(capacidade, 0)
+                for deslocamento in range(len(capazes)):
+                    indice = (inicio + deslocamento) % len(capazes)
+                    trabalhador = capazes[indice]
+                    if id(trabalhador) not in self.ocupados:
+                        self.ocupados.add(id(trabalhador))
+                        self.proximo[capacidade] = indice + 1
+                        return trabalhador
+                self.condicao.wait()
+
+    def _liberar(self, trabalhador, capacidade, duracao, falhou):
+        chave = id(trabalhador)
+        with self.condicao:
+            self.ocupados.discard(chave)
+            self.feitas[chave] = self.feitas.get(chave, 0) + 1
+            self.tempo_ocupado[chave] = self.tempo_ocupado.get(chave, 0.0) + duracao
+            self.por_capacidade[capacidade] += 1
+            self.erros += falhou
+            # Threads esperando capacidades diferentes dormem na mesma condição: todas reavaliam
+            self.condicao.notify_all()
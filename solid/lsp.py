@@ -0,0 +1,141 @@
+# L: Princípio da Substituição de Liskov (LSP)
+# -----------------------------------------
+# "Objetos de uma classe derivada devem poder substituir objetos da classe base sem afetar a corretude do programa"
+
+from abc import ABC, abstractmethod
+from functools import cached_property
+from itertools import accumulate, chain
+from operator import itemgetter, mul
+
+
+class Forma(ABC):
+    @abstractmethod
+    def area(self):
+        pass
+
+class AreaEmCache:
+    # Mixin opcional para formas cuja área é cara de calcular. Fica fora de Forma
+    # porque o __setattr__ pesa em toda atribuição, inclusive no __init__.
+    @cached_property
+    def area_em_cache(self):
+        return self.area()
+
+    def __setattr__(self, nome, valor):
+        super().__setattr__(nome, valor)
+        # Qualquer mudança nas medidas invalida a área guardada
+        self.__dict__.pop("area_em_cache", None)
+
+class Retangulo(Forma):
+    def __init__(self, largura, altura):
+        self.largura = largura
+        self.altura = altura
+    
+    def area(self):
+        return self.largura * self.altura
+
+class Quadrado(Forma):
+    def __init__(self, lado):
+        self.lado = lado
+    
+    def area(self):
+        return self.lado * self.lado
+
+def imprimir_area(forma):
+    print(f"Área da forma: {forma.area()}")
+
+class FormaBatch:
+    # Medidas de cada tipo de forma em colunas, com a fórmula vetorizada da área.
+    # As colunas são listas, e não array("d"), para que as áreas sejam idênticas
+    # às de area(), inclusive com inteiros grandes.
+    tipos = {}
+    # Classe concreta -> tipo registrado que ela usa, ou None se ela calcula a área
+    # do seu jeito; resolvido uma vez por classe
+    resolvidos = {}
+
+    @classmethod
+    def registrar(cls, tipo, atributos, calcular_areas):
+        cls.tipos[tipo] = (atributos, calcular_areas)
+        cls.resolvidos.clear()
+
+    @classmethod
+    def resolver(cls, classe):
+        # Uma subclasse (como as que usam AreaEmCache) usa as colunas do tipo registrado
+        # só se herdar dele o próprio area(); se sobrescrever area(), a fórmula
+        # registrada não vale para ela
+        if classe in cls.resolvidos:
+            return cls.resolvidos[classe]
+        tipo = next((base for base in classe.__mro__ if base in cls.tipos), None)
+        if tipo is not None and classe.area is not tipo.area:
+            tipo = None
+        cls.resolvidos[classe] = tipo
+        return tipo
+
+    def __init__(self, formas=()):
+        # Grupo -> colunas; o grupo é o tipo registrado ou, para formas com area()
+        # própria, a classe, cuja única coluna guarda as áreas já calculadas
+        self.colunas = {}
+        # Índice do grupo de cada forma, na ordem de adição
+        self.indices = {}
+        self.ordem = []
+        self.reordenar = None
+        for forma in formas:
+            self.adicionar(forma)
+
+    def adicionar(self, forma):
+        # Guarda uma cópia das medidas atuais; mudanças posteriores na forma não afetam o lote
+        classe = type(forma)
+        tipo = self.resolver(classe)
+        if tipo is None:
+            if not isinstance(forma, Forma):
+                raise ValueError(f"Tipo de forma não registrado: {classe.__name__}")
+            grupo, valores = classe, (forma.area(),)
+        else:
+            grupo, valores = tipo, [getattr(forma, atributo) for atributo in self.tipos[tipo][0]]
+        colunas = self.colunas.get(grupo)
+        if colunas is None:
+            colunas = self.colunas[grupo] = [[] for _ in valores]
+            self.indices[grupo] = len(self.indices)
+        for coluna, valor in zip(colunas, valores):
+            coluna.append(valor)
+        self.ordem.append(self.indices[grupo])
+        self.reordenar = None
+
+    def __len__(self):
+        return len(self.ordem)
+
+    def areas_por_tipo(self):
+        return {grupo: list(areas) for grupo, areas in zip(self.colunas, self._calcular())}
+
+    def areas(self):
+        # Áreas na mesma ordem em que as formas foram adicionadas
+        if len(self.colunas) < 2:
+            return list(chain.from_iterable(self._calcular()))
+        if self.reordenar is None:
+            # Posição de cada forma na concatenação das áreas de todos os grupos,
+            # calculada uma vez; o itemgetter faz a reordenação toda em C
+            inicios = list(accumulate((len(colunas[0]) for colunas in self.colunas.values()), initial=0))
+            posicoes = []
+            for grupo in self.ordem:
+                posicoes.append(inicios[grupo])
+                inicios[grupo] += 1
+            self.reordenar = itemgetter(*posicoes)
+        return list(self.reordenar(list(chain.from_iterable(self._calcular()))))
+
+    def area_total(self):
+        return sum(sum(areas) for areas in self._calcular())
+
+    def agregados(self):
+        return {
+            tipo.__name__: {"quantidade": len(areas), "total": sum(areas), "maior": max(areas)}
+            for tipo, areas in self.areas_por_tipo().items()
+        }
+
+    def _calcular(self):
+        # Um iterável de áreas por grupo, na ordem em que os grupos apareceram
+        return [
+            self.tipos[grupo][1](*colunas) if grupo in self.tipos else colunas[0]
+            for grupo, colunas in self.colunas.items()
+        ]
+
+FormaBatch.registrar(Retangulo, ("largura", "altura"), lambda larguras, alturas: map(mul, larguras, alturas))
+FormaBatch.registrar(Quadrado, ("lado",), lambda lados: map(mul, lados, lados))
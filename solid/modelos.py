@@ -0,0 +1,175 @@
+# Modelos de mensagem compilados
+# ------------------------------
+# Em vez de cada chamador montar o texto da campanha para cada destinatário, o
+# notificador recebe o id de um modelo e as variáveis de cada destinatário. O
+# modelo, na sintaxe de str.format ("Olá {nome}"), é compilado uma única vez
+# para uma função com uma f-string, e o catálogo guarda os compilados num LRU.
+# A renderização em lote roda como uma list comprehension só, sem uma chamada
+# de função por mensagem.
+
+import itertools
+import string
+import threading
+from collections import OrderedDict
+
+from .notificacoes import Notificador
+
+# Caracteres que não podem aparecer na especificação de formato, porque ela é
+# copiada para o código gerado
+PROIBIDOS_ESPECIFICACAO = frozenset("{}'\"\\\n\r")
+
+
+class ModeloCompilado:
+    def __init__(self, texto):
+        self.texto = texto
+        # O mesmo texto é gerado duas vezes: lendo de um mapeamento (_v['nome']) e
+        # de variáveis soltas (_0), para as tuplas
+        pecas_mapa = []
+        pecas = []
+        campos = []
+        literais = []
+        for literal, campo, especificacao, conversao in string.Formatter().parse(texto):
+            if literal:
+                literais.append(literal)
+                pecas_mapa.append(repr(literal))
+                pecas.append(repr(literal))
+            if campo is None:
+                continue
+            if not campo.isidentifier():
+                raise ValueError(f"Campo de modelo inválido: {campo!r}")
+            if conversao not in (None, "r", "s", "a"):
+                raise ValueError(f"Conversão de modelo inválida: {conversao!r}")
+            if especificacao and not PROIBIDOS_ESPECIFICACAO.isdisjoint(especificacao):
+                raise ValueError(f"Especificação de formato inválida: {especificacao!r}")
+            if campo not in campos:
+                campos.append(campo)
+            conversao = f"!{conversao}" if conversao else ""
+            especificacao = f":{especificacao}" if especificacao else ""
+            pecas_mapa.append(f'f"{{_v[{campo!r}]{conversao}{especificacao}}}"')
+            pecas.append(f'f"{{_{campos.index(campo)}{conversao}{especificacao}}}"')
+        self.campos = tuple(campos)
+        # Texto final de um modelo sem campos, já com as chaves escapadas ("{{")
+        # desfeitas pelo parse
+        self.literal = "".join(literais)
+        # Literais e f-strings lado a lado viram uma única f-string na compilação
+        nomes = "".join(f"_{i}, " for i in range(len(campos)))
+        self._renderizar_mapas = eval(f"lambda lote: [{' '.join(pecas_mapa) or repr('')} for _v in lote]", {})
+        self._renderizar_tuplas = eval(f"lambda lote: [{' '.join(pecas) or repr('')} for ({nomes}) in lote]", {})
+
+    def renderizar(self, variaveis):
+        return self.renderizar_lote((variaveis,))[0]
+
+    def renderizar_lote(self, lote):
+        # lote: mapeamentos com (pelo menos) os campos do modelo
+        if not self.campos:
+            # Sem variáveis, todas as mensagens são o mesmo objeto str
+            return [self.literal] * len(lote)
+        return self._renderizar_mapas(lote)
+
+    def renderizar_tuplas(self, lote):
+        # lote: tuplas com os valores na ordem de self.campos, sem consulta a dicionários
+        return self._renderizar_tuplas(lote)
+
+class CatalogoModelos:
+    def __init__(self, capacidade=256):
+        self.capacidade = capacidade
+        self.textos = {}
+        self.compilados = OrderedDict()
+        self.trava = threading.Lock()
+        self.acertos = 0
+        self.compilacoes = 0
+        self.despejos = 0
+
+    def registrar(self, id_modelo, texto):
+        # Compila já no registro, para que um modelo inválido falhe aqui e não no envio
+        modelo = ModeloCompilado(texto)
+        with self.trava:
+            self.textos[id_modelo] = texto
+            self.compilacoes += 1
+            self._guardar(id_modelo, modelo)
+
+    def obter(self, id_modelo):
+        with self.trava:
+            modelo = self.compilados.get(id_modelo)
+            if modelo is not None:
+                self.compilados.move_to_end(id_modelo)
+                self.acertos += 1
+                return modelo
+            texto = self.textos.get(id_modelo)
+        if texto is None:
+            raise ValueError(f"Modelo não registrado: {id_modelo!r}")
+        # Despejado do cache: compila de novo fora da trava
+        modelo = ModeloCompilado(texto)
+        with self.trava:
+            self.compilacoes += 1
+            if self.textos.get(id_modelo) == texto:
+                self._guardar(id_modelo, modelo)
+        return modelo
+
+    def metricas(self):
+        with self.trava:
+            return {
+                "modelos": len(self.textos),
+                "compilados": len(self.compilados),
+                "acertos": self.acertos,
+                "compilacoes": self.compilacoes,
+                "despejos": self.despejos,
+            }
+
+    def _guardar(self, id_modelo, modelo):
+        self.compilados[id_modelo] = modelo
+        self.compilados.move_to_end(id_modelo)
+        while len(self.compilados) > self.capacidade:
+            self.compilados.popitem(last=False)
+            self.despejos += 1
+
+class NotificadorModelos(Notificador):
+    # Envolve um Notificador ou uma EstrategiaNotificacao e aceita id de modelo e
+    # variáveis no lugar da mensagem pronta. Como também é um Notificador, pode
+    # ser registrado num GerenciadorNotificacoes.
+    def __init__(self, destino, catalogo, tamanho_bloco=10_000):
+        self.destino = destino
+        self.catalogo = catalogo
+        # Renderiza no máximo tamanho_bloco mensagens por vez, para limitar a memória
+        self.tamanho_bloco = tamanho_bloco
+        self._entregar = getattr(destino, "enviar", None) or destino.notificar
+
+    def enviar(self, mensagem, destinatario):
+        self._entregar(mensagem, destinatario)
+
+    def enviar_lote(self, mensagem, destinatarios):
+        enviar_lote = getattr(self.destino, "enviar_lote", None)
+        if enviar_lote is not None:
+            enviar_lote(mensagem, destinatarios)
+        else:
+            for destinatario in destinatarios:
+                self._entregar(mensagem, destinatario)
+
+    def enviar_modelo(self, id_modelo, variaveis, destinatario):
+        self._entregar(self.catalogo.obter(id_modelo).renderizar(variaveis), destinatario)
+
+    def enviar_modelo_lote(self, id_modelo, variaveis, destinatarios):
+        # variaveis e destinatarios andam juntos, um mapeamento por destinatário; se um
+        # acabar antes do outro, levanta ValueError. A conferência é feita bloco a bloco,
+        # então os blocos anteriores à diferença já terão sido enviados
+        modelo = self.catalogo.obter(id_modelo)
+        if not modelo.campos:
+            destinatarios = list(destinatarios)
+            if sum(1 for _ in variaveis) != len(destinatarios):
+                raise ValueError("variaveis e destinatarios têm tamanhos diferentes")
+            self.enviar_lote(modelo.literal, destinatarios)
+            return len(destinatarios)
+        entregar = self._entregar
+        variaveis = iter(variaveis)
+        destinatarios = iter(destinatarios)
+        enviadas = 0
+        while True:
+            bloco = list(itertools.islice(variaveis, self.tamanho_bloco))
+            alvos = list(itertools.islice(destinatarios, len(bloco) or 1))
+            if len(alvos) != len(bloco):
+                raise ValueError("variaveis e destinatarios têm tamanhos diferentes")
+            if not bloco:
+                return enviadas
+            for mensagem, destinatario in zip(modelo.renderizar_lote(bloco), alvos, strict=True):
+                entregar(mensagem, destinatario)
+                enviadas += 1
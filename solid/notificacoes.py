@@ -0,0 +1,543 @@
+# Sistema de Notificações: de SOLID para o padrão Strategy
+# ------------------------------------------------------
+# Versões finais dos estágios 3 (OCP), 4 (DIP) e 5 (Strategy) da apresentação
+
+import functools
+import itertools
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from types import MappingProxyType
+
+
+class Notificador(ABC):
+    @abstractmethod
+    def enviar(self, mensagem, destinatario):
+        pass
+
+    def enviar_lote(self, mensagem, destinatarios):
+        # Canais sem envio em massa recaem no envio individual
+        for destinatario in destinatarios:
+            self.enviar(mensagem, destinatario)
+
+    def enviar_idempotente(self, mensagem, destinatario, chave):
+        # Uma reentrega (da outbox, por exemplo) chega com a mesma chave. Canais cujo
+        # provedor aceita chave de idempotência sobrescrevem este método.
+        self.enviar(mensagem, destinatario)
+
+class NotificadorEmail(Notificador):
+    def enviar(self, mensagem, destinatario):
+        print(f"Enviando email para {destinatario}: {mensagem}")
+        # Lógica específica de envio de email
+
+    def enviar_lote(self, mensagem, destinatarios):
+        print(f"Enviando email para {len(destinatarios)} destinatários: {mensagem}")
+
+class NotificadorSMS(Notificador):
+    def enviar(self, mensagem, destinatario):
+        print(f"Enviando SMS para {destinatario}: {mensagem}")
+        # Lógica específica de envio de SMS
+
+    def enviar_lote(self, mensagem, destinatarios):
+        print(f"Enviando SMS para {len(destinatarios)} destinatários: {mensagem}")
+
+class NotificadorPush(Notificador):
+    def enviar(self, mensagem, destinatario):
+        print(f"Enviando notificação push para {destinatario}: {mensagem}")
+        # Lógica específica de envio de push
+
+    def enviar_lote(self, mensagem, destinatarios):
+        print(f"Enviando notificação push para {len(destinatarios)} destinatários: {mensagem}")
+
+class GerenciadorNotificacoes:
+    def __init__(self):
+        self.notificadores = {
+            "email": NotificadorEmail(),
+            "sms": NotificadorSMS(),
+            "push": NotificadorPush()
+        }
+    
+    def enviar_notificacao(self, tipo, mensagem, destinatario):
+        if tipo not in self.notificadores:
+            raise ValueError("Tipo de notificação não suportado")
+        
+        notificador = self.notificadores[tipo]
+        notificador.enviar(mensagem, destinatario)
+    
+    def registrar_notificador(self, tipo, notificador):
+        self.notificadores[tipo] = notificador
+
+class NotificadorWhatsApp(Notificador):
+    def enviar(self, mensagem, destinatario):
+        print(f"Enviando WhatsApp para {destinatario}: {mensagem}")
+
+class RoteadorNotificacoes(GerenciadorNotificacoes):
+    # Gerenciador com uma tabela de despacho congelada: canal -> método enviar já ligado
+    def __init__(self):
+        super().__init__()
+        self.trava = threading.Lock()
+        self._compilar(self.notificadores)
+
+    def enviar_notificacao(self, tipo, mensagem, destinatario):
+        # Uma única consulta à tabela, sem trava: ela nunca muda depois de publicada
+        try:
+            enviar = self.tabela[tipo]
+        except KeyError:
+            raise ValueError("Tipo de notificação não suportado") from None
+        enviar(mensagem, destinatario)
+
+    def registrar_notificador(self, tipo, notificador):
+        # Copy-on-write: quem já leu a tabela antiga continua usando a antiga
+        with self.trava:
+            notificadores = dict(self.notificadores)
+            notificadores[sys.intern(tipo)] = notificador
+            self._compilar(notificadores)
+
+    def _compilar(self, notificadores):
+        # Chaves internadas: os literais dos chamadores são comparados por identidade
+        tabela = {sys.intern(tipo): notificador.enviar for tipo, notificador in notificadores.items()}
+        self.notificadores = notificadores
+        self.tabela = MappingProxyType(tabela)
+
+# asyncio custa dezenas de milissegundos para importar e só o despachante o usa,
+# então é carregado uma única vez, no primeiro despacho
+@functools.cache
+def _modulos_assincronos():
+    import asyncio
+    import inspect
+
+    return asyncio, inspect
+
+class NotificadorAssincrono(Notificador):
+    @abstractmethod
+    async def enviar(self, mensagem, destinatario):
+        pass
+
+    async def enviar_lote(self, mensagem, destinatarios):
+        for destinatario in destinatarios:
+            await self.enviar(mensagem, destinatario)
+
+class DespachanteNotificacoes:
+    def __init__(self, gerenciador, limites=None, limite_padrao=10, max_pendentes=1000):
+        self.gerenciador = gerenciador
+        # Quantos envios simultâneos cada canal aceita
+        self.limites = limites or {}
+        self.limite_padrao = limite_padrao
+        # Limita os envios em andamento para não ler o lote inteiro de uma vez
+        self.max_pendentes = max_pendentes
+
+    def enviar_lote(self, jobs):
+        asyncio, _ = _modulos_assincronos()
+        return asyncio.run(self.despachar(jobs))
+
+    async def despachar(self, jobs):
+        asyncio, _ = _modulos_assincronos()
+        # Semáforo e forma de envio de cada canal, resolvidos no primeiro job do canal
+        canais = {}
+        pendentes = asyncio.Semaphore(self.max_pendentes)
+        resultados = []
+        em_andamento = set()
+
+        for indice, (tipo, mensagem, destinatario) in enumerate(jobs):
+            await pendentes.acquire()
+            resultados.append(None)
+            if tipo not in canais:
+                canais[tipo] = (
+                    asyncio.Semaphore(self.limites.get(tipo, self.limite_padrao)),
+                    self._envio(tipo),
+                )
+            tarefa = asyncio.create_task(self._enviar(*canais[tipo], mensagem, destinatario))
+            tarefa.add_done_callback(
+                lambda tarefa, indice=indice: self._concluir(tarefa, indice, resultados, pendentes)
+            )
+            em_andamento.add(tarefa)
+            tarefa.add_done_callback(em_andamento.discard)
+
+        if em_andamento:
+            await asyncio.wait(em_andamento)
+        # Resultados na mesma ordem dos jobs; falhas aparecem como a própria exceção
+        return resultados
+
+    def _envio(self, tipo):
+        notificador = self.gerenciador.notificadores.get(tipo)
+        if notificador is None:
+            return None
+        asyncio, inspect = _modulos_assincronos()
+        if inspect.iscoroutinefunction(notificador.enviar):
+            return notificador.enviar
+        # Notificadores síncronos rodam no pool de threads padrão do loop
+        return functools.partial(asyncio.to_thread, notificador.enviar)
+
+    @staticmethod
+    async def _enviar(semaforo, envio, mensagem, destinatario):
+        if envio is None:
+            raise ValueError("Tipo de notificação não suportado")
+        async with semaforo:
+            return await envio(mensagem, destinatario)
+
+    @staticmethod
+    def _concluir(tarefa, indice, resultados, pendentes):
+        pendentes.release()
+        resultados[indice] = tarefa.exception() or tarefa.result()
+
+class BufferNotificacoes:
+    # Junta destinatários da mesma mensagem e canal e envia tudo de uma vez
+    # quando o lote enche ou quando a janela de tempo expira
+    def __init__(self, gerenciador, tamanho_maximo=500, janela=0.05):
+        self.gerenciador = gerenciador
+        self.tamanho_maximo = tamanho_maximo
+        self.janela = janela
+        self.pendentes = {}
+        self.condicao = threading.Condition()
+        self.fechado = False
+        self.lotes = 0
+        self.mensagens = 0
+        self.maior_lote = 0
+        self.atraso_total = 0.0
+        self.atraso_maximo = 0.0
+        self.lotes_com_falha = 0
+        self.mensagens_com_falha = 0
+        self.ultimo_erro = None
+        self.thread = threading.Thread(target=self._esvaziar_periodicamente, daemon=True)
+        self.thread.start()
+
+    def enviar(self, tipo, mensagem, destinatario):
+        if tipo not in self.gerenciador.notificadores:
+            raise ValueError("Tipo de notificação não suportado")
+        if isinstance(self.gerenciador.notificadores[tipo], NotificadorAssincrono):
+            # O buffer despacha em threads, sem loop de eventos: use o DespachanteNotificacoes
+            raise ValueError("Notificadores assíncronos não são suportados pelo buffer")
+        chave = (tipo, mensagem)
+        with self.condicao:
+            if self.fechado:
+                raise RuntimeError("Buffer de notificações já foi fechado")
+            grupo = self.pendentes.get(chave)
+            if grupo is None:
+                grupo = self.pendentes[chave] = (time.monotonic(), [])
+                self.condicao.notify()
+            grupo[1].append(destinatario)
+            if len(grupo[1]) < self.tamanho_maximo:
+                return
+            del self.pendentes[chave]
+        self._despachar(chave, grupo)
+
+    def fechar(self):
+        # Envia o que ainda estiver pendente antes de encerrar
+        with self.condicao:
+            self.fechado = True
+            self.condicao.notify()
+        self.thread.join()
+        for chave, grupo in list(self.pendentes.items()):
+            self._despachar_registrando(chave, grupo)
+        self.pendentes.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def metricas(self):
+        with self.condicao:
+            return {
+                "lotes": self.lotes,
+                "mensagens": self.mensagens,
+                "tamanho_medio_lote": self.mensagens / self.lotes if self.lotes else 0,
+                "maior_lote": self.maior_lote,
+                "atraso_medio_fila": self.atraso_total / self.lotes if self.lotes else 0,
+                "atraso_maximo_fila": self.atraso_maximo,
+                "lotes_com_falha": self.lotes_com_falha,
+                "mensagens_com_falha": self.mensagens_com_falha,
+                "ultimo_erro": self.ultimo_erro,
+            }
+
+    def _esvaziar_periodicamente(self):
+        while True:
+            with self.condicao:
+                vencidos = self._aguardar_vencidos()
+            if vencidos is None:
+                return
+            for chave, grupo in vencidos:
+                self._despachar_registrando(chave, grupo)
+
+    def _aguardar_vencidos(self):
+        while not self.fechado:
+            if not self.pendentes:
+                self.condicao.wait()
+                continue
+            agora = time.monotonic()
+            vencidos = [
+                chave for chave, (inicio, _) in self.pendentes.items()
+                if agora - inicio >= self.janela
+            ]
+            if vencidos:
+                return [(chave, self.pendentes.pop(chave)) for chave in vencidos]
+            mais_antigo = min(inicio for inicio, _ in self.pendentes.values())
+            self.condicao.wait(mais_antigo + self.janela - agora)
+        return None
+
+    def _despachar_registrando(self, chave, grupo):
+        # Na thread de esvaziamento e no fechar, uma falha fica só nas métricas:
+        # subir a exceção mataria a thread e pararia os envios por janela de tempo
+        try:
+            self._despachar(chave, grupo)
+        except Exception:
+            pass
+
+    def _despachar(self, chave, grupo):
+        tipo, mensagem = chave
+        inicio, destinatarios = grupo
+        atraso = time.monotonic() - inicio
+        try:
+            self.gerenciador.notificadores[tipo].enviar_lote(mensagem, destinatarios)
+        except Exception as erro:
+            with self.condicao:
+                self.lotes_com_falha += 1
+                self.mensagens_com_falha += len(destinatarios)
+                self.ultimo_erro = erro
+            raise
+        with self.condicao:
+            self.lotes += 1
+            self.mensagens += len(destinatarios)
+            self.maior_lote = max(self.maior_lote, len(destinatarios))
+            self.atraso_total += atraso
+            self.atraso_maximo = max(self.atraso_maximo, atraso)
+
+class ServicoNotificacao:
+    def __init__(self, notificador, outbox=None):
+        self.notificador = notificador
+        self.outbox = outbox
+    
+    def notificar(self, mensagem, destinatario, chave=None):
+        if self.outbox is None:
+            self.notificador.enviar(mensagem, destinatario)
+            return None
+        # Com outbox, só gravamos a mensagem; a entrega fica com o ConsumidorOutbox
+        return self.outbox.enfileirar(mensagem, destinatario, chave)
+
+# Strategy Pattern: Interface de estratégia
+class EstrategiaNotificacao(ABC):
+    @abstractmethod
+    def notificar(self, mensagem, destinatario):
+        pass
+
+# Estratégias concretas
+class NotificacaoEmail(EstrategiaNotificacao):
+    def notificar(self, mensagem, destinatario):
+        print(f"Enviando email para {destinatario}: {mensagem}")
+
+class NotificacaoSMS(EstrategiaNotificacao):
+    def notificar(self, mensagem, destinatario):
+        print(f"Enviando SMS para {destinatario}: {mensagem}")
+
+class NotificacaoPush(EstrategiaNotificacao):
+    def notificar(self, mensagem, destinatario):
+        print(f"Enviando push para {destinatario}: {mensagem}")
+
+class NotificacaoSlack(EstrategiaNotificacao):
+    def notificar(self, mensagem, destinatario):
+        print(f"Enviando mensagem no Slack para {destinatario}: {mensagem}")
+
+# Contexto que usa a estratégia
+class ContextoNotificacao:
+    def __init__(self, estrategia=None):
+        self.estrategia = estrategia
+    
+    def definir_estrategia(self, estrategia):
+        self.estrategia = estrategia
+    
+    def enviar_notificacao(self, mensagem, destinatario):
+        if self.estrategia is None:
+            raise ValueError("Estratégia de notificação não definida")
+        self.estrategia.notificar(mensagem, destinatario)
+
+# Estratégias definidas com ContextoNotificacaoConcorrente.usando no contexto de execução
+# atual, numa cadeia (contexto, estratégia, anteriores) com a mais interna primeiro.
+# Uma única variável para o módulo: uma ContextVar por instância nunca seria liberada
+SOBRESCRITAS_ESTRATEGIA = ContextVar("sobrescritas_estrategia", default=None)
+
+class SobrescritaEstrategia:
+    # Gerenciador de contexto de ContextoNotificacaoConcorrente.usando; uma classe
+    # simples custa bem menos por requisição que um @contextmanager
+    __slots__ = ("contexto", "estrategia", "token")
+
+    def __init__(self, contexto, estrategia):
+        self.contexto = contexto
+        self.estrategia = estrategia
+
+    def __enter__(self):
+        self.token = SOBRESCRITAS_ESTRATEGIA.set(
+            (self.contexto, self.estrategia, SOBRESCRITAS_ESTRATEGIA.get())
+        )
+        return self.contexto
+
+    def __exit__(self, *excecao):
+        SOBRESCRITAS_ESTRATEGIA.reset(self.token)
+
+class ContextoNotificacaoConcorrente(ContextoNotificacao):
+    # Um contexto compartilhado por várias threads de requisição. A estratégia
+    # padrão é publicada com uma única atribuição; quem precisa de outra
+    # estratégia a passa na chamada ou a define só para o seu contexto de execução.
+    def usando(self, estrategia):
+        # Vale só para a thread (ou tarefa asyncio) atual, até o fim do bloco with
+        return SobrescritaEstrategia(self, estrategia)
+
+    def sobrescrita(self):
+        # Estratégia definida com usando no contexto de execução atual, ou None
+        sobrescrita = SOBRESCRITAS_ESTRATEGIA.get()
+        while sobrescrita is not None:
+            if sobrescrita[0] is self:
+                return sobrescrita[1]
+            sobrescrita = sobrescrita[2]
+        return None
+
+    def enviar_notificacao(self, mensagem, destinatario, estrategia=None):
+        # Prioridade: estratégia da chamada, depois a do contexto de execução, depois a padrão.
+        # Cada uma é lida uma única vez, então uma troca concorrente nunca divide um envio.
+        if estrategia is None:
+            sobrescrita = SOBRESCRITAS_ESTRATEGIA.get()
+            while sobrescrita is not None:
+                if sobrescrita[0] is self:
+                    estrategia = sobrescrita[1]
+                    break
+                sobrescrita = sobrescrita[2]
+            else:
+                estrategia = self.estrategia
+                if estrategia is None:
+                    raise ValueError("Estratégia de notificação não definida")
+        estrategia.notificar(mensagem, destinatario)
+
+class BaldeTokens:
+    def __init__(self, taxa, capacidade=None):
+        self.taxa = taxa
+        # Pelo menos 1 token, senão taxas abaixo de 1/s (1 SMS a cada 10 s) nunca admitiriam nada
+        self.capacidade = max(1, capacidade or taxa)
+        self.tokens = self.capacidade
+        self.atualizado = time.monotonic()
+
+    def espera(self, agora):
+        # Segundos até haver um token disponível (0 se já houver). Um balde criado
+        # depois de `agora` ser lido não anda para trás no tempo nem perde tokens
+        if agora > self.atualizado:
+            self.tokens = min(self.capacidade, self.tokens + (agora - self.atualizado) * self.taxa)
+            self.atualizado = agora
+        return 0 if self.tokens >= 1 else (1 - self.tokens) / self.taxa
+
+    def consumir(self):
+        self.tokens -= 1
+
+class AgendadorNotificacoes:
+    TRANSACIONAL = 0
+    MARKETING = 1
+
+    def __init__(self, limites=None, limite_padrao=100, limite_destinatario=None,
+                 max_varredura=64, max_destinatarios=10_000, trabalhadores_por_estrategia=1):
+        # limites: {classe da estratégia: mensagens por segundo}
+        self.limites = limites or {}
+        self.limite_padrao = limite_padrao
+        self.limite_destinatario = limite_destinatario
+        # Quantas mensagens de cada fila são examinadas procurando uma admissível
+        self.max_varredura = max_varredura
+        # Limite rígido de baldes por destinatário; o usado há mais tempo sai primeiro
+        self.max_destinatarios = max_destinatarios
+        self.baldes_estrategia = {}
+        self.baldes_destinatario = OrderedDict()
+        # A thread do agendador só decide a admissão; o envio roda num executor
+        # por classe de estratégia, para que um canal lento não atrase os outros
+        self.trabalhadores_por_estrategia = trabalhadores_por_estrategia
+        self.executores = {}
+        self.filas = {self.TRANSACIONAL: deque(), self.MARKETING: deque()}
+        self.condicao = threading.Condition()
+        self.ativo = True
+        self.admitidas = 0
+        self.thread = threading.Thread(target=self._executar, daemon=True)
+        self.thread.start()
+
+    def agendar(self, estrategia, mensagem, destinatario, prioridade=TRANSACIONAL):
+        # Não bloqueia. O Future devolvido é concluído quando a mensagem é admitida, e o
+        # resultado dele é o Future do envio, que roda no executor da estratégia:
+        # agendar(...).result() espera a admissão, agendar(...).result().result() o envio.
+        # Cancelar o Future antes da admissão descarta a mensagem.
+        admissao = Future()
+        with self.condicao:
+            if not self.ativo:
+                raise RuntimeError("Agendador de notificações já foi fechado")
+            self.filas[prioridade].append((estrategia, mensagem, destinatario, admissao))
+            self.condicao.notify()
+        return admissao
+
+    def fechar(self):
+        with self.condicao:
+            self.ativo = False
+            self.condicao.notify()
+        self.thread.join()
+        for fila in self.filas.values():
+            for *_, futuro in fila:
+                futuro.cancel()
+            fila.clear()
+        # As mensagens já admitidas terminam de ser enviadas
+        for executor in self.executores.values():
+            executor.shutdown()
+
+    def _executar(self):
+        while True:
+            with self.condicao:
+                item = self._proximo_admitido()
+            if item is None:
+                return
+            estrategia, mensagem, destinatario, admissao = item
+            if admissao.set_running_or_notify_cancel():
+                admissao.set_result(
+                    self._executor(type(estrategia)).submit(estrategia.notificar, mensagem, destinatario)
+                )
+
+    def _executor(self, tipo):
+        executor = self.executores.get(tipo)
+        if executor is None:
+            executor = self.executores[tipo] = ThreadPoolExecutor(
+                self.trabalhadores_por_estrategia, thread_name_prefix=f"agendador-{tipo.__name__}"
+            )
+        return executor
+
+    def _proximo_admitido(self):
+        while self.ativo:
+            agora = time.monotonic()
+            menor_espera = None
+            for prioridade in sorted(self.filas):
+                fila = self.filas[prioridade]
+                for posicao, item in enumerate(itertools.islice(fila, self.max_varredura)):
+                    baldes = self._baldes(item[0], item[2])
+                    espera = max(balde.espera(agora) for balde in baldes)
+                    if espera == 0:
+                        for balde in baldes:
+                            balde.consumir()
+                        del fila[posicao]
+                        self.admitidas += 1
+                        return item
+                    if menor_espera is None or espera < menor_espera:
+                        menor_espera = espera
+            # Dorme até o próximo token ou até chegar mensagem nova, sem espera ativa
+            self.condicao.wait(menor_espera)
+        return None
+
+    def _baldes(self, estrategia, destinatario):
+        tipo = type(estrategia)
+        if tipo not in self.baldes_estrategia:
+            self.baldes_estrategia[tipo] = BaldeTokens(self.limites.get(tipo, self.limite_padrao))
+        baldes = [self.baldes_estrategia[tipo]]
+        if self.limite_destinatario is not None:
+            balde = self.baldes_destinatario.get(destinatario)
+            if balde is None:
+                if len(self.baldes_destinatario) >= self.max_destinatarios:
+                    # Se o balde descartado não estava cheio, esse destinatário volta com um
+                    # balde cheio: o custo de manter a memória limitada
+                    self.baldes_destinatario.popitem(last=False)
+                balde = self.baldes_destinatario[destinatario] = BaldeTokens(self.limite_destinatario)
+            else:
+                self.baldes_destinatario.move_to_end(destinatario)
+            baldes.append(balde)
+        return baldes
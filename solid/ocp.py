@@ -0,0 +1,140 @@
+# O: Princípio Aberto/Fechado (OCP)
+# ------------------------------
+# "Entidades de software devem ser abertas para extensão, mas fechadas para modificação"
+
+from abc import ABC, abstractmethod
+from array import array
+from operator import mul
+
+from .colunas import ColunaTexto
+
+
+class Produto:
+    def __init__(self, nome, preco):
+        self.nome = nome
+        self.preco = preco
+
+class TabelaTaxas(dict):
+    # Preenchida sob demanda: a primeira consulta de cada tipo guarda a taxa
+    def __missing__(self, nome):
+        taxa = self[nome] = Cliente.instancia(nome).obter_taxa_desconto()
+        return taxa
+
+class Cliente(ABC):
+    # Registro preenchido automaticamente quando cada subclasse é criada
+    tipos = {}
+    instancias = {}
+    taxas = TabelaTaxas()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Cliente.tipos[cls.__name__] = cls
+        # Redefinir um tipo (por exemplo, ao recarregar o módulo) invalida só a entrada dele
+        Cliente.recarregar(cls.__name__)
+
+    @abstractmethod
+    def obter_taxa_desconto(self):
+        pass
+
+    @staticmethod
+    def instancia(nome):
+        # Flyweight: uma única instância compartilhada por tipo de cliente
+        if nome not in Cliente.instancias:
+            if nome not in Cliente.tipos:
+                raise ValueError("Tipo de cliente desconhecido")
+            Cliente.instancias[nome] = Cliente.tipos[nome]()
+        return Cliente.instancias[nome]
+
+    @staticmethod
+    def recarregar(nome):
+        Cliente.instancias.pop(nome, None)
+        Cliente.taxas.pop(nome, None)
+
+class ClienteRegular(Cliente):
+    def obter_taxa_desconto(self):
+        return 0.05
+
+class ClientePremium(Cliente):
+    def obter_taxa_desconto(self):
+        return 0.10
+
+class ClienteVIP(Cliente):
+    def obter_taxa_desconto(self):
+        return 0.15
+
+class CalculadoraDescontos:
+    def calcular_desconto(self, produto, cliente):
+        return produto.preco * cliente.obter_taxa_desconto()
+
+    def calcular_desconto_por_tipo(self, preco, tipo_cliente):
+        # Caminho quente: uma consulta ao registro, sem criar objetos
+        return preco * Cliente.taxas[tipo_cliente]
+
+    @staticmethod
+    def tabela_taxas():
+        # Código de cada tipo de cliente concreto e a taxa correspondente,
+        # incluindo subclasses criadas depois da calculadora
+        nomes = [nome for nome, tipo in Cliente.tipos.items() if not tipo.__abstractmethods__]
+        codigos = {nome: codigo for codigo, nome in enumerate(nomes)}
+        taxas = array("d", (Cliente.taxas[nome] for nome in nomes))
+        return codigos, taxas
+
+    def calcular_descontos(self, precos, codigos_clientes, taxas=None):
+        # Versão colunar: um array de preços e um de códigos de cliente
+        if taxas is None:
+            _, taxas = self.tabela_taxas()
+        # Um dicionário código -> taxa evita criar um float novo a cada leitura do array,
+        # e códigos negativos ou fora da tabela não viram um índice válido por engano
+        obter_taxa = dict(enumerate(taxas)).__getitem__
+        try:
+            return array("d", map(mul, precos, map(obter_taxa, codigos_clientes)))
+        except KeyError as erro:
+            raise ValueError(f"Código de cliente desconhecido: {erro.args[0]!r}") from None
+
+class ClienteFidelidade(Cliente):
+    def obter_taxa_desconto(self):
+        return 0.20
+
+class ProdutoView:
+    # Visão leve de uma linha do ProdutoStore, com a mesma interface de Produto
+    __slots__ = ("store", "indice")
+
+    def __init__(self, store, indice):
+        self.store = store
+        self.indice = indice
+
+    @property
+    def nome(self):
+        return self.store.nomes[self.indice]
+
+    @property
+    def preco(self):
+        return self.store.precos[self.indice]
+
+    @preco.setter
+    def preco(self, preco):
+        self.store.precos[self.indice] = preco
+
+class ProdutoStore:
+    def __init__(self):
+        self.nomes = ColunaTexto()
+        self.precos = array("d")
+
+    def adicionar(self, nome, preco):
+        self.nomes.append(nome)
+        self.precos.append(preco)
+        return ProdutoView(self, len(self.precos) - 1)
+
+    def __len__(self):
+        return len(self.precos)
+
+    def __getitem__(self, indice):
+        if not 0 <= indice < len(self):
+            raise IndexError("Produto fora do intervalo")
+        return ProdutoView(self, indice)
+
+    def __iter__(self):
+        return (ProdutoView(self, indice) for indice in range(len(self)))
+
+    def tamanho_em_bytes(self):
+        return self.nomes.tamanho_em_bytes() + self.precos.itemsize * len(self.precos)
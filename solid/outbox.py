@@ -0,0 +1,300 @@
+# Outbox durável para notificações
+# --------------------------------
+# O ServicoNotificacao grava cada mensagem num log em disco, mapeado em memória,
+# e consumidores em segundo plano fazem a entrega. Se o processo cair no meio do
+# envio, a mensagem continua no log e é entregue de novo (pelo menos uma vez).
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict, deque
+
+# Cada registro: tamanho do conteúdo, crc32 do conteúdo e o JSON da mensagem
+CABECALHO = struct.Struct("<II")
+
+
+class Segmento:
+    def __init__(self, caminho, tamanho):
+        novo = not os.path.exists(caminho)
+        self.caminho = caminho
+        self.arquivo = open(caminho, "w+b" if novo else "r+b")
+        if novo:
+            self.arquivo.truncate(tamanho)
+        self.mapa = mmap.mmap(self.arquivo.fileno(), 0)
+        self.posicao = 0
+        self.restantes = 0
+
+    def ler_registros(self):
+        # Para no primeiro registro vazio ou corrompido, que marca uma escrita interrompida
+        posicao = 0
+        while posicao + CABECALHO.size <= len(self.mapa):
+            tamanho, crc = CABECALHO.unpack_from(self.mapa, posicao)
+            inicio = posicao + CABECALHO.size
+            if tamanho == 0 or inicio + tamanho > len(self.mapa):
+                break
+            conteudo = self.mapa[inicio:inicio + tamanho]
+            if zlib.crc32(conteudo) != crc:
+                break
+            yield json.loads(conteudo)
+            posicao = inicio + tamanho
+        self.posicao = posicao
+        if any(self.mapa[posicao:posicao + CABECALHO.size]):
+            # Apaga o resto de uma escrita interrompida para não confundir a próxima leitura
+            self.mapa[posicao:] = bytes(len(self.mapa) - posicao)
+
+    def cabe(self, conteudo):
+        return self.posicao + CABECALHO.size + len(conteudo) <= len(self.mapa)
+
+    def gravar(self, conteudo):
+        CABECALHO.pack_into(self.mapa, self.posicao, len(conteudo), zlib.crc32(conteudo))
+        inicio = self.posicao + CABECALHO.size
+        self.mapa[inicio:inicio + len(conteudo)] = conteudo
+        self.posicao = inicio + len(conteudo)
+        self.restantes += 1
+
+    def sincronizar(self):
+        self.mapa.flush()
+
+    def fechar(self):
+        self.mapa.close()
+        self.arquivo.close()
+
+    def remover(self):
+        self.fechar()
+        os.remove(self.caminho)
+
+class Outbox:
+    def __init__(self, diretorio, tamanho_segmento=4 * 1024 * 1024,
+                 sincronizar_a_cada=256, intervalo_sincronizacao=0.05, max_entregues=100_000):
+        os.makedirs(diretorio, exist_ok=True)
+        self.diretorio = diretorio
+        self.tamanho_segmento = tamanho_segmento
+        # fsync em grupo: a cada N mensagens ou a cada intervalo, o que vier primeiro
+        self.sincronizar_a_cada = sincronizar_a_cada
+        self.intervalo_sincronizacao = intervalo_sincronizacao
+        self.condicao = threading.Condition()
+        self.segmentos = []
+        self.pendentes = deque()
+        self.em_envio = {}
+        # Chave de idempotência -> segmento onde a mensagem está gravada
+        self.conhecidas = {}
+        self.confirmadas = set()
+        # Chaves dos segmentos já compactados, da mais antiga para a mais nova. Uma
+        # delas enfileirada de novo é ignorada, como se ainda estivesse na outbox.
+        self.max_entregues = max_entregues
+        self.entregues = OrderedDict()
+        self.nao_sincronizadas = 0
+        self.aberta = True
+        self.parada = threading.Event()
+        self._recuperar()
+        self.thread = threading.Thread(target=self._sincronizar_periodicamente, daemon=True)
+        self.thread.start()
+
+    def enfileirar(self, mensagem, destinatario, chave=None):
+        chave = chave or uuid.uuid4().hex
+        conteudo = json.dumps(
+            {"chave": chave, "mensagem": mensagem, "destinatario": destinatario}
+        ).encode()
+        if CABECALHO.size + len(conteudo) > self.tamanho_segmento:
+            raise ValueError("Mensagem maior que o segmento da outbox")
+        with self.condicao:
+            if not self.aberta:
+                raise RuntimeError("Outbox já foi fechada")
+            if chave in self.conhecidas or chave in self.entregues:
+                # A mesma chave já está na outbox ou foi entregue há pouco: não grava nem entrega de novo
+                return chave
+            ativo = self.segmentos[-1]
+            if not ativo.cabe(conteudo):
+                ativo = self._novo_segmento()
+            ativo.gravar(conteudo)
+            self.conhecidas[chave] = ativo
+            self.pendentes.append((chave, mensagem, destinatario))
+            self.nao_sincronizadas += 1
+            if self.nao_sincronizadas >= self.sincronizar_a_cada:
+                self._sincronizar()
+            self.condicao.notify()
+        return chave
+
+    def retirar(self, timeout=None):
+        # Entrega a próxima mensagem pendente a um consumidor, ou None se não houver
+        with self.condicao:
+            if not self.pendentes:
+                self.condicao.wait(timeout)
+            if not self.pendentes:
+                return None
+            registro = self.pendentes.popleft()
+            self.em_envio[registro[0]] = registro
+            return registro
+
+    def confirmar(self, chave):
+        with self.condicao:
+            if self.em_envio.pop(chave, None) is None:
+                return
+            self.confirmadas.add(chave)
+            self.arquivo_confirmadas.write(f"{chave}\n")
+            segmento = self.conhecidas[chave]
+            segmento.restantes -= 1
+            if segmento.restantes == 0 and segmento is not self.segmentos[-1]:
+                self._compactar()
+            if not self.pendentes and not self.em_envio:
+                self.condicao.notify_all()
+
+    def aguardar_entregas(self, timeout=None):
+        # Bloqueia até todas as mensagens enfileiradas terem sido confirmadas
+        with self.condicao:
+            return self.condicao.wait_for(lambda: not self.pendentes and not self.em_envio, timeout)
+
+    def devolver(self, chave):
+        # Falha no envio: a mensagem volta para o fim da fila
+        with self.condicao:
+            registro = self.em_envio.pop(chave, None)
+            if registro is not None:
+                self.pendentes.append(registro)
+                self.condicao.notify()
+
+    def sincronizar(self):
+        with self.condicao:
+            self._sincronizar()
+
+    def __len__(self):
+        with self.condicao:
+            return len(self.pendentes) + len(self.em_envio)
+
+    def fechar(self):
+        with self.condicao:
+            self.aberta = False
+            self.condicao.notify_all()
+        self.parada.set()
+        self.thread.join()
+        with self.condicao:
+            self._sincronizar()
+            self.arquivo_confirmadas.close()
+            for segmento in self.segmentos:
+                segmento.fechar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def _recuperar(self):
+        caminho_confirmadas = os.path.join(self.diretorio, "confirmadas.log")
+        confirmadas = []
+        if os.path.exists(caminho_confirmadas):
+            with open(caminho_confirmadas) as arquivo:
+                confirmadas = [linha.strip() for linha in arquivo if linha.strip()]
+        self.confirmadas = set(confirmadas)
+        self.arquivo_confirmadas = open(caminho_confirmadas, "a")
+
+        nomes = sorted(nome for nome in os.listdir(self.diretorio) if nome.startswith("segmento-"))
+        for nome in nomes:
+            segmento = Segmento(os.path.join(self.diretorio, nome), self.tamanho_segmento)
+            self.segmentos.append(segmento)
+            for registro in segmento.ler_registros():
+                chave = registro["chave"]
+                if chave in self.conhecidas:
+                    continue
+                self.conhecidas[chave] = segmento
+                if chave not in self.confirmadas:
+                    segmento.restantes += 1
+                    self.pendentes.append((chave, registro["mensagem"], registro["destinatario"]))
+        # Confirmadas sem segmento são as entregues de segmentos já compactados
+        for chave in confirmadas:
+            if chave not in self.conhecidas:
+                self.entregues[chave] = None
+        self.confirmadas &= self.conhecidas.keys()
+        if not self.segmentos:
+            self._novo_segmento()
+        self._compactar()
+
+    def _novo_segmento(self):
+        numero = int(os.path.basename(self.segmentos[-1].caminho)[9:15]) + 1 if self.segmentos else 1
+        caminho = os.path.join(self.diretorio, f"segmento-{numero:06d}.log")
+        if self.segmentos:
+            self.segmentos[-1].sincronizar()
+        self.segmentos.append(Segmento(caminho, self.tamanho_segmento))
+        # Com os consumidores em dia, o segmento anterior foi todo confirmado enquanto
+        # ainda era o ativo; é aqui que ele deixa de ser ativo e pode ser removido
+        self._compactar()
+        return self.segmentos[-1]
+
+    def _compactar(self):
+        # Remove segmentos antigos já entregues. As chaves deles saem de conhecidas e
+        # vão para entregues, que guarda só as max_entregues mais recentes; o log de
+        # confirmações é reescrito com as entregues e as confirmadas que restaram.
+        entregues = [s for s in self.segmentos[:-1] if s.restantes == 0]
+        if not entregues:
+            return
+        for segmento in entregues:
+            self.segmentos.remove(segmento)
+            segmento.remover()
+        conhecidas = {}
+        for chave, segmento in self.conhecidas.items():
+            if segmento in entregues:
+                self.entregues[chave] = None
+            else:
+                conhecidas[chave] = segmento
+        self.conhecidas = conhecidas
+        while len(self.entregues) > self.max_entregues:
+            self.entregues.popitem(last=False)
+        self.confirmadas &= self.conhecidas.keys()
+        caminho = self.arquivo_confirmadas.name
+        self.arquivo_confirmadas.close()
+        with open(caminho + ".tmp", "w") as arquivo:
+            arquivo.writelines(f"{chave}\n" for chave in self.entregues)
+            arquivo.writelines(f"{chave}\n" for chave in self.confirmadas)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(caminho + ".tmp", caminho)
+        self.arquivo_confirmadas = open(caminho, "a")
+
+    def _sincronizar(self):
+        self.segmentos[-1].sincronizar()
+        self.arquivo_confirmadas.flush()
+        os.fsync(self.arquivo_confirmadas.fileno())
+        self.nao_sincronizadas = 0
+
+    def _sincronizar_periodicamente(self):
+        while not self.parada.wait(self.intervalo_sincronizacao):
+            with self.condicao:
+                if self.nao_sincronizadas:
+                    self._sincronizar()
+
+class ConsumidorOutbox:
+    # Threads que retiram mensagens da outbox, enviam e confirmam a entrega
+    def __init__(self, outbox, notificador, trabalhadores=1, espera_erro=0.1):
+        self.outbox = outbox
+        self.notificador = notificador
+        self.espera_erro = espera_erro
+        self.ativo = True
+        self.threads = [
+            threading.Thread(target=self._executar, daemon=True) for _ in range(trabalhadores)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def parar(self):
+        self.ativo = False
+        for thread in self.threads:
+            thread.join()
+
+    def _executar(self):
+        while self.ativo:
+            registro = self.outbox.retirar(timeout=0.05)
+            if registro is None:
+                continue
+            chave, mensagem, destinatario = registro
+            try:
+                # A chave vai junto para que o canal descarte uma reentrega
+                self.notificador.enviar_idempotente(mensagem, destinatario, chave)
+            except Exception:
+                self.outbox.devolver(chave)
+                time.sleep(self.espera_erro)
+                continue
+            self.outbox.confirmar(chave)
@@ -0,0 +1,157 @@
+# Notificações em vários processos
+# --------------------------------
+# Montar e serializar mensagens de uma campanha grande é trabalho de CPU, limitado
+# a um núcleo pelo GIL. Aqui cada processo tem seus próprios notificadores e
+# recebe sempre os mesmos destinatários, escolhidos pelo hash do destinatário.
+
+import itertools
+import pickle
+import queue
+import threading
+import zlib
+from collections import deque
+
+from .notificacoes import GerenciadorNotificacoes
+
+
+def trabalhar(fabrica_gerenciador, entrada, saida):
+    # Roda dentro de cada processo: cria os notificadores uma vez e processa lotes de jobs
+    gerenciador = fabrica_gerenciador()
+    while True:
+        tarefa = entrada.get()
+        if tarefa is None:
+            return
+        chamada, lote = tarefa
+        resultados = []
+        for indice, tipo, mensagem, destinatario in lote:
+            try:
+                resultado = gerenciador.enviar_notificacao(tipo, mensagem, destinatario)
+            except Exception as erro:
+                resultado = erro if pode_serializar(erro) else RuntimeError(repr(erro))
+            resultados.append((indice, resultado))
+        # Cada lote volta marcado com a chamada de enviar_lote a que pertence
+        saida.put((chamada, resultados))
+
+
+def pode_serializar(objeto):
+    try:
+        pickle.dumps(objeto)
+    except Exception:
+        return False
+    return True
+
+
+class PoolProcessosNotificacao:
+    def __init__(self, fabrica_gerenciador=GerenciadorNotificacoes, processos=None, tamanho_lote=256,
+                 intervalo_verificacao=0.05):
+        # fabrica_gerenciador precisa ser serializável (uma classe ou função de módulo),
+        # pois é chamada dentro de cada processo
+        import multiprocessing
+
+        self.processos = processos or multiprocessing.cpu_count()
+        self.tamanho_lote = tamanho_lote
+        # De quanto em quanto tempo quem espera resultados confere se os processos continuam vivos
+        self.intervalo_verificacao = intervalo_verificacao
+        self.chamadas = itertools.count()
+        # Chamada -> itens já recebidos por outra thread e ainda não consumidos; chamadas
+        # encerradas saem daqui, e o que ainda chegar delas é descartado
+        self.caixas = {}
+        self.trava = threading.Lock()
+        self.entradas = [multiprocessing.Queue() for _ in range(self.processos)]
+        self.saida = multiprocessing.Queue()
+        self.trabalhadores = [
+            multiprocessing.Process(
+                target=trabalhar, args=(fabrica_gerenciador, entrada, self.saida), daemon=True
+            )
+            for entrada in self.entradas
+        ]
+        for trabalhador in self.trabalhadores:
+            trabalhador.start()
+
+    def fragmento(self, destinatario):
+        # crc32 é estável entre processos, ao contrário de hash() para strings
+        return zlib.crc32(str(destinatario).encode()) % self.processos
+
+    def enviar_lote(self, jobs):
+        # Gera (índice do job, resultado ou exceção) conforme os processos terminam
+        chamada = next(self.chamadas)
+        cancelada = threading.Event()
+        with self.trava:
+            self.caixas[chamada] = deque()
+        distribuicao = threading.Thread(target=self._distribuir, args=(chamada, jobs, cancelada))
+        distribuicao.start()
+        try:
+            esperados = None
+            recebidos = 0
+            while esperados is None or recebidos < esperados:
+                tipo, conteudo = self._receber(chamada)
+                if tipo == "erro":
+                    raise conteudo
+                if tipo == "fim":
+                    # Fim da distribuição: agora sabemos quantos resultados esperar
+                    esperados = conteudo
+                    continue
+                recebidos += len(conteudo)
+                yield from conteudo
+        finally:
+            # Também quando o consumidor para no meio: a distribuição é interrompida e
+            # os resultados que ainda chegarem desta chamada são descartados
+            cancelada.set()
+            distribuicao.join()
+            with self.trava:
+                del self.caixas[chamada]
+
+    def fechar(self):
+        for entrada in self.entradas:
+            entrada.put(None)
+        for trabalhador in self.trabalhadores:
+            trabalhador.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def _receber(self, chamada):
+        while True:
+            with self.trava:
+                caixa = self.caixas[chamada]
+                if caixa:
+                    return caixa.popleft()
+            try:
+                recebida, resultados = self.saida.get(timeout=self.intervalo_verificacao)
+            except queue.Empty:
+                if not all(trabalhador.is_alive() for trabalhador in self.trabalhadores):
+                    raise RuntimeError("Um processo de notificação terminou inesperadamente")
+                continue
+            if recebida == chamada:
+                return "resultados", resultados
+            with self.trava:
+                # Resultado de outra chamada em andamento, ou de uma já encerrada
+                caixa = self.caixas.get(recebida)
+                if caixa is not None:
+                    caixa.append(("resultados", resultados))
+
+    def _distribuir(self, chamada, jobs, cancelada):
+        # Roda numa thread; o fim (ou a exceção de jobs) vai direto para a caixa da chamada
+        try:
+            lotes = [[] for _ in range(self.processos)]
+            quantidade = 0
+            for indice, (tipo, mensagem, destinatario) in enumerate(jobs):
+                if cancelada.is_set():
+                    return
+                fragmento = self.fragmento(destinatario)
+                lotes[fragmento].append((indice, tipo, mensagem, destinatario))
+                quantidade += 1
+                if len(lotes[fragmento]) == self.tamanho_lote:
+                    self.entradas[fragmento].put((chamada, lotes[fragmento]))
+                    lotes[fragmento] = []
+            for fragmento, lote in enumerate(lotes):
+                if lote:
+                    self.entradas[fragmento].put((chamada, lote))
+            aviso = ("fim", quantidade)
+        except Exception as erro:
+            aviso = ("erro", erro)
+        with self.trava:
+            self.caixas[chamada].append(aviso)
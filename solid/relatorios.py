@@ -0,0 +1,214 @@
+# Relatório de usuários com exportadores
+# --------------------------------------
+# Versão final do exercício do notebook "Refatorando Código Legado com SOLID e
+# Design Patterns": RelatorioUsuarios recebe um Exportador, criado pela
+# ExportadorFactory. MotorExportacao gera o arquivo em blocos de usuários: cada
+# bloco é renderizado pelo exportador num pool de processos e escrito assim que
+# fica pronto, e um manifesto com o hash de cada bloco permite reaproveitar, na
+# rodada seguinte, as seções que não mudaram.
+
+import hashlib
+import html
+import itertools
+import json
+import os
+import shutil
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+
+
+class Exportador(ABC):
+    extensao = ".txt"
+
+    @abstractmethod
+    def exportar(self):
+        pass
+
+    # Exportação em blocos: o arquivo é cabecalho() + um renderizar_bloco() por
+    # bloco de usuários + rodape(). renderizar_bloco roda em outro processo,
+    # então o exportador precisa ser serializável.
+    def cabecalho(self):
+        return b""
+
+    @abstractmethod
+    def renderizar_bloco(self, indice, usuarios):
+        pass
+
+    def rodape(self):
+        return b""
+
+class ExportadorPDF(Exportador):
+    # Sem uma biblioteca de PDF no projeto, cada bloco vira uma página de texto de
+    # largura fixa, separada por quebra de página (form feed)
+    extensao = ".pdf.txt"
+
+    def exportar(self):
+        print("Gerando relatório em PDF")
+
+    def renderizar_bloco(self, indice, usuarios):
+        linhas = [f"Página {indice + 1}".center(80), ""]
+        linhas += [f"{nome[:38]:<40}{email[:40]}" for nome, email in usuarios]
+        return ("\n".join(linhas) + "\n\f").encode()
+
+class ExportadorHTML(Exportador):
+    extensao = ".html"
+
+    def exportar(self):
+        print("Gerando relatório em HTML")
+
+    def cabecalho(self):
+        return (
+            b"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Usu\xc3\xa1rios</title></head>\n"
+            b"<body><table>\n<tr><th>Nome</th><th>Email</th></tr>\n"
+        )
+
+    def renderizar_bloco(self, indice, usuarios):
+        escapar = html.escape
+        return "".join([
+            f"<tr><td>{escapar(nome)}</td><td>{escapar(email)}</td></tr>\n" for nome, email in usuarios
+        ]).encode()
+
+    def rodape(self):
+        return b"</table></body></html>\n"
+
+class ExportadorFactory:
+    @staticmethod
+    def criar_exportador(formato):
+        match formato:
+            case "PDF":
+                return ExportadorPDF()
+            case "HTML":
+                return ExportadorHTML()
+            case _:
+                raise ValueError("Formato desconhecido")
+
+class RelatorioUsuarios:
+    def __init__(self, exportador):
+        self.exportador = exportador
+
+    def gerar(self):
+        return self.exportador.exportar()
+
+    def gerar_arquivo(self, usuarios, destino, **opcoes):
+        return MotorExportacao(self.exportador, **opcoes).exportar(usuarios, destino)
+
+
+def renderizar(exportador, indice, usuarios):
+    # Roda dentro do pool; fica no nível do módulo para poder ser serializada
+    return exportador.renderizar_bloco(indice, usuarios)
+
+
+class MotorExportacao:
+    def __init__(self, exportador, tamanho_bloco=10_000, processos=None):
+        self.exportador = exportador
+        self.tamanho_bloco = tamanho_bloco
+        # processos=1 renderiza no próprio processo, sem pool
+        self.processos = processos or os.cpu_count() or 1
+
+    def exportar(self, usuarios, destino):
+        # usuarios: iterável de Usuario (ou qualquer objeto com nome e email), lido
+        # bloco a bloco; no máximo 2 blocos por processo ficam em memória
+        destino = os.fspath(destino)
+        pasta_secoes = destino + ".secoes"
+        os.makedirs(pasta_secoes, exist_ok=True)
+        anteriores = self._ler_manifesto(destino)
+        identidade = f"{type(self.exportador).__module__}.{type(self.exportador).__qualname__}"
+        secoes = []
+        contagens = {"usuarios": 0, "reaproveitadas": 0, "renderizadas": 0}
+        inicio = time.perf_counter()
+
+        pool = None
+        if self.processos > 1:
+            import multiprocessing
+
+            pool = multiprocessing.Pool(self.processos)
+        temporario = destino + ".tmp"
+        try:
+            with open(temporario, "wb") as saida:
+                saida.write(self.exportador.cabecalho())
+                pendentes = deque()
+                usuarios = iter(usuarios)
+                for indice in itertools.count():
+                    bloco = [
+                        (usuario.nome, usuario.email) for usuario in itertools.islice(usuarios, self.tamanho_bloco)
+                    ]
+                    if not bloco:
+                        break
+                    contagens["usuarios"] += len(bloco)
+                    resumo = self._resumo(identidade, indice, bloco)
+                    secoes.append(resumo)
+                    caminho = os.path.join(pasta_secoes, resumo)
+                    if resumo in anteriores and os.path.exists(caminho):
+                        contagens["reaproveitadas"] += 1
+                        pendentes.append((caminho, None))
+                    elif pool is None:
+                        pendentes.append((caminho, renderizar(self.exportador, indice, bloco)))
+                    else:
+                        pendentes.append((caminho, pool.apply_async(renderizar, (self.exportador, indice, bloco))))
+                    # Escreve em ordem tudo o que já pode ser escrito, e espera quando há blocos demais em voo
+                    while pendentes and (len(pendentes) > 2 * self.processos or self._pronto(pendentes[0][1])):
+                        contagens["renderizadas"] += self._escrever(saida, *pendentes.popleft())
+                while pendentes:
+                    contagens["renderizadas"] += self._escrever(saida, *pendentes.popleft())
+                saida.write(self.exportador.rodape())
+        except BaseException:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            raise
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+        os.replace(temporario, destino)
+        self._gravar_manifesto(destino, identidade, secoes)
+
+        duracao = time.perf_counter() - inicio
+        return {
+            **contagens,
+            "secoes": len(secoes),
+            "bytes": os.path.getsize(destino),
+            "duracao": duracao,
+            "usuarios_por_segundo": contagens["usuarios"] / duracao if duracao else 0.0,
+        }
+
+    @staticmethod
+    def _resumo(identidade, indice, bloco):
+        # O índice entra no hash porque o exportador pode numerar as seções (páginas do PDF)
+        resumo = hashlib.blake2b(f"{identidade}\x1e{indice}\x1e".encode(), digest_size=16)
+        resumo.update("\x1e".join([f"{nome}\x1f{email}" for nome, email in bloco]).encode())
+        return resumo.hexdigest()
+
+    @staticmethod
+    def _pronto(resultado):
+        return resultado is None or isinstance(resultado, bytes) or resultado.ready()
+
+    @staticmethod
+    def _escrever(saida, caminho, resultado):
+        # Retorna 1 se a seção foi renderizada agora, 0 se veio da rodada anterior
+        if resultado is None:
+            with open(caminho, "rb") as secao:
+                shutil.copyfileobj(secao, saida)
+            return 0
+        conteudo = resultado if isinstance(resultado, bytes) else resultado.get()
+        saida.write(conteudo)
+        with open(caminho, "wb") as secao:
+            secao.write(conteudo)
+        return 1
+
+    @staticmethod
+    def _ler_manifesto(destino):
+        try:
+            with open(destino + ".manifesto.json") as arquivo:
+                return set(json.load(arquivo)["secoes"])
+        except (OSError, ValueError, KeyError):
+            return set()
+
+    @staticmethod
+    def _gravar_manifesto(destino, identidade, secoes):
+        with open(destino + ".manifesto.json", "w") as arquivo:
+            json.dump({"exportador": identidade, "secoes": secoes}, arquivo)
+        # Seções que deixaram de fazer parte do relatório (ou sobraram de uma rodada interrompida) são apagadas
+        pasta_secoes = destino + ".secoes"
+        for resumo in set(os.listdir(pasta_secoes)) - set(secoes):
+            os.remove(os.path.join(pasta_secoes, resumo))
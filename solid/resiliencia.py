@@ -0,0 +1,212 @@
+# Resiliência para estratégias de notificação
+# -------------------------------------------
+# EstrategiaResiliente envolve qualquer EstrategiaNotificacao com retentativas
+# (espera exponencial com jitter, limitadas por um orçamento), um disjuntor que
+# falha rápido enquanto o provedor está fora e, opcionalmente, uma requisição
+# de reserva (hedge) para uma estratégia alternativa quando a principal demora
+# mais que o p95 das suas latências recentes. As corridas do hedge usam um pool
+# de threads da instância, com um teto de envios principais em andamento.
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .notificacoes import EstrategiaNotificacao
+
+
+class CircuitoAberto(RuntimeError):
+    pass
+
+class OrcamentoRetentativas:
+    # Cada envio deposita uma fração de retentativa; cada retentativa gasta uma inteira.
+    # Assim as retentativas ficam em torno de `proporcao` dos envios e não multiplicam
+    # a carga sobre um provedor que já está com problemas.
+    def __init__(self, proporcao=0.2, minimo=10):
+        self.proporcao = proporcao
+        self.maximo = max(minimo, 1)
+        self.saldo = float(minimo)
+        self.trava = threading.Lock()
+
+    def depositar(self):
+        with self.trava:
+            self.saldo = min(self.maximo, self.saldo + self.proporcao)
+
+    def retirar(self):
+        with self.trava:
+            if self.saldo < 1:
+                return False
+            self.saldo -= 1
+            return True
+
+class DisjuntorCircuito:
+    FECHADO = "fechado"
+    ABERTO = "aberto"
+    MEIO_ABERTO = "meio_aberto"
+
+    def __init__(self, limite_falhas=5, tempo_abertura=5.0):
+        self.limite_falhas = limite_falhas
+        self.tempo_abertura = tempo_abertura
+        self.estado = self.FECHADO
+        self.falhas = 0
+        self.aberto_em = 0.0
+        self.trava = threading.Lock()
+
+    def permitir(self):
+        with self.trava:
+            if self.estado == self.FECHADO:
+                return True
+            if self.estado == self.ABERTO and time.monotonic() - self.aberto_em >= self.tempo_abertura:
+                # Deixa passar um único envio de teste
+                self.estado = self.MEIO_ABERTO
+                return True
+            return False
+
+    def registrar_sucesso(self):
+        with self.trava:
+            self.estado = self.FECHADO
+            self.falhas = 0
+
+    def registrar_falha(self):
+        with self.trava:
+            self.falhas += 1
+            if self.estado == self.MEIO_ABERTO or self.falhas >= self.limite_falhas:
+                self.estado = self.ABERTO
+                self.aberto_em = time.monotonic()
+
+class EstrategiaResiliente(EstrategiaNotificacao):
+    def __init__(self, estrategia, tentativas=3, espera_base=0.01, espera_maxima=0.5,
+                 orcamento=None, disjuntor=None, alternativa=None,
+                 percentil_hedge=0.95, janela_latencias=200, amostras_minimas=20, max_em_voo=8):
+        self.estrategia = estrategia
+        self.tentativas = tentativas
+        self.espera_base = espera_base
+        self.espera_maxima = espera_maxima
+        self.orcamento = orcamento or OrcamentoRetentativas()
+        self.disjuntor = disjuntor or DisjuntorCircuito()
+        # Sem alternativa não há hedge; com o circuito aberto, a alternativa também é usada
+        self.alternativa = alternativa
+        self.percentil_hedge = percentil_hedge
+        self.amostras_minimas = amostras_minimas
+        self.latencias = deque(maxlen=janela_latencias)
+        self.amostras = 0
+        self.limiar_hedge = None
+        # Principais que demoram continuam rodando depois que a alternativa vence; no máximo
+        # `max_em_voo` ficam no pool, e além disso o envio segue na thread de quem chamou, sem hedge
+        self.max_em_voo = max_em_voo
+        self.vagas = threading.BoundedSemaphore(max_em_voo)
+        self.executor = None
+        self.contadores = dict.fromkeys(
+            ("envios", "retentativas", "falhas", "rejeitados_circuito", "hedges", "vitorias_alternativa",
+             "sem_vaga_hedge"), 0
+        )
+        self.trava = threading.Lock()
+
+    def notificar(self, mensagem, destinatario):
+        self._contar("envios")
+        if not self.disjuntor.permitir():
+            self._contar("rejeitados_circuito")
+            if self.alternativa is not None:
+                return self.alternativa.notificar(mensagem, destinatario)
+            raise CircuitoAberto(f"Circuito aberto para {type(self.estrategia).__name__}")
+        self.orcamento.depositar()
+        tentativa = 0
+        while True:
+            try:
+                return self._tentar(mensagem, destinatario)
+            except Exception:
+                tentativa += 1
+                if (tentativa >= self.tentativas or not self.orcamento.retirar()
+                        or not self.disjuntor.permitir()):
+                    self._contar("falhas")
+                    raise
+                self._contar("retentativas")
+                # Jitter completo: espera aleatória até o teto exponencial da tentativa
+                time.sleep(random.uniform(0, min(self.espera_maxima, self.espera_base * 2 ** tentativa)))
+
+    def metricas(self):
+        with self.trava:
+            return {**self.contadores, "estado_circuito": self.disjuntor.estado, "limiar_hedge": self.limiar_hedge}
+
+    def fechar(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def _tentar(self, mensagem, destinatario):
+        limiar = self.limiar_hedge
+        if self.alternativa is None or limiar is None:
+            return self._chamar(mensagem, destinatario)
+        return self._correr(mensagem, destinatario, limiar)
+
+    def _chamar(self, mensagem, destinatario):
+        # Só a estratégia principal alimenta o disjuntor e as latências do hedge
+        inicio = time.perf_counter()
+        try:
+            resultado = self.estrategia.notificar(mensagem, destinatario)
+        except Exception:
+            self.disjuntor.registrar_falha()
+            raise
+        self.disjuntor.registrar_sucesso()
+        self._registrar_latencia(time.perf_counter() - inicio)
+        return resultado
+
+    def _correr(self, mensagem, destinatario, limiar):
+        # A principal roda no pool; se ainda não terminou depois do limiar, a
+        # alternativa entra na corrida e vale o primeiro sucesso
+        if not self.vagas.acquire(blocking=False):
+            self._contar("sem_vaga_hedge")
+            return self._chamar(mensagem, destinatario)
+        try:
+            principal = self._executor().submit(self._chamar_liberando, mensagem, destinatario)
+        except BaseException:
+            self.vagas.release()
+            raise
+        pendentes = {principal}
+        if not wait(pendentes, limiar).done:
+            self._contar("hedges")
+            pendentes.add(self._executor().submit(self.alternativa.notificar, mensagem, destinatario))
+        erro = None
+        while pendentes:
+            concluidas, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in concluidas:
+                erro = futuro.exception()
+                if erro is None:
+                    if futuro is not principal:
+                        self._contar("vitorias_alternativa")
+                    return futuro.result()
+        # Nenhum sucesso: sobe a última falha, e o laço de retentativas decide o resto
+        raise erro
+
+    def _chamar_liberando(self, mensagem, destinatario):
+        try:
+            return self._chamar(mensagem, destinatario)
+        finally:
+            self.vagas.release()
+
+    def _executor(self):
+        if self.executor is None:
+            with self.trava:
+                if self.executor is None:
+                    # Cada principal em voo pode ter uma alternativa correndo ao lado
+                    self.executor = ThreadPoolExecutor(2 * self.max_em_voo, thread_name_prefix="hedge")
+        return self.executor
+
+    def _registrar_latencia(self, latencia):
+        self.latencias.append(latencia)
+        self.amostras += 1
+        # Recalcula o percentil a cada 10 amostras, não a cada envio
+        if self.amostras >= self.amostras_minimas and self.amostras % 10 == 0:
+            ordenadas = sorted(self.latencias)
+            self.limiar_hedge = ordenadas[int(self.percentil_hedge * (len(ordenadas) - 1))]
+
+    def _contar(self, contador):
+        with self.trava:
+            self.contadores[contador] += 1
@@ -0,0 +1,179 @@
+# Exemplos ruins
+# --------------
+# As versões "Exemplo Ruim" de cada princípio, que a apresentação mostra antes das
+# boas. Ficam num módulo próprio para que os benchmarks comparem as duas versões.
+
+from abc import ABC, abstractmethod
+
+
+# SRP: uma classe que valida, salva e envia email
+class Usuario:
+    def __init__(self, nome, email):
+        self.nome = nome
+        self.email = email
+        self.dados_salvos = False
+
+    def validar_email(self):
+        # Valida formato do email
+        return "@" in self.email and "." in self.email
+
+    def salvar_no_banco(self):
+        # Código para salvar no banco de dados
+        print(f"Salvando {self.nome} no banco de dados...")
+        self.dados_salvos = True
+        return True
+
+    def enviar_email_boas_vindas(self):
+        # Código para enviar email
+        print(f"Enviando email de boas-vindas para {self.email}...")
+        return True
+
+
+# OCP: um novo tipo de cliente exige modificar a calculadora
+class CalculadoraDescontos:
+    def calcular_desconto(self, produto, tipo_cliente):
+        if tipo_cliente == "regular":
+            return produto.preco * 0.05
+        elif tipo_cliente == "premium":
+            return produto.preco * 0.10
+        elif tipo_cliente == "vip":
+            return produto.preco * 0.15
+        else:
+            return 0
+
+
+# LSP: Quadrado muda o comportamento dos setters de Retangulo
+class Retangulo:
+    def __init__(self, largura, altura):
+        self.largura = largura
+        self.altura = altura
+
+    def set_largura(self, largura):
+        self.largura = largura
+
+    def set_altura(self, altura):
+        self.altura = altura
+
+    def area(self):
+        return self.largura * self.altura
+
+class Quadrado(Retangulo):
+    def __init__(self, lado):
+        super().__init__(lado, lado)
+
+    def set_largura(self, largura):
+        self.largura = largura
+        self.altura = largura
+
+    def set_altura(self, altura):
+        self.largura = altura
+        self.altura = altura
+
+def imprimir_area(retangulo):
+    retangulo.set_largura(5)
+    retangulo.set_altura(4)
+    # Uma função que espera um retângulo espera que a área seja 5 * 4 = 20
+    print(f"Área esperada: 20, Área obtida: {retangulo.area()}")
+
+
+# ISP: uma interface única obriga o Robo a implementar comer e dormir
+class Trabalhador(ABC):
+    @abstractmethod
+    def trabalhar(self):
+        pass
+
+    @abstractmethod
+    def comer(self):
+        pass
+
+    @abstractmethod
+    def dormir(self):
+        pass
+
+class Humano(Trabalhador):
+    def trabalhar(self):
+        print("Humano trabalhando...")
+
+    def comer(self):
+        print("Humano comendo...")
+
+    def dormir(self):
+        print("Humano dormindo...")
+
+class Robo(Trabalhador):
+    def trabalhar(self):
+        print("Robô trabalhando...")
+
+    def comer(self):
+        # Robôs não comem, mas são forçados a implementar este método
+        raise NotImplementedError("Robôs não comem!")
+
+    def dormir(self):
+        # Robôs não dormem, mas são forçados a implementar este método
+        raise NotImplementedError("Robôs não dormem!")
+
+
+# DIP: o serviço cria o banco concreto que usa
+class MySQLDatabase:
+    def conectar(self):
+        print("Conectando ao MySQL...")
+
+    def executar_query(self, query):
+        print(f"Executando query no MySQL: {query}")
+
+class ServicoUsuario:
+    def __init__(self):
+        # Dependência direta de uma implementação concreta
+        self.db = MySQLDatabase()
+
+    def salvar_usuario(self, usuario):
+        self.db.conectar()
+        query = f"INSERT INTO usuarios VALUES ('{usuario.nome}', '{usuario.email}')"
+        self.db.executar_query(query)
+
+
+# Notificações, estágio 1: tudo num if/elif
+class GerenciadorNotificacoes:
+    def enviar_notificacao(self, tipo, mensagem, destinatario):
+        if tipo == "email":
+            print(f"Enviando email para {destinatario}: {mensagem}")
+            # Lógica de envio de email
+        elif tipo == "sms":
+            print(f"Enviando SMS para {destinatario}: {mensagem}")
+            # Lógica de envio de SMS
+        elif tipo == "push":
+            print(f"Enviando notificação push para {destinatario}: {mensagem}")
+            # Lógica de envio de push
+        else:
+            raise ValueError("Tipo de notificação não suportado")
+
+
+# Notificações, estágio 2: uma classe por canal, mas o if/elif continua
+class NotificadorEmail:
+    def enviar(self, mensagem, destinatario):
+        print(f"Enviando email para {destinatario}: {mensagem}")
+        # Lógica específica de envio de email
+
+class NotificadorSMS:
+    def enviar(self, mensagem, destinatario):
+        print(f"Enviando SMS para {destinatario}: {mensagem}")
+        # Lógica específica de envio de SMS
+
+class NotificadorPush:
+    def enviar(self, mensagem, destinatario):
+        print(f"Enviando notificação push para {destinatario}: {mensagem}")
+        # Lógica específica de envio de push
+
+class GerenciadorNotificacoesSRP:
+    def enviar_notificacao(self, tipo, mensagem, destinatario):
+        if tipo == "email":
+            notificador = NotificadorEmail()
+            notificador.enviar(mensagem, destinatario)
+        elif tipo == "sms":
+            notificador = NotificadorSMS()
+            notificador.enviar(mensagem, destinatario)
+        elif tipo == "push":
+            notificador = NotificadorPush()
+            notificador.enviar(mensagem, destinatario)
+        else:
+            raise ValueError("Tipo de notificação não suportado")